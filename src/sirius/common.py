@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import datetime
 import io
@@ -11,7 +12,7 @@ import threading
 from _decimal import Decimal
 from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Callable, Any, Dict, List
+from typing import Callable, Any, Dict, List, Coroutine
 
 import pytz
 import qrcode
@@ -80,6 +81,10 @@ class Currency(Enum):
     ZAR: str = "ZAR"
 
 
+_background_event_loop: asyncio.AbstractEventLoop | None = None
+_background_event_loop_lock: threading.Lock = threading.Lock()
+
+
 class DataClass(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -235,3 +240,35 @@ def get_function_documentation(function: Callable) -> Dict[str, Any]:
         function_documentation["arguments"][argument_name] = argument_documentation
 
     return function_documentation
+
+
+def get_background_event_loop() -> asyncio.AbstractEventLoop:
+    global _background_event_loop
+    with _background_event_loop_lock:
+        if _background_event_loop is None or _background_event_loop.is_closed():
+            _background_event_loop = asyncio.new_event_loop()
+            threading.Thread(target=_background_event_loop.run_forever, daemon=True).start()
+
+    return _background_event_loop
+
+
+def is_event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def run_coroutine_synchronously(coroutine: Coroutine) -> Any:
+    background_event_loop: asyncio.AbstractEventLoop = get_background_event_loop()
+    try:
+        is_in_background_event_loop: bool = asyncio.get_running_loop() is background_event_loop
+    except RuntimeError:
+        is_in_background_event_loop = False
+
+    if is_in_background_event_loop:
+        coroutine.close()
+        raise SDKClientException("Cannot synchronously wait for a coroutine from within the background event loop")
+
+    return asyncio.run_coroutine_threadsafe(coroutine, background_event_loop).result()
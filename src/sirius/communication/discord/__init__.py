@@ -1,15 +1,20 @@
 import asyncio
+import atexit
 import datetime
+import json
+import threading
 import time
+from concurrent.futures import Future
 from enum import Enum
 from http import HTTPStatus
 from logging import Logger
-from typing import List, Dict, Any, Union, Optional
+from typing import List, Dict, Any, Union, Optional, Tuple, Set, ClassVar, Coroutine
 
 import discord
 from pydantic import PrivateAttr
 
 from sirius import application_performance_monitoring, common
+from sirius.application_performance_monitoring import Operation
 from sirius.common import DataClass
 from sirius.communication.discord import constants
 from sirius.communication.discord.exceptions import ServerNotFoundException, DuplicateServersFoundException, RoleNotFoundException
@@ -19,6 +24,7 @@ from sirius.http_requests import AsyncHTTPSession, HTTPResponse, ClientSideExcep
 
 logger: Logger = application_performance_monitoring.get_logger()
 default_bot: Union["Bot", None] = None
+default_bot_task: Union["asyncio.Task[Bot]", None] = None
 
 
 class ServerName(Enum):
@@ -77,6 +83,19 @@ class DiscordHTTPSession(AsyncHTTPSession):
 
             raise e
 
+    @application_performance_monitoring.transaction(Operation.HTTP_REQUEST, "POST")
+    async def post_file(self, url: str, data: Dict[str, Any], file_name: str, file_content: bytes) -> HTTPResponse:
+        await self._acquire()
+        http_response: HTTPResponse = HTTPResponse(await self.client.post(url, data={"payload_json": json.dumps(data)},
+                                                                          files={"files[0]": (file_name, file_content)}))
+        if http_response.response_code == HTTPStatus.TOO_MANY_REQUESTS:
+            await asyncio.sleep(http_response.data["retry_after"] + 0.1)
+            return await self.post_file(url, data, file_name, file_content)
+        elif not http_response.is_successful:
+            DiscordHTTPSession.raise_http_exception(http_response)
+
+        return http_response
+
     async def delete(self, url: str, headers: Dict[str, Any] | None = None) -> HTTPResponse:
         try:
             return await super().delete(url, headers)
@@ -89,26 +108,293 @@ class DiscordHTTPSession(AsyncHTTPSession):
 
             raise e
 
+    @staticmethod
+    def get_authenticated_session() -> "DiscordHTTPSession":
+        return DiscordHTTPSession(constants.URL,
+                                  {"Authorization": f"Bot {common.get_environmental_secret(EnvironmentSecret.DISCORD_BOT_TOKEN)}"})
+
+
+class MessageQueueMetrics(DataClass):
+    queue_depth: int
+    number_of_messages_sent: int
+    number_of_messages_failed: int
+    average_delivery_latency_seconds: float
+    maximum_delivery_latency_seconds: float
+
+
+class MessageQueue:
+    text_channel_id: int
+    http_session: DiscordHTTPSession
+    number_of_messages_sent: int
+    number_of_messages_failed: int
+    total_delivery_latency_seconds: float
+    maximum_delivery_latency_seconds: float
+    _queue: "asyncio.Queue[Tuple[Dict[str, Any], float, bool]]"
+    _worker_task: "asyncio.Task[None] | None"
+    _instance_dict: Dict[int, "MessageQueue"] = {}
+    _instance_dict_lock: threading.Lock = threading.Lock()
+    _semaphore: asyncio.Semaphore | None = None
+
+    def __init__(self, text_channel_id: int, http_session: DiscordHTTPSession, maximum_queue_size: int = constants.MESSAGE_QUEUE_MAXIMUM_SIZE) -> None:
+        self.text_channel_id = text_channel_id
+        self.http_session = http_session
+        self.number_of_messages_sent = 0
+        self.number_of_messages_failed = 0
+        self.total_delivery_latency_seconds = 0
+        self.maximum_delivery_latency_seconds = 0
+        self._queue = asyncio.Queue(maximum_queue_size)
+        self._worker_task = None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def get_metrics(self) -> MessageQueueMetrics:
+        return MessageQueueMetrics(queue_depth=self.queue_depth,
+                                   number_of_messages_sent=self.number_of_messages_sent,
+                                   number_of_messages_failed=self.number_of_messages_failed,
+                                   average_delivery_latency_seconds=self.total_delivery_latency_seconds / max(self.number_of_messages_sent, 1),
+                                   maximum_delivery_latency_seconds=self.maximum_delivery_latency_seconds)
+
+    async def put(self, data: Dict[str, Any], is_coalesced: bool = False) -> None:
+        await MessageQueue._run_in_background_event_loop(self._put(data, is_coalesced))
+
+    async def drain(self) -> None:
+        await MessageQueue._run_in_background_event_loop(self._queue.join())
+
+    async def _put(self, data: Dict[str, Any], is_coalesced: bool) -> None:
+        await self._queue.put((data, time.monotonic(), is_coalesced))
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            while not self._queue.empty():
+                item_list: List[Tuple[Dict[str, Any], float, bool]] = [self._queue.get_nowait()]
+                try:
+                    if item_list[0][2]:
+                        await asyncio.sleep(constants.MESSAGE_COALESCING_WINDOW_SECONDS)
+                        while not self._queue.empty() and item_list[-1][2]:
+                            item_list.append(self._queue.get_nowait())
+
+                    coalesced_item_list: List[Tuple[Dict[str, Any], float, bool]] = [item for item in item_list if item[2]]
+                    if len(coalesced_item_list) > 0:
+                        await self._send(MessageQueue._get_coalesced_message_list([item[0]["content"] for item in coalesced_item_list]),
+                                         [item[1] for item in coalesced_item_list])
+
+                    for data, enqueue_time, is_coalesced in item_list:
+                        if not is_coalesced:
+                            await self._send([(data, None)], [enqueue_time])
+                except Exception as e:
+                    self.number_of_messages_failed = self.number_of_messages_failed + len(item_list)
+                    logger.exception(f"Discord messages could not be processed\n"
+                                     f"Channel ID: {self.text_channel_id}\n"
+                                     f"Number of messages: {len(item_list)}\n"
+                                     f"Exception: {repr(e)}")
+                finally:
+                    for _ in item_list:
+                        self._queue.task_done()
+        finally:
+            self._worker_task = None
+
+    async def _send(self, message_list: List[Tuple[Dict[str, Any], str | None]], enqueue_time_list: List[float]) -> None:
+        url: str = constants.ENDPOINT__CHANNEL__SEND_MESSAGE.replace("$channelID", str(self.text_channel_id))
+        try:
+            for data, attachment in message_list:
+                async with MessageQueue._get_semaphore():
+                    http_response: HTTPResponse = await self.http_session.post(url, data=data) if attachment is None else \
+                        await self.http_session.post_file(url, data, constants.MESSAGE_COALESCING_ATTACHMENT_FILE_NAME, attachment.encode())
+
+                if http_response.headers.get("X-RateLimit-Remaining") == "0":
+                    await asyncio.sleep(float(http_response.headers.get("X-RateLimit-Reset-After", "0")))
+        except Exception as e:
+            self.number_of_messages_failed = self.number_of_messages_failed + len(enqueue_time_list)
+            logger.exception(f"Discord message could not be sent\n"
+                             f"Channel ID: {self.text_channel_id}\n"
+                             f"Exception: {repr(e)}")
+            return
+
+        for enqueue_time in enqueue_time_list:
+            delivery_latency_seconds: float = time.monotonic() - enqueue_time
+            self.number_of_messages_sent = self.number_of_messages_sent + 1
+            self.total_delivery_latency_seconds = self.total_delivery_latency_seconds + delivery_latency_seconds
+            self.maximum_delivery_latency_seconds = max(self.maximum_delivery_latency_seconds, delivery_latency_seconds)
+
+    @staticmethod
+    def _get_coalesced_message_list(content_list: List[str]) -> List[Tuple[Dict[str, Any], str | None]]:
+        chunk_list: List[str] = []
+        for content in content_list:
+            if len(content) > constants.MESSAGE_MAXIMUM_LENGTH:
+                chunk_list = []
+                break
+            elif len(chunk_list) > 0 and len(chunk_list[-1]) + len(content) + 1 <= constants.MESSAGE_MAXIMUM_LENGTH:
+                chunk_list[-1] = f"{chunk_list[-1]}\n{content}"
+            else:
+                chunk_list.append(content)
+
+        if 0 < len(chunk_list) <= constants.MESSAGE_COALESCING_MAXIMUM_NUMBER_OF_MESSAGES:
+            return [({"content": chunk}, None) for chunk in chunk_list]
 
-DiscordHTTPSession(constants.URL,
-                   {"Authorization": f"Bot {common.get_environmental_secret(EnvironmentSecret.DISCORD_BOT_TOKEN)}"})
+        return [({"content": f"**{len(content_list)} messages**: *see attachment*"}, "\n".join(content_list))]
+
+    @classmethod
+    def get(cls, text_channel_id: int, http_session: DiscordHTTPSession) -> "MessageQueue":
+        with cls._instance_dict_lock:
+            if text_channel_id not in cls._instance_dict:
+                cls._instance_dict[text_channel_id] = MessageQueue(text_channel_id, http_session)
+
+            return cls._instance_dict[text_channel_id]
+
+    @classmethod
+    def get_all_metrics(cls) -> Dict[int, MessageQueueMetrics]:
+        return {text_channel_id: message_queue.get_metrics() for text_channel_id, message_queue in cls._instance_dict.items()}
+
+    @classmethod
+    def drain_all(cls) -> None:
+        common.run_coroutine_synchronously(cls.drain_all_async())
+
+    @classmethod
+    async def drain_all_async(cls) -> None:
+        await asyncio.gather(*[message_queue.drain() for message_queue in list(cls._instance_dict.values())])
+
+    @staticmethod
+    async def _run_in_background_event_loop(coroutine: Coroutine) -> Any:
+        background_event_loop: asyncio.AbstractEventLoop = common.get_background_event_loop()
+        if asyncio.get_running_loop() is background_event_loop:
+            return await coroutine
+
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, background_event_loop))
+
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        if cls._semaphore is None:
+            cls._semaphore = asyncio.Semaphore(constants.MESSAGE_QUEUE_MAXIMUM_NUMBER_OF_CONCURRENT_REQUESTS)
+
+        return cls._semaphore
+
+
+atexit.register(MessageQueue.drain_all)
 
 
 class DiscordDefaults(DataClass):
 
     @staticmethod
-    async def send_message(text_channel_name: str, message: str) -> None:
-        global default_bot
-        default_bot = await Bot.get() if default_bot is None else default_bot
-        server: Server = await default_bot.get_server()
+    async def get_bot() -> "Bot":
+        global default_bot, default_bot_task
+        if default_bot is not None:
+            return default_bot
+
+        if default_bot_task is None or default_bot_task.get_loop() is not asyncio.get_running_loop():
+            default_bot_task = asyncio.ensure_future(Bot.get(True))
+
+        try:
+            default_bot = await default_bot_task
+        finally:
+            default_bot_task = None
+
+        return default_bot
+
+    @staticmethod
+    async def send_message(text_channel_name: str, message: str, is_coalesced: bool = False) -> None:
+        bot: Bot = await DiscordDefaults.get_bot()
+        server: Server = await bot.get_server()
         text_channel: TextChannel = await server.get_text_channel(text_channel_name)
-        await text_channel.send_message(message)
+        await text_channel.send_message(message, is_coalesced)
 
     @classmethod
     async def notify(cls, message: str) -> None:
         await DiscordDefaults.send_message(AortaTextChannels.NOTIFICATION.value, message)
 
 
+class DiscordOutbox:
+    digest_interval_seconds: float | None = None
+    _message_list: List[Tuple[str, str]] = []
+    _lock: threading.Lock = threading.Lock()
+    _worker_future: Future | None = None
+    _flush_event: asyncio.Event | None = None
+
+    @classmethod
+    def put(cls, text_channel_name: str, message: str) -> None:
+        with cls._lock:
+            cls._message_list.append((text_channel_name, message))
+            if cls._worker_future is None:
+                cls._flush_event = asyncio.Event()
+                cls._worker_future = asyncio.run_coroutine_threadsafe(cls._run(cls._flush_event), common.get_background_event_loop())
+
+    @classmethod
+    def set_digest_mode(cls, digest_interval_seconds: float | None) -> None:
+        cls.digest_interval_seconds = digest_interval_seconds
+
+    @classmethod
+    def flush(cls) -> None:
+        worker_future: Future | None = cls._request_flush()
+        if worker_future is not None:
+            worker_future.result()
+
+    @classmethod
+    async def flush_async(cls) -> None:
+        worker_future: Future | None = cls._request_flush()
+        if worker_future is not None:
+            await asyncio.wrap_future(worker_future)
+
+    @classmethod
+    def _request_flush(cls) -> Future | None:
+        with cls._lock:
+            if cls._flush_event is not None:
+                common.get_background_event_loop().call_soon_threadsafe(cls._flush_event.set)
+
+            return cls._worker_future
+
+    @classmethod
+    async def _run(cls, flush_event: asyncio.Event) -> None:
+        while True:
+            if cls.digest_interval_seconds is not None and not flush_event.is_set():
+                try:
+                    await asyncio.wait_for(flush_event.wait(), cls.digest_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+            with cls._lock:
+                message_list: List[Tuple[str, str]] = cls._message_list
+                cls._message_list = []
+                if len(message_list) == 0:
+                    cls._worker_future = None
+                    cls._flush_event = None
+                    return
+
+                is_flush_requested: bool = flush_event.is_set()
+                flush_event.clear()
+
+            for text_channel_name, message in cls._get_outgoing_message_list(message_list):
+                try:
+                    await DiscordDefaults.send_message(text_channel_name, message)
+                except Exception as e:
+                    logger.exception(f"Discord outbox message could not be sent\n"
+                                     f"Channel Name: {text_channel_name}\n"
+                                     f"Exception: {repr(e)}")
+
+            with cls._lock:
+                if is_flush_requested and len(cls._message_list) == 0 and not flush_event.is_set():
+                    cls._worker_future = None
+                    cls._flush_event = None
+                    return
+
+    @classmethod
+    def _get_outgoing_message_list(cls, message_list: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        if cls.digest_interval_seconds is None:
+            return message_list
+
+        message_list_dict: Dict[str, List[str]] = {}
+        for text_channel_name, message in message_list:
+            message_list_dict.setdefault(text_channel_name, []).append(message)
+
+        return [(text_channel_name, message_list[0] if len(message_list) == 1 else f"**Digest**: *{len(message_list)} messages*\n\n" + "\n".join(message_list))
+                for text_channel_name, message_list in message_list_dict.items()]
+
+
+atexit.register(DiscordOutbox.flush)
+
+
 class Bot(DataClass):
     id: int
     username: str
@@ -123,8 +409,8 @@ class Bot(DataClass):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-    async def _initialize(self) -> None:
-        for server in await Server.get_all_servers(self):
+    async def _initialize(self, is_lazy: bool = False) -> None:
+        for server in await Server.get_all_servers(self, is_lazy):
             if server in self.server_list:
                 existing_server: Server = next(filter(lambda s: s.id == server.id, self.server_list))
                 existing_server.__dict__.update(**server.model_dump())
@@ -149,16 +435,16 @@ class Bot(DataClass):
                                                  f"Number of servers: {len(server_list)}\n")
 
     @staticmethod
-    async def get() -> "Bot":
+    async def get(is_lazy: bool = False) -> "Bot":
         url: str = constants.ENDPOINT__BOT__GET_BOT
-        http_session: DiscordHTTPSession = DiscordHTTPSession(url)
+        http_session: DiscordHTTPSession = DiscordHTTPSession.get_authenticated_session()
         response: HTTPResponse = await http_session.get(url)
 
         bot: Bot = Bot.model_construct(id=response.data["id"],
                                        username=response.data["username"],
                                        name=response.data["global_name"])
         bot._http_session = http_session
-        await bot._initialize()
+        await bot._initialize(is_lazy)
 
         return bot
 
@@ -170,6 +456,9 @@ class Server(DataClass):
     user_list: List["User"] = []
     role_list: List["Role"] = []
     bot: Bot
+    lazy_field_list: ClassVar[List[str]] = ["text_channel_list", "user_list", "role_list"]
+    _unloaded_field_set: Set[str] = PrivateAttr(default_factory=set)
+    _load_task_dict: Dict[str, asyncio.Task] = PrivateAttr(default_factory=dict)
 
     @property
     def http_session(self) -> DiscordHTTPSession:
@@ -178,29 +467,58 @@ class Server(DataClass):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
+    @property
+    def is_partially_loaded(self) -> bool:
+        return len(self._unloaded_field_set) > 0
+
     async def _initialize(self) -> None:
-        for text_channel in await TextChannel.get_all(self):
-            if text_channel in self.text_channel_list:
-                existing_text_channel: TextChannel = next(filter(lambda t: t.id == text_channel.id, self.text_channel_list))
-                existing_text_channel.__dict__.update(**text_channel.model_dump())
-            else:
-                self.text_channel_list.append(text_channel)
+        text_channel_list, user_list, role_list = await asyncio.gather(TextChannel.get_all(self), User.get_all(self), Role.get_all(self))
+        Server._merge_list(self.text_channel_list, text_channel_list)
+        Server._merge_list(self.user_list, user_list)
+        Server._merge_list(self.role_list, role_list)
+        self._unloaded_field_set.clear()
+
+    async def load(self, field_name_list: List[str] | None = None) -> None:
+        field_name_list = Server.lazy_field_list if field_name_list is None else field_name_list
+        await asyncio.gather(*[self._load_field(field_name) for field_name in field_name_list if field_name in self._unloaded_field_set])
+
+    async def _load_field(self, field_name: str) -> None:
+        load_task: asyncio.Task | None = self._load_task_dict.get(field_name)
+        if load_task is None or load_task.get_loop() is not asyncio.get_running_loop():
+            load_task = asyncio.ensure_future(self._get_field_value(field_name))
+            self._load_task_dict[field_name] = load_task
 
-        for user in await User.get_all(self):
-            if user in self.user_list:
-                existing_user: User = next(filter(lambda u: u.id == user.id, self.user_list))
-                existing_user.__dict__.update(user.model_dump())
-            else:
-                self.user_list.append(user)
+        try:
+            field_value: List[Any] = await load_task
+        finally:
+            self._load_task_dict.pop(field_name, None)
 
-        for role in await Role.get_all(self):
-            if role in self.role_list:
-                existing_role: Role = next(filter(lambda r: r.id == role.id, self.role_list))
-                existing_role.__dict__.update(role.model_dump())
+        if field_name in self._unloaded_field_set:
+            Server._merge_list(getattr(self, field_name), field_value)
+            self._unloaded_field_set.discard(field_name)
+
+    async def _get_field_value(self, field_name: str) -> List[Any]:
+        if field_name == "text_channel_list":
+            return await TextChannel.get_all(self)
+        elif field_name == "user_list":
+            return await User.get_all(self)
+
+        return await Role.get_all(self)
+
+    def _unload(self) -> None:
+        self._unloaded_field_set.update(Server.lazy_field_list)
+
+    @staticmethod
+    def _merge_list(existing_item_list: List[Any], item_list: List[Any]) -> None:
+        for item in item_list:
+            if item in existing_item_list:
+                existing_item: Any = next(filter(lambda i: i.id == item.id, existing_item_list))
+                existing_item.__dict__.update(item.model_dump())
             else:
-                self.role_list.append(role)
+                existing_item_list.append(item)
 
     async def get_text_channel(self, text_channel_name: str, is_public_channel: bool = False) -> "TextChannel":
+        await self.load(["text_channel_list"])
         text_channel_list: List[TextChannel] = list(filter(lambda t: t.name == text_channel_name, self.text_channel_list))
 
         if len(text_channel_list) == 1:
@@ -221,7 +539,7 @@ class Server(DataClass):
 
     async def get_user(self, username: str) -> "User":
         username = username.lower()
-        self.user_list = await User.get_all(self) if len(self.user_list) == 0 else self.user_list
+        await self.load(["user_list"])
 
         try:
             return next(filter(lambda u: u.username == username, self.user_list))
@@ -234,7 +552,7 @@ class Server(DataClass):
         if role_type == RoleType.OTHER:
             raise OperationNotSupportedException("OTHER Role Type searches are not allowed")
 
-        self.role_list = await Role.get_all(self) if len(self.role_list) == 0 else self.role_list
+        await self.load(["role_list"])
 
         try:
             return next(filter(lambda r: r.role_type == role_type, self.role_list))
@@ -244,7 +562,7 @@ class Server(DataClass):
                                         f"Role Type: {role_type.value}")
 
     @classmethod
-    async def get_all_servers(cls, bot: Bot) -> List["Server"]:
+    async def get_all_servers(cls, bot: Bot, is_lazy: bool = False) -> List["Server"]:
         server_list: List[Server] = []
         response: HTTPResponse = await bot.http_session.get(constants.ENDPOINT__SERVER__GET_ALL_SERVERS)
 
@@ -252,9 +570,14 @@ class Server(DataClass):
             server: Server = Server.model_construct(id=data["id"],
                                                     name=data["name"])
             server.bot = bot
-            await server._initialize()
             server_list.append(server)
 
+        if is_lazy:
+            for server in server_list:
+                server._unload()
+        else:
+            await asyncio.gather(*[server._initialize() for server in server_list])
+
         return server_list
 
     @staticmethod
@@ -277,7 +600,7 @@ class User(DataClass):
     @staticmethod
     async def get_all(server: Server) -> List["User"]:
         url: str = constants.ENDPOINT__SERVER__GET_ALL_USERS.replace("$serverID", str(server.id))
-        http_session: DiscordHTTPSession = DiscordHTTPSession(url)
+        http_session: DiscordHTTPSession = DiscordHTTPSession.get_authenticated_session()
         response: HTTPResponse = await http_session.get(url)
         return [User(id=data["user"]["id"],
                      username=data["user"]["username"],
@@ -300,7 +623,7 @@ class Role(DataClass):
     async def get_all(server: Server) -> List["Role"]:
         role_list: List[Role] = []
         url: str = constants.ENDPOINT__SERVER__GET_ALL_ROLES.replace("$serverID", str(server.id))
-        http_session: DiscordHTTPSession = DiscordHTTPSession(url)
+        http_session: DiscordHTTPSession = DiscordHTTPSession.get_authenticated_session()
         response: HTTPResponse = await http_session.get(url)
 
         for data in response.data:
@@ -364,13 +687,15 @@ class TextChannel(Channel):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
-    #   TODO: This is no longer an asynchronous function
-    async def send_message(self, message: str) -> None:
+    @property
+    def message_queue(self) -> MessageQueue:
+        return MessageQueue.get(self.id, self.http_session)
+
+    async def send_message(self, message: str, is_coalesced: bool = False) -> None:
         if common.is_ci_cd_pipeline_environment():
             return
 
-        url: str = constants.ENDPOINT__CHANNEL__SEND_MESSAGE.replace("$channelID", str(self.id))
-        asyncio.ensure_future(self.http_session.post(url, data={"content": message}))
+        await self.message_queue.put({"content": message}, is_coalesced)
 
     async def delete(self) -> None:
         await self.http_session.delete(constants.ENDPOINT__CHANNEL__DELETE.replace("$channelID", str(self.id)))
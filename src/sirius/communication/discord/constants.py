@@ -9,3 +9,10 @@ ENDPOINT__SERVER__GET_ALL_ROLES: str = f"{URL}/guilds/$serverID/roles"
 ENDPOINT__CHANNEL__CREATE_CHANNEL_OR_GET_ALL_CHANNELS: str = f"{URL}/guilds/$serverID/channels"
 ENDPOINT__CHANNEL__SEND_MESSAGE: str = f"{URL}/channels/$channelID/messages"
 ENDPOINT__CHANNEL__DELETE: str = f"{URL}/channels/$channelID"
+
+MESSAGE_QUEUE_MAXIMUM_SIZE: int = 1000
+MESSAGE_QUEUE_MAXIMUM_NUMBER_OF_CONCURRENT_REQUESTS: int = 10
+MESSAGE_MAXIMUM_LENGTH: int = 2000
+MESSAGE_COALESCING_WINDOW_SECONDS: float = 1
+MESSAGE_COALESCING_MAXIMUM_NUMBER_OF_MESSAGES: int = 3
+MESSAGE_COALESCING_ATTACHMENT_FILE_NAME: str = "messages.txt"
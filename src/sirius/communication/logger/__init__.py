@@ -1,14 +1,14 @@
 import datetime
 
 from sirius.communication import discord
-from sirius.communication.discord import TextChannel, AortaTextChannels, DiscordDefaults
+from sirius.communication.discord import TextChannel, AortaTextChannels, DiscordDefaults, MessageQueue
 
 
 class Logger:
 
     @staticmethod
     async def _send_message(text_channel_enum: AortaTextChannels, message: str) -> None:
-        await DiscordDefaults.send_message(text_channel_enum.value, f"{discord.get_timestamp_string(datetime.datetime.now())}: {message}")
+        await DiscordDefaults.send_message(text_channel_enum.value, f"{discord.get_timestamp_string(datetime.datetime.now())}: {message}", True)
 
     @staticmethod
     async def notify(message: str) -> None:
@@ -17,3 +17,11 @@ class Logger:
     @staticmethod
     async def debug(message: str) -> None:
         await Logger._send_message(AortaTextChannels.DEBUG, message)
+
+    @staticmethod
+    def flush() -> None:
+        MessageQueue.drain_all()
+
+    @staticmethod
+    async def flush_async() -> None:
+        await MessageQueue.drain_all_async()
@@ -1,75 +1,443 @@
+import asyncio
 import datetime
-from typing import Union, cast, List, Dict, Any
+import time
+from logging import Logger
+from typing import Union, cast, List, Dict, Any, ClassVar, AsyncIterator, Set, AsyncIterable
 
-import motor
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pydantic import PrivateAttr
 
-from sirius import common
+from sirius import application_performance_monitoring, common
 from sirius.common import DataClass
-from sirius.constants import EnvironmentSecret
+from sirius.database import constants
+from sirius.database.exceptions import DatabaseException
+from sirius.database.storage_engine import StorageEngine, MotorStorageEngine, InMemoryStorageEngine, SQLiteStorageEngine
 
+logger: Logger = application_performance_monitoring.get_logger()
 client: AsyncIOMotorClient | None = None  # type: ignore[valid-type]
 db: AsyncIOMotorDatabase | None = None  # type: ignore[valid-type]
+storage_engine: StorageEngine | None = None
+indexed_collection_set: Set[str] = set()
+write_behind_buffer_dict: Dict[str, "WriteBehindBuffer"] = {}
 
 
 async def initialize() -> None:
-    global client, db
-    client = motor.motor_asyncio.AsyncIOMotorClient(
-        f"{common.get_environmental_secret(EnvironmentSecret.MONGO_DB_CONNECTION_STRING)}&retryWrites=false",
-                                                    uuidRepresentation="standard") if client is None else client
-    db = client[common.get_environmental_secret(EnvironmentSecret.APPLICATION_NAME)] if db is None else db
+    global client, db, storage_engine
+    storage_engine = MotorStorageEngine() if storage_engine is None else storage_engine
+    await storage_engine.initialize()
 
+    if isinstance(storage_engine, MotorStorageEngine):
+        client, db = storage_engine.client, storage_engine.db
 
-async def drop_collection(collection_name: str) -> None:
+
+async def set_storage_engine(new_storage_engine: StorageEngine) -> None:
+    global client, db, storage_engine
+    await shutdown()
+    storage_engine = new_storage_engine
+    client, db = None, None
+    indexed_collection_set.clear()
+    write_behind_buffer_dict.clear()
+
+
+async def get_storage_engine() -> StorageEngine:
     await initialize()
-    await cast(AsyncIOMotorDatabase, db).drop_collection(collection_name)  # type: ignore[attr-defined,valid-type]
+    return cast(StorageEngine, storage_engine)
+
+
+async def drop_collection(collection_name: str) -> None:
+    await (await get_storage_engine()).drop_collection(collection_name)
+    indexed_collection_set.discard(collection_name)
+
+
+async def shutdown() -> None:
+    for write_behind_buffer in list(write_behind_buffer_dict.values()):
+        await write_behind_buffer.close()
+
+
+async def _get_chunk_iterator(data: bytes) -> AsyncIterator[bytes]:
+    for start_index in range(0, len(data), constants.LARGE_BINARY_CHUNK_SIZE):
+        yield data[start_index:start_index + constants.LARGE_BINARY_CHUNK_SIZE]
+
+
+class LargeBinary(DataClass):
+    file_id: ObjectId | None = None
+    file_name: str | None = None
+    length: int = 0
+    _pending_content: bytes | AsyncIterable[bytes] | None = PrivateAttr(None)
+
+    @property
+    def is_uploaded(self) -> bool:
+        return self._pending_content is None and self.file_id is not None
+
+    @staticmethod
+    def from_bytes(data: bytes, file_name: str | None = None) -> "LargeBinary":
+        large_binary: LargeBinary = LargeBinary(file_name=file_name, length=len(data))
+        large_binary._pending_content = data
+        return large_binary
+
+    @staticmethod
+    def from_stream(chunk_iterable: AsyncIterable[bytes], file_name: str | None = None) -> "LargeBinary":
+        large_binary: LargeBinary = LargeBinary(file_name=file_name)
+        large_binary._pending_content = chunk_iterable
+        return large_binary
+
+    async def _get_counted_chunk_iterator(self, chunk_iterable: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        self.length = 0
+        async for chunk in chunk_iterable:
+            self.length = self.length + len(chunk)
+            yield chunk
+
+    async def upload(self, content: bytes | AsyncIterable[bytes] | None = None) -> None:
+        content = self._pending_content if content is None else content
+        if content is None:
+            return
+
+        chunk_iterable: AsyncIterable[bytes] = _get_chunk_iterator(content) if isinstance(content, bytes) else content
+        self.file_id = await (await get_storage_engine()).upload_file("" if self.file_name is None else self.file_name, self._get_counted_chunk_iterator(chunk_iterable))
+        self._pending_content = None
+
+    async def open_download_stream(self) -> AsyncIterator[bytes]:
+        if isinstance(self._pending_content, bytes):
+            async for chunk in _get_chunk_iterator(self._pending_content):
+                yield chunk
+            return
+
+        if self.file_id is None:
+            raise DatabaseException("Large binary has not been uploaded")
+
+        async for chunk in (await get_storage_engine()).download_file(self.file_id):
+            yield chunk
+
+    async def read(self) -> bytes:
+        return b"".join([chunk async for chunk in self.open_download_stream()])
+
+    async def delete(self) -> None:
+        if self.file_id is not None:
+            await (await get_storage_engine()).delete_file(self.file_id)
+
+        self.file_id = None
+        self.length = 0
+        self._pending_content = None
+
+
+class WriteBehindConfiguration(DataClass):
+    maximum_queue_size: int = 10_000
+    batch_size: int = 500
+    flush_interval_seconds: float = 1
+    maximum_number_of_retries: int = 3
+
+
+class WriteBehindMetrics(DataClass):
+    queue_depth: int = 0
+    maximum_queue_depth: int = 0
+    number_of_flushes: int = 0
+    number_of_documents_flushed: int = 0
+    number_of_documents_failed: int = 0
+    number_of_documents_dead_lettered: int = 0
+    last_flush_latency_seconds: float | None = None
+    maximum_flush_latency_seconds: float | None = None
+    total_flush_latency_seconds: float = 0
+
+    @property
+    def average_flush_latency_seconds(self) -> float | None:
+        return None if self.number_of_flushes == 0 else self.total_flush_latency_seconds / self.number_of_flushes
+
+
+class WriteBehindBuffer:
+    document_class: type["DatabaseDocument"]
+    configuration: WriteBehindConfiguration
+    metrics: WriteBehindMetrics
+    dead_letter_list: List["DatabaseDocument"]
+    _queue: asyncio.Queue
+    _retry_list: List["DatabaseDocument"]
+    _worker: asyncio.Task | None
+
+    def __init__(self, document_class: type["DatabaseDocument"], configuration: WriteBehindConfiguration) -> None:
+        self.document_class = document_class
+        self.configuration = configuration
+        self.metrics = WriteBehindMetrics()
+        self.dead_letter_list = []
+        self._queue = asyncio.Queue(maxsize=configuration.maximum_queue_size)
+        self._retry_list = []
+        self._worker = None
+
+    async def put(self, database_document: "DatabaseDocument") -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._run())
+
+        await self._queue.put(database_document)
+        self.metrics.queue_depth = self._queue.qsize()
+        self.metrics.maximum_queue_depth = max(self.metrics.maximum_queue_depth, self.metrics.queue_depth)
+
+    async def flush(self) -> None:
+        await self._queue.join()
+
+    async def close(self) -> None:
+        if self._worker is None:
+            return
+
+        await self.flush()
+        self._worker.cancel()
+        self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            if len(self._retry_list) > 0:
+                await asyncio.sleep(self.configuration.flush_interval_seconds)
+
+            batch: List[DatabaseDocument] = self._retry_list if len(self._retry_list) > 0 else [await self._queue.get()]
+            self._retry_list = []
+            deadline: float = time.monotonic() + self.configuration.flush_interval_seconds
+
+            while len(batch) < self.configuration.batch_size:
+                remaining_seconds: float = deadline - time.monotonic()
+                if remaining_seconds <= 0:
+                    break
+
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining_seconds))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush_batch(batch)
+
+    async def _flush_batch(self, batch: List["DatabaseDocument"]) -> None:
+        start_time: float = time.monotonic()
+        completed_batch: List[DatabaseDocument] = batch
+
+        try:
+            for database_document in batch:
+                await database_document._upload_large_binaries()
+
+            inserted_id_list: List[ObjectId] = await (await self.document_class._get_storage_engine()).insert_many(self.document_class.__name__, [d.model_dump(exclude={"id"}) for d in batch])
+            for database_document, object_id in zip(batch, inserted_id_list):
+                database_document.id = object_id
+                database_document._persisted_file_id_set = database_document._get_file_id_set()
+
+            self.metrics.number_of_documents_flushed = self.metrics.number_of_documents_flushed + len(batch)
+        except Exception as e:
+            for database_document in batch:
+                database_document._number_of_failed_flushes = database_document._number_of_failed_flushes + 1
+
+            self._retry_list = [d for d in batch if d._number_of_failed_flushes <= self.configuration.maximum_number_of_retries]
+            completed_batch = [d for d in batch if d._number_of_failed_flushes > self.configuration.maximum_number_of_retries]
+            self.dead_letter_list.extend(completed_batch)
+            self.metrics.number_of_documents_failed = self.metrics.number_of_documents_failed + len(batch)
+            self.metrics.number_of_documents_dead_lettered = self.metrics.number_of_documents_dead_lettered + len(completed_batch)
+            logger.exception(f"Write-behind flush failed\n"
+                             f"Collection: {self.document_class.__name__}\n"
+                             f"Number of documents: {len(batch)}\n"
+                             f"Number of documents to retry: {len(self._retry_list)}\n"
+                             f"Number of documents dead-lettered: {len(completed_batch)}\n"
+                             f"Exception: {repr(e)}")
+        finally:
+            flush_latency_seconds: float = time.monotonic() - start_time
+            self.metrics.number_of_flushes = self.metrics.number_of_flushes + 1
+            self.metrics.last_flush_latency_seconds = flush_latency_seconds
+            self.metrics.maximum_flush_latency_seconds = max(flush_latency_seconds, self.metrics.maximum_flush_latency_seconds or 0)
+            self.metrics.total_flush_latency_seconds = self.metrics.total_flush_latency_seconds + flush_latency_seconds
+            self.metrics.queue_depth = self._queue.qsize()
+
+            for database_document in completed_batch:
+                database_document._is_queued = False
+                self._queue.task_done()
 
 
 class DatabaseDocument(DataClass):
     id: ObjectId | None = None
     updated_timestamp: datetime.datetime | None = None
     created_timestamp: datetime.datetime | None = None
+    indexed_field_list: ClassVar[List[str]] = []
+    write_behind_configuration: ClassVar[WriteBehindConfiguration | None] = None
+    _is_queued: bool = PrivateAttr(False)
+    _number_of_failed_flushes: int = PrivateAttr(0)
+    _loaded_field_set: Set[str] | None = PrivateAttr(None)
+    _persisted_file_id_set: Set[ObjectId] = PrivateAttr(default_factory=set)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in type(self).model_fields and self._loaded_field_set is not None and name not in self._loaded_field_set:
+            if common.is_event_loop_running():
+                raise DatabaseException(f"Cannot lazily load a field from within a running event loop; call 'await load()' first\n"
+                                        f"Collection: {self.__class__.__name__}\n"
+                                        f"ID: {str(self.id)}\n"
+                                        f"Field: {name}")
+
+            common.run_coroutine_synchronously(self.load())
+            return self.__dict__[name]
+
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    @property
+    def is_partially_loaded(self) -> bool:
+        return self._loaded_field_set is not None
+
+    def get_unloaded_field_list(self) -> List[str]:
+        return [] if self._loaded_field_set is None else [f for f in type(self).model_fields if f not in self._loaded_field_set]
+
+    def _load_unloaded_fields(self, raw_data: Dict[str, Any] | None) -> None:
+        if raw_data is None:
+            raise DatabaseException(f"Document not found while loading unloaded fields\n"
+                                    f"Collection: {self.__class__.__name__}\n"
+                                    f"ID: {str(self.id)}")
+
+        for field_name in self.get_unloaded_field_list():
+            if field_name in raw_data:
+                self.__pydantic_validator__.validate_assignment(self, field_name, raw_data[field_name])
+            else:
+                self.__dict__[field_name] = type(self).model_fields[field_name].get_default(call_default_factory=True)
+
+        self._loaded_field_set = None
+
+    def _get_large_binary_list(self) -> List[LargeBinary]:
+        return [v for k, v in self.__dict__.items() if k in type(self).model_fields and isinstance(v, LargeBinary)]
+
+    def _get_file_id_set(self) -> Set[ObjectId]:
+        return {cast(ObjectId, large_binary.file_id) for large_binary in self._get_large_binary_list() if large_binary.file_id is not None}
+
+    async def _upload_large_binaries(self) -> None:
+        for large_binary in self._get_large_binary_list():
+            await large_binary.upload()
+
+    async def _delete_replaced_large_binaries(self) -> None:
+        engine: StorageEngine = await get_storage_engine()
+        file_id_set: Set[ObjectId] = self._get_file_id_set()
+
+        for file_id in self._persisted_file_id_set - file_id_set:
+            await engine.delete_file(file_id)
+        self._persisted_file_id_set = file_id_set
+
+    async def load(self) -> None:
+        if self._loaded_field_set is not None:
+            self._load_unloaded_fields(await (await self._get_storage_engine()).find_one(self.__class__.__name__, {"_id": self.id}, self.get_unloaded_field_list()))
 
     @classmethod
-    async def _get_collection(cls) -> AsyncIOMotorCollection:  # type: ignore[valid-type]
-        await initialize()
-        global db
-        return db[cls.__name__]  # type: ignore[index]
+    async def _get_storage_engine(cls) -> StorageEngine:
+        engine: StorageEngine = await get_storage_engine()
+        if cls.__name__ not in indexed_collection_set:
+            for field_name in cls.indexed_field_list:
+                await engine.create_index(cls.__name__, field_name)
+            indexed_collection_set.add(cls.__name__)
+
+        return engine
+
+    @classmethod
+    def _get_write_behind_buffer(cls) -> WriteBehindBuffer:
+        if cls.__name__ not in write_behind_buffer_dict:
+            write_behind_buffer_dict[cls.__name__] = WriteBehindBuffer(cls, cast(WriteBehindConfiguration, cls.write_behind_configuration))
+
+        return write_behind_buffer_dict[cls.__name__]
+
+    @classmethod
+    def get_write_behind_metrics(cls) -> WriteBehindMetrics | None:
+        return write_behind_buffer_dict[cls.__name__].metrics if cls.__name__ in write_behind_buffer_dict else None
+
+    @classmethod
+    def get_write_behind_dead_letter_list(cls) -> List["DatabaseDocument"]:
+        return write_behind_buffer_dict[cls.__name__].dead_letter_list if cls.__name__ in write_behind_buffer_dict else []
+
+    @classmethod
+    async def flush(cls) -> None:
+        if cls.__name__ in write_behind_buffer_dict:
+            await write_behind_buffer_dict[cls.__name__].flush()
 
     async def save(self) -> None:
-        collection: AsyncIOMotorCollection = await self._get_collection()  # type: ignore[valid-type]
+        if self.id is None and self.write_behind_configuration is not None:
+            if not self._is_queued:
+                self.created_timestamp = datetime.datetime.now()
+                self._is_queued = True
+                await self._get_write_behind_buffer().put(self)
+            return
+
+        engine: StorageEngine = await self._get_storage_engine()
+        await self._upload_large_binaries()
 
         if self.id is None:
             self.created_timestamp = datetime.datetime.now()
-            object_id: ObjectId = (await collection.insert_one(self.model_dump(exclude={"id"}))).inserted_id  # type: ignore[attr-defined]
-            self.__dict__.update(self.model_dump(exclude={"id"}))
+            object_id: ObjectId = await engine.insert_one(self.__class__.__name__, self.model_dump(exclude={"id"}))
             self.id = object_id
+        elif self._loaded_field_set is not None:
+            self.updated_timestamp = datetime.datetime.now()
+            self._loaded_field_set.add("updated_timestamp")
+            await engine.update_one(self.__class__.__name__, self.id, self.model_dump(include=self._loaded_field_set, exclude={"id"}))
         else:
             self.updated_timestamp = datetime.datetime.now()
-            await collection.replace_one({"_id": self.id}, self.model_dump(exclude={"id"}))  # type: ignore[attr-defined]
+            await engine.replace_one(self.__class__.__name__, self.id, self.model_dump(exclude={"id"}))
+
+        await self._delete_replaced_large_binaries()
 
     async def delete(self) -> None:
-        await initialize()
-        collection: AsyncIOMotorCollection = await self._get_collection()  # type: ignore[valid-type]
-        await collection.delete_one({'_id': self.id})  # type: ignore[attr-defined]
+        await self.load()
+        for large_binary in self._get_large_binary_list():
+            await large_binary.delete()
+
+        await (await self._get_storage_engine()).delete_one(self.__class__.__name__, cast(ObjectId, self.id))
+
+    @classmethod
+    async def save_many(cls, database_document_list: List["DatabaseDocument"]) -> None:
+        engine: StorageEngine = await cls._get_storage_engine()
+        new_database_document_list: List[DatabaseDocument] = []
+        existing_database_document_list: List[DatabaseDocument] = []
+        timestamp: datetime.datetime = datetime.datetime.now()
+
+        for database_document in database_document_list:
+            await database_document._upload_large_binaries()
+            if database_document.id is None:
+                database_document.created_timestamp = timestamp
+                new_database_document_list.append(database_document)
+            else:
+                database_document.updated_timestamp = timestamp
+                if database_document._loaded_field_set is not None:
+                    database_document._loaded_field_set.add("updated_timestamp")
+                existing_database_document_list.append(database_document)
+
+        if len(new_database_document_list) > 0:
+            object_id_list: List[ObjectId] = await engine.insert_many(cls.__name__, [d.model_dump(exclude={"id"}) for d in new_database_document_list])
+            for database_document, object_id in zip(new_database_document_list, object_id_list):
+                database_document.id = object_id
+                database_document._persisted_file_id_set = database_document._get_file_id_set()
+
+        await engine.update_many(cls.__name__, [(cast(ObjectId, d.id), d.model_dump(include=d._loaded_field_set, exclude={"id"})) for d in existing_database_document_list])
+        for database_document in existing_database_document_list:
+            await database_document._delete_replaced_large_binaries()
 
     @classmethod
-    def get_model_by_raw_data(cls, raw_data: Dict[Any, Any]) -> "DatabaseDocument":
+    def get_model_by_raw_data(cls, raw_data: Dict[Any, Any], projection: List[str] | None = None) -> "DatabaseDocument":
         object_id = raw_data.pop("_id")
-        queried_object: DatabaseDocument = cls(**raw_data)
-        queried_object.id = object_id
-        return queried_object
+        if projection is None:
+            queried_object: DatabaseDocument = cls(**raw_data)
+            queried_object.id = object_id
+            queried_object._persisted_file_id_set = queried_object._get_file_id_set()
+            return queried_object
+
+        partial_object: DatabaseDocument = cls.model_construct(id=object_id)
+        partial_object._loaded_field_set = {"id"}
+        for field_name in cls.model_fields:
+            if field_name == "id":
+                continue
+            elif field_name in raw_data:
+                cls.__pydantic_validator__.validate_assignment(partial_object, field_name, raw_data[field_name])
+                partial_object._loaded_field_set.add(field_name)
+            elif field_name in projection:
+                partial_object._loaded_field_set.add(field_name)
+            else:
+                partial_object.__dict__.pop(field_name, None)
+
+        partial_object._persisted_file_id_set = partial_object._get_file_id_set()
+        return partial_object
+
+    @classmethod
+    async def find_by_id(cls, object_id: ObjectId, projection: List[str] | None = None) -> Union["DatabaseDocument", None]:
+        object_model: Dict[str, Any] | None = await (await cls._get_storage_engine()).find_one(cls.__name__, {"_id": object_id}, projection)
+        return None if object_model is None else cls.get_model_by_raw_data(object_model, projection)
 
     @classmethod
-    async def find_by_id(cls, object_id: ObjectId) -> Union["DatabaseDocument", None]:
-        await initialize()
-        collection: AsyncIOMotorCollection = await cls._get_collection()  # type: ignore[valid-type]
-        object_model: Dict[str, Any] = await collection.find_one({'_id': object_id})  # type: ignore[attr-defined]
-        return None if object_model is None else cls.get_model_by_raw_data(object_model)
+    async def find_by_query(cls, database_document: "DatabaseDocument", query_limit: int = 100, projection: List[str] | None = None) -> List["DatabaseDocument"]:
+        document_list: List[Dict[str, Any]] = await (await cls._get_storage_engine()).find(cls.__name__, database_document.model_dump(exclude={"id"}, exclude_none=True), query_limit, projection)
+        return [cls.get_model_by_raw_data(document, projection) for document in document_list]
 
     @classmethod
-    async def find_by_query(cls, database_document: "DatabaseDocument", query_limit: int = 100) -> List["DatabaseDocument"]:
-        collection: AsyncIOMotorCollection = await cls._get_collection()  # type: ignore[valid-type]
-        cursor = collection.find(database_document.model_dump(exclude={"id"}, exclude_none=True))  # type: ignore[attr-defined]
-        return [cls.get_model_by_raw_data(document) for document in await cursor.to_list(length=query_limit)]
+    async def find_stream_by_query(cls, database_document: "DatabaseDocument", batch_size: int = 100, projection: List[str] | None = None) -> AsyncIterator["DatabaseDocument"]:
+        engine: StorageEngine = await cls._get_storage_engine()
+        async for document in engine.find_stream(cls.__name__, database_document.model_dump(exclude={"id"}, exclude_none=True), batch_size, projection):
+            yield cls.get_model_by_raw_data(document, projection)
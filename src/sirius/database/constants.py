@@ -0,0 +1,4 @@
+LARGE_BINARY_CHUNK_SIZE: int = 255 * 1024
+SQLITE_FILE_TABLE_NAME: str = "__files__"
+SQLITE_FILE_CHUNK_TABLE_NAME: str = "__file_chunks__"
+SQLITE_MAXIMUM_NUMBER_OF_PARAMETERS: int = 900
@@ -0,0 +1,448 @@
+import copy
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, AsyncIterator, Set, Tuple, Iterator, AsyncIterable
+
+import motor
+from bson import ObjectId, json_util
+from bson.json_util import JSONOptions
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorGridFSBucket
+from pymongo import UpdateOne
+
+from sirius import common
+from sirius.constants import EnvironmentSecret
+from sirius.database import constants
+from sirius.database.exceptions import DatabaseException
+
+json_options: JSONOptions = json_util.RELAXED_JSON_OPTIONS.with_options(tz_aware=False)
+
+
+def _get_hashable_value(value: Any) -> Any:
+    return json_util.dumps(value, sort_keys=True, json_options=json_options) if isinstance(value, (dict, list)) else value
+
+
+def _is_matching_query(document: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    return all(key in document and document[key] == value for key, value in query.items())
+
+
+def _get_projected_document(document: Dict[str, Any], projection: List[str] | None) -> Dict[str, Any]:
+    return document if projection is None else {k: v for k, v in document.items() if k == "_id" or k in projection}
+
+
+def _validate_field_name(field_name: str) -> None:
+    if not field_name.replace("_", "a").isalnum():
+        raise DatabaseException(f"Invalid field name: {field_name}")
+
+
+class StorageEngine(ABC):
+
+    async def initialize(self) -> None:
+        pass
+
+    @abstractmethod
+    async def create_index(self, collection_name: str, field_name: str) -> None:
+        ...
+
+    @abstractmethod
+    async def insert_one(self, collection_name: str, document: Dict[str, Any]) -> ObjectId:
+        ...
+
+    @abstractmethod
+    async def insert_many(self, collection_name: str, document_list: List[Dict[str, Any]]) -> List[ObjectId]:
+        ...
+
+    @abstractmethod
+    async def replace_one(self, collection_name: str, object_id: ObjectId, document: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    async def update_one(self, collection_name: str, object_id: ObjectId, document: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    async def delete_one(self, collection_name: str, object_id: ObjectId) -> None:
+        ...
+
+    async def update_many(self, collection_name: str, update_list: List[Tuple[ObjectId, Dict[str, Any]]]) -> None:
+        for object_id, document in update_list:
+            await self.update_one(collection_name, object_id, document)
+
+    @abstractmethod
+    async def find(self, collection_name: str, query: Dict[str, Any], query_limit: int | None = None, projection: List[str] | None = None) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def find_stream(self, collection_name: str, query: Dict[str, Any], batch_size: int = 100, projection: List[str] | None = None) -> AsyncIterator[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def drop_collection(self, collection_name: str) -> None:
+        ...
+
+    @abstractmethod
+    async def upload_file(self, file_name: str, chunk_iterable: AsyncIterable[bytes]) -> ObjectId:
+        ...
+
+    @abstractmethod
+    def download_file(self, file_id: ObjectId) -> AsyncIterator[bytes]:
+        ...
+
+    @abstractmethod
+    async def delete_file(self, file_id: ObjectId) -> None:
+        ...
+
+    async def find_one(self, collection_name: str, query: Dict[str, Any], projection: List[str] | None = None) -> Dict[str, Any] | None:
+        document_list: List[Dict[str, Any]] = await self.find(collection_name, query, 1, projection)
+        return document_list[0] if len(document_list) > 0 else None
+
+
+class MotorStorageEngine(StorageEngine):
+    client: AsyncIOMotorClient | None = None
+    db: AsyncIOMotorDatabase | None = None
+
+    async def initialize(self) -> None:
+        self.client = motor.motor_asyncio.AsyncIOMotorClient(
+            f"{common.get_environmental_secret(EnvironmentSecret.MONGO_DB_CONNECTION_STRING)}&retryWrites=false",
+            uuidRepresentation="standard") if self.client is None else self.client
+        self.db = self.client[common.get_environmental_secret(EnvironmentSecret.APPLICATION_NAME)] if self.db is None else self.db
+
+    async def _get_collection(self, collection_name: str) -> Any:
+        await self.initialize()
+        return self.db[collection_name]
+
+    async def create_index(self, collection_name: str, field_name: str) -> None:
+        await (await self._get_collection(collection_name)).create_index(field_name)
+
+    async def insert_one(self, collection_name: str, document: Dict[str, Any]) -> ObjectId:
+        return (await (await self._get_collection(collection_name)).insert_one(document)).inserted_id
+
+    async def insert_many(self, collection_name: str, document_list: List[Dict[str, Any]]) -> List[ObjectId]:
+        return (await (await self._get_collection(collection_name)).insert_many(document_list)).inserted_ids
+
+    async def replace_one(self, collection_name: str, object_id: ObjectId, document: Dict[str, Any]) -> None:
+        await (await self._get_collection(collection_name)).replace_one({"_id": object_id}, document)
+
+    async def update_one(self, collection_name: str, object_id: ObjectId, document: Dict[str, Any]) -> None:
+        await (await self._get_collection(collection_name)).update_one({"_id": object_id}, {"$set": document})
+
+    async def update_many(self, collection_name: str, update_list: List[Tuple[ObjectId, Dict[str, Any]]]) -> None:
+        if len(update_list) > 0:
+            await (await self._get_collection(collection_name)).bulk_write([UpdateOne({"_id": object_id}, {"$set": document}) for object_id, document in update_list], ordered=False)
+
+    async def delete_one(self, collection_name: str, object_id: ObjectId) -> None:
+        await (await self._get_collection(collection_name)).delete_one({"_id": object_id})
+
+    async def find(self, collection_name: str, query: Dict[str, Any], query_limit: int | None = None, projection: List[str] | None = None) -> List[Dict[str, Any]]:
+        return await (await self._get_collection(collection_name)).find(query, projection).to_list(length=query_limit)
+
+    async def find_one(self, collection_name: str, query: Dict[str, Any], projection: List[str] | None = None) -> Dict[str, Any] | None:
+        return await (await self._get_collection(collection_name)).find_one(query, projection)
+
+    async def find_stream(self, collection_name: str, query: Dict[str, Any], batch_size: int = 100, projection: List[str] | None = None) -> AsyncIterator[Dict[str, Any]]:
+        async for document in (await self._get_collection(collection_name)).find(query, projection, batch_size=batch_size):
+            yield document
+
+    async def drop_collection(self, collection_name: str) -> None:
+        await self.initialize()
+        await self.db.drop_collection(collection_name)
+
+    async def _get_grid_fs_bucket(self) -> AsyncIOMotorGridFSBucket:
+        await self.initialize()
+        return AsyncIOMotorGridFSBucket(self.db)
+
+    async def upload_file(self, file_name: str, chunk_iterable: AsyncIterable[bytes]) -> ObjectId:
+        grid_in: Any = (await self._get_grid_fs_bucket()).open_upload_stream(file_name, chunk_size_bytes=constants.LARGE_BINARY_CHUNK_SIZE)
+        try:
+            async for chunk in chunk_iterable:
+                await grid_in.write(chunk)
+        except BaseException:
+            await grid_in.abort()
+            raise
+
+        await grid_in.close()
+        return grid_in._id
+
+    async def download_file(self, file_id: ObjectId) -> AsyncIterator[bytes]:
+        try:
+            grid_out: Any = await (await self._get_grid_fs_bucket()).open_download_stream(file_id)
+        except NoFile:
+            raise DatabaseException(f"File not found: {str(file_id)}")
+
+        while True:
+            chunk: bytes = await grid_out.readchunk()
+            if chunk == b"":
+                break
+            yield chunk
+
+    async def delete_file(self, file_id: ObjectId) -> None:
+        try:
+            await (await self._get_grid_fs_bucket()).delete(file_id)
+        except NoFile:
+            pass
+
+
+class InMemoryStorageEngine(StorageEngine):
+    collection_dict: Dict[str, Dict[ObjectId, Dict[str, Any]]]
+    index_dict: Dict[str, Dict[str, Dict[Any, Set[ObjectId]]]]
+    file_dict: Dict[ObjectId, List[bytes]]
+    sequence_number_dict: Dict[ObjectId, int]
+    _next_sequence_number: int
+
+    def __init__(self) -> None:
+        self.collection_dict = {}
+        self.index_dict = {}
+        self.file_dict = {}
+        self.sequence_number_dict = {}
+        self._next_sequence_number = 0
+
+    def _get_collection(self, collection_name: str) -> Dict[ObjectId, Dict[str, Any]]:
+        return self.collection_dict.setdefault(collection_name, {})
+
+    def _add_to_indexes(self, collection_name: str, document: Dict[str, Any]) -> None:
+        for field_name, index in self.index_dict.get(collection_name, {}).items():
+            index.setdefault(_get_hashable_value(document.get(field_name)), set()).add(document["_id"])
+
+    def _remove_from_indexes(self, collection_name: str, document: Dict[str, Any]) -> None:
+        for field_name, index in self.index_dict.get(collection_name, {}).items():
+            index.get(_get_hashable_value(document.get(field_name)), set()).discard(document["_id"])
+
+    def _get_candidate_id_list(self, collection_name: str, query: Dict[str, Any]) -> List[ObjectId]:
+        if "_id" in query:
+            return [query["_id"]] if query["_id"] in self._get_collection(collection_name) else []
+
+        index_dict: Dict[str, Dict[Any, Set[ObjectId]]] = self.index_dict.get(collection_name, {})
+        candidate_id_set_list: List[Set[ObjectId]] = [index_dict[field_name].get(_get_hashable_value(value), set()) for field_name, value in query.items() if field_name in index_dict]
+        if len(candidate_id_set_list) == 0:
+            return list(self._get_collection(collection_name).keys())
+
+        candidate_id_set: Set[ObjectId] = min(candidate_id_set_list, key=len)
+        return sorted(candidate_id_set, key=self.sequence_number_dict.__getitem__)
+
+    async def create_index(self, collection_name: str, field_name: str) -> None:
+        index_dict: Dict[str, Dict[Any, Set[ObjectId]]] = self.index_dict.setdefault(collection_name, {})
+        if field_name in index_dict:
+            return
+
+        index: Dict[Any, Set[ObjectId]] = {}
+        for object_id, document in self._get_collection(collection_name).items():
+            index.setdefault(_get_hashable_value(document.get(field_name)), set()).add(object_id)
+
+        index_dict[field_name] = index
+
+    async def insert_one(self, collection_name: str, document: Dict[str, Any]) -> ObjectId:
+        document = copy.deepcopy(document)
+        document["_id"] = document["_id"] if "_id" in document else ObjectId()
+        self._get_collection(collection_name)[document["_id"]] = document
+        self.sequence_number_dict[document["_id"]] = self._next_sequence_number
+        self._next_sequence_number = self._next_sequence_number + 1
+        self._add_to_indexes(collection_name, document)
+        return document["_id"]
+
+    async def insert_many(self, collection_name: str, document_list: List[Dict[str, Any]]) -> List[ObjectId]:
+        return [await self.insert_one(collection_name, document) for document in document_list]
+
+    async def replace_one(self, collection_name: str, object_id: ObjectId, document: Dict[str, Any]) -> None:
+        collection: Dict[ObjectId, Dict[str, Any]] = self._get_collection(collection_name)
+        if object_id not in collection:
+            return
+
+        self._remove_from_indexes(collection_name, collection[object_id])
+        collection[object_id] = {**copy.deepcopy(document), "_id": object_id}
+        self._add_to_indexes(collection_name, collection[object_id])
+
+    async def update_one(self, collection_name: str, object_id: ObjectId, document: Dict[str, Any]) -> None:
+        collection: Dict[ObjectId, Dict[str, Any]] = self._get_collection(collection_name)
+        if object_id in collection:
+            await self.replace_one(collection_name, object_id, {**collection[object_id], **document})
+
+    async def delete_one(self, collection_name: str, object_id: ObjectId) -> None:
+        document: Dict[str, Any] | None = self._get_collection(collection_name).pop(object_id, None)
+        if document is not None:
+            self._remove_from_indexes(collection_name, document)
+            self.sequence_number_dict.pop(object_id, None)
+
+    def _find_synchronously(self, collection_name: str, query: Dict[str, Any], projection: List[str] | None = None) -> Iterator[Dict[str, Any]]:
+        collection: Dict[ObjectId, Dict[str, Any]] = self._get_collection(collection_name)
+        for object_id in self._get_candidate_id_list(collection_name, query):
+            if object_id in collection and _is_matching_query(collection[object_id], query):
+                yield copy.deepcopy(_get_projected_document(collection[object_id], projection))
+
+    async def find(self, collection_name: str, query: Dict[str, Any], query_limit: int | None = None, projection: List[str] | None = None) -> List[Dict[str, Any]]:
+        document_list: List[Dict[str, Any]] = []
+        for document in self._find_synchronously(collection_name, query, projection):
+            if query_limit is not None and len(document_list) >= query_limit:
+                break
+            document_list.append(document)
+
+        return document_list
+
+    async def find_stream(self, collection_name: str, query: Dict[str, Any], batch_size: int = 100, projection: List[str] | None = None) -> AsyncIterator[Dict[str, Any]]:
+        for document in self._find_synchronously(collection_name, query, projection):
+            yield document
+
+    async def drop_collection(self, collection_name: str) -> None:
+        for object_id in self.collection_dict.pop(collection_name, {}):
+            self.sequence_number_dict.pop(object_id, None)
+        self.index_dict.pop(collection_name, None)
+
+    async def upload_file(self, file_name: str, chunk_iterable: AsyncIterable[bytes]) -> ObjectId:
+        file_id: ObjectId = ObjectId()
+        self.file_dict[file_id] = [bytes(chunk) async for chunk in chunk_iterable]
+        return file_id
+
+    async def download_file(self, file_id: ObjectId) -> AsyncIterator[bytes]:
+        if file_id not in self.file_dict:
+            raise DatabaseException(f"File not found: {str(file_id)}")
+
+        for chunk in self.file_dict[file_id]:
+            yield chunk
+
+    async def delete_file(self, file_id: ObjectId) -> None:
+        self.file_dict.pop(file_id, None)
+
+
+class SQLiteStorageEngine(StorageEngine):
+    connection: sqlite3.Connection
+    _lock: threading.Lock
+
+    def __init__(self, file_path: str = ":memory:") -> None:
+        self.connection = sqlite3.connect(file_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._execute(f'CREATE TABLE IF NOT EXISTS "{constants.SQLITE_FILE_TABLE_NAME}" (file_id TEXT PRIMARY KEY, file_name TEXT NOT NULL)')
+        self._execute(f'CREATE TABLE IF NOT EXISTS "{constants.SQLITE_FILE_CHUNK_TABLE_NAME}" (file_id TEXT NOT NULL, chunk_number INTEGER NOT NULL, data BLOB NOT NULL, PRIMARY KEY (file_id, chunk_number))')
+
+    def _execute(self, sql: str, parameters: Tuple[Any, ...] | List[Tuple[Any, ...]] = (), is_many: bool = False) -> List[Tuple[Any, ...]]:
+        with self._lock, self.connection:
+            cursor: sqlite3.Cursor = self.connection.executemany(sql, parameters) if is_many else self.connection.execute(sql, parameters)
+            return cursor.fetchall()
+
+    def _create_table(self, collection_name: str) -> None:
+        self._execute(f'CREATE TABLE IF NOT EXISTS "{collection_name}" (id TEXT PRIMARY KEY, document TEXT NOT NULL)')
+
+    @staticmethod
+    def _get_document(object_id: str, document_string: str) -> Dict[str, Any]:
+        document: Dict[str, Any] = json_util.loads(document_string, json_options=json_options)
+        document["_id"] = ObjectId(object_id)
+        return document
+
+    def _get_where_clause(self, query: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        condition_list: List[str] = []
+        parameter_list: List[Any] = []
+
+        for field_name, value in query.items():
+            if field_name == "_id":
+                condition_list.append("id = ?")
+                parameter_list.append(str(value))
+            elif isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                _validate_field_name(field_name)
+                condition_list.append(f"json_extract(document, '$.{field_name}') = ?")
+                parameter_list.append(value)
+
+        return (" WHERE " + " AND ".join(condition_list)) if len(condition_list) > 0 else "", parameter_list
+
+    async def create_index(self, collection_name: str, field_name: str) -> None:
+        _validate_field_name(field_name)
+        self._create_table(collection_name)
+        self._execute(f'CREATE INDEX IF NOT EXISTS "{collection_name}__{field_name}" ON "{collection_name}" (json_extract(document, \'$.{field_name}\'))')
+
+    async def insert_one(self, collection_name: str, document: Dict[str, Any]) -> ObjectId:
+        return (await self.insert_many(collection_name, [document]))[0]
+
+    async def insert_many(self, collection_name: str, document_list: List[Dict[str, Any]]) -> List[ObjectId]:
+        self._create_table(collection_name)
+        object_id_list: List[ObjectId] = [document["_id"] if "_id" in document else ObjectId() for document in document_list]
+        self._execute(f'INSERT INTO "{collection_name}" (id, document) VALUES (?, ?)',
+                      [(str(object_id), json_util.dumps({k: v for k, v in document.items() if k != "_id"}, json_options=json_options)) for object_id, document in zip(object_id_list, document_list)],
+                      is_many=True)
+        return object_id_list
+
+    async def replace_one(self, collection_name: str, object_id: ObjectId, document: Dict[str, Any]) -> None:
+        self._create_table(collection_name)
+        self._execute(f'UPDATE "{collection_name}" SET document = ? WHERE id = ?', (json_util.dumps({k: v for k, v in document.items() if k != "_id"}, json_options=json_options), str(object_id)))
+
+    async def update_one(self, collection_name: str, object_id: ObjectId, document: Dict[str, Any]) -> None:
+        existing_document: Dict[str, Any] | None = next(self._find_synchronously(collection_name, {"_id": object_id}), None)
+        if existing_document is not None:
+            await self.replace_one(collection_name, object_id, {**existing_document, **document})
+
+    async def update_many(self, collection_name: str, update_list: List[Tuple[ObjectId, Dict[str, Any]]]) -> None:
+        self._create_table(collection_name)
+        existing_document_dict: Dict[str, Dict[str, Any]] = {}
+        for start_index in range(0, len(update_list), constants.SQLITE_MAXIMUM_NUMBER_OF_PARAMETERS):
+            object_id_list: List[str] = [str(object_id) for object_id, _ in update_list[start_index:start_index + constants.SQLITE_MAXIMUM_NUMBER_OF_PARAMETERS]]
+            row_list: List[Tuple[Any, ...]] = self._execute(f'SELECT id, document FROM "{collection_name}" WHERE id IN ({", ".join("?" * len(object_id_list))})', tuple(object_id_list))
+            existing_document_dict.update({object_id: json_util.loads(document_string, json_options=json_options) for object_id, document_string in row_list})
+
+        self._execute(f'UPDATE "{collection_name}" SET document = ? WHERE id = ?',
+                      [(json_util.dumps({**existing_document_dict[str(object_id)], **{k: v for k, v in document.items() if k != "_id"}}, json_options=json_options), str(object_id)) for object_id, document in update_list if str(object_id) in existing_document_dict],
+                      is_many=True)
+
+    async def delete_one(self, collection_name: str, object_id: ObjectId) -> None:
+        self._create_table(collection_name)
+        self._execute(f'DELETE FROM "{collection_name}" WHERE id = ?', (str(object_id),))
+
+    def _find_synchronously(self, collection_name: str, query: Dict[str, Any], batch_size: int = 100, projection: List[str] | None = None) -> Iterator[Dict[str, Any]]:
+        self._create_table(collection_name)
+        where_clause, parameter_list = self._get_where_clause(query)
+        offset: int = 0
+
+        while True:
+            row_list: List[Tuple[Any, ...]] = self._execute(f'SELECT id, document FROM "{collection_name}"{where_clause} ORDER BY rowid LIMIT ? OFFSET ?', (*parameter_list, batch_size, offset))
+            for object_id, document_string in row_list:
+                document: Dict[str, Any] = SQLiteStorageEngine._get_document(object_id, document_string)
+                if _is_matching_query(document, query):
+                    yield _get_projected_document(document, projection)
+
+            if len(row_list) < batch_size:
+                break
+            offset = offset + batch_size
+
+    async def find(self, collection_name: str, query: Dict[str, Any], query_limit: int | None = None, projection: List[str] | None = None) -> List[Dict[str, Any]]:
+        document_list: List[Dict[str, Any]] = []
+        for document in self._find_synchronously(collection_name, query, projection=projection):
+            if query_limit is not None and len(document_list) >= query_limit:
+                break
+            document_list.append(document)
+
+        return document_list
+
+    async def find_stream(self, collection_name: str, query: Dict[str, Any], batch_size: int = 100, projection: List[str] | None = None) -> AsyncIterator[Dict[str, Any]]:
+        for document in self._find_synchronously(collection_name, query, batch_size, projection):
+            yield document
+
+    async def drop_collection(self, collection_name: str) -> None:
+        self._execute(f'DROP TABLE IF EXISTS "{collection_name}"')
+
+    async def upload_file(self, file_name: str, chunk_iterable: AsyncIterable[bytes]) -> ObjectId:
+        file_id: ObjectId = ObjectId()
+        chunk_number: int = 0
+
+        try:
+            async for chunk in chunk_iterable:
+                self._execute(f'INSERT INTO "{constants.SQLITE_FILE_CHUNK_TABLE_NAME}" (file_id, chunk_number, data) VALUES (?, ?, ?)', (str(file_id), chunk_number, bytes(chunk)))
+                chunk_number = chunk_number + 1
+        except BaseException:
+            await self.delete_file(file_id)
+            raise
+
+        self._execute(f'INSERT INTO "{constants.SQLITE_FILE_TABLE_NAME}" (file_id, file_name) VALUES (?, ?)', (str(file_id), file_name))
+        return file_id
+
+    async def download_file(self, file_id: ObjectId) -> AsyncIterator[bytes]:
+        if len(self._execute(f'SELECT 1 FROM "{constants.SQLITE_FILE_TABLE_NAME}" WHERE file_id = ?', (str(file_id),))) == 0:
+            raise DatabaseException(f"File not found: {str(file_id)}")
+
+        chunk_number: int = 0
+        while True:
+            row_list: List[Tuple[Any, ...]] = self._execute(f'SELECT data FROM "{constants.SQLITE_FILE_CHUNK_TABLE_NAME}" WHERE file_id = ? AND chunk_number = ?', (str(file_id), chunk_number))
+            if len(row_list) == 0:
+                break
+
+            yield row_list[0][0]
+            chunk_number = chunk_number + 1
+
+    async def delete_file(self, file_id: ObjectId) -> None:
+        self._execute(f'DELETE FROM "{constants.SQLITE_FILE_TABLE_NAME}" WHERE file_id = ?', (str(file_id),))
+        self._execute(f'DELETE FROM "{constants.SQLITE_FILE_CHUNK_TABLE_NAME}" WHERE file_id = ?', (str(file_id),))
@@ -1,10 +1,14 @@
+import asyncio
 import json
+import threading
+import time
+import weakref
 from abc import abstractmethod
 from dataclasses import dataclass
 from typing import Dict, Any, List, cast
 
 import httpx
-from httpx import Response, Cookies, Headers, URL, AsyncClient, Client
+from httpx import Response, Cookies, Headers, URL, AsyncClient, Client, AsyncBaseTransport, Limits
 from pydantic import BaseModel
 
 from sirius import application_performance_monitoring, common
@@ -55,43 +59,114 @@ class HTTPSession:
             raise ServerSideException(error_message, data={"http_response": http_response})
 
 
+class RateLimiter:
+    maximum_requests_per_second: float
+    burst_size: int
+    _next_request_time: float
+    _lock: threading.Lock
+
+    def __init__(self, maximum_requests_per_second: float, burst_size: int = 1) -> None:
+        self.maximum_requests_per_second = maximum_requests_per_second
+        self.burst_size = burst_size
+        self._next_request_time = 0
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        interval_seconds: float = 1 / self.maximum_requests_per_second
+        with self._lock:
+            current_time: float = time.monotonic()
+            self._next_request_time = max(self._next_request_time, current_time - (self.burst_size - 1) * interval_seconds)
+            wait_seconds: float = self._next_request_time - current_time
+            self._next_request_time = self._next_request_time + interval_seconds
+
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+
+
 class AsyncHTTPSession(HTTPSession):
-    client: AsyncClient
+    headers: Dict[str, Any]
+    limits: Limits | None
+    rate_limiter: RateLimiter | None
+    _client_dict: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]"
     _instance_list: List["AsyncHTTPSession"] = []
+    _transport_dict: Dict[str, AsyncBaseTransport] = {}
 
     def __new__(cls, url_str: str, headers: Dict[str, Any] | None = None) -> "AsyncHTTPSession":
         host: str = URL(url_str).host
         instance: AsyncHTTPSession | None = None
 
         for i in cls._instance_list:
-            if i.host == host and (headers is None or common.is_dict_include_another_dict(cast(Dict[str, Any], headers), dict(i.client.headers))):
+            if i.host == host and (headers is None or all(key in i.headers and i.headers[key] == value for key, value in headers.items())):
                 instance = i
 
         if instance is None:
             instance = super().__new__(cls)
             instance.host = host
-            instance.client = httpx.AsyncClient()
+            instance.headers = {} if headers is None else dict(headers)
+            instance.limits = None
+            instance.rate_limiter = None
+            instance._client_dict = weakref.WeakKeyDictionary()
+            cls._instance_list.append(instance)
 
-            if headers is not None:
-                instance.client.headers.update(headers)
+        return instance
 
-            cls._instance_list.append(instance)
+    @property
+    def client(self) -> AsyncClient:
+        event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        client: AsyncClient | None = self._client_dict.get(event_loop)
 
-        if instance.client.is_closed:
-            instance.client = httpx.AsyncClient()
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(transport=AsyncHTTPSession._transport_dict.get(self.host)) if self.limits is None else \
+                httpx.AsyncClient(transport=AsyncHTTPSession._transport_dict.get(self.host), limits=self.limits)
+            client.headers.update(self.headers)
+            self._client_dict[event_loop] = client
 
-        return instance
+        return client
+
+    def set_limits(self, maximum_number_of_connections: int | None = None, maximum_requests_per_second: float | None = None,
+                   burst_size: int = 1) -> None:
+        self.limits = None if maximum_number_of_connections is None else Limits(max_connections=maximum_number_of_connections,
+                                                                               max_keepalive_connections=maximum_number_of_connections)
+        self.rate_limiter = None if maximum_requests_per_second is None else RateLimiter(maximum_requests_per_second, burst_size)
+        self._client_dict = weakref.WeakKeyDictionary()
+
+    async def _acquire(self) -> None:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+    @classmethod
+    def set_transport(cls, url_str: str, transport: AsyncBaseTransport | None) -> None:
+        host: str = URL(url_str).host
+        if transport is None:
+            cls._transport_dict.pop(host, None)
+        else:
+            cls._transport_dict[host] = transport
+
+        for instance in cls._instance_list:
+            if instance.host == host:
+                instance._client_dict = weakref.WeakKeyDictionary()
 
     @application_performance_monitoring.transaction(Operation.HTTP_REQUEST, "GET")
     async def get(self, url: str, query_params: Dict[str, Any] | None = None, headers: Dict[str, Any] | None = None) -> HTTPResponse:
+        await self._acquire()
         http_response: HTTPResponse = HTTPResponse(await self.client.get(url, params=query_params, headers=headers))
         if not http_response.is_successful:
             AsyncHTTPSession.raise_http_exception(http_response)
 
         return http_response
 
+    @application_performance_monitoring.transaction(Operation.HTTP_REQUEST, "GET")
+    async def get_raw(self, url: str, query_params: Dict[str, Any] | None = None, headers: Dict[str, Any] | None = None) -> Response:
+        await self._acquire()
+        response: Response = await self.client.get(url, params=query_params, headers=headers)
+        if not 200 <= response.status_code < 300:
+            AsyncHTTPSession.raise_http_exception(HTTPResponse(response))
+
+        return response
+
     @application_performance_monitoring.transaction(Operation.HTTP_REQUEST, "PUT")
     async def put(self, url: str, data: Dict[str, Any], headers: Dict[str, Any] | None = None) -> HTTPResponse:
+        await self._acquire()
         data_string: str | None = None
         if data is not None:
             data_string = json.dumps(data)
@@ -108,6 +183,7 @@ class AsyncHTTPSession(HTTPSession):
 
     @application_performance_monitoring.transaction(Operation.HTTP_REQUEST, "POST")
     async def post(self, url: str, data: Dict[str, Any] | None = None, headers: Dict[str, Any] | None = None, is_form_url_encoded: bool = False) -> HTTPResponse:
+        await self._acquire()
         data_string: str | None = None
         if data is not None:
             data_string = json.dumps(data)
@@ -124,8 +200,20 @@ class AsyncHTTPSession(HTTPSession):
 
         return http_response
 
+    @application_performance_monitoring.transaction(Operation.HTTP_REQUEST, "PATCH")
+    async def patch(self, url: str, data: Dict[str, Any], headers: Dict[str, Any] | None = None) -> HTTPResponse:
+        await self._acquire()
+        headers = {"content-type": "application/json", **(headers or {})}
+
+        http_response: HTTPResponse = HTTPResponse(await self.client.patch(url, content=json.dumps(data), headers=headers))
+        if not http_response.is_successful:
+            AsyncHTTPSession.raise_http_exception(http_response)
+
+        return http_response
+
     # @application_performance_monitoring.transaction(Operation.HTTP_REQUEST, "DELETE")
     async def delete(self, url: str, headers: Dict[str, Any] | None = None) -> HTTPResponse:
+        await self._acquire()
         http_response: HTTPResponse = HTTPResponse(await self.client.delete(url, headers=headers))
         if not http_response.is_successful:
             AsyncHTTPSession.raise_http_exception(http_response)
@@ -193,6 +281,16 @@ class SyncHTTPSession(HTTPSession):
 
         return http_response
 
+    @application_performance_monitoring.transaction(Operation.HTTP_REQUEST, "PATCH")
+    def patch(self, url: str, data: Dict[str, Any], headers: Dict[str, Any] | None = None) -> HTTPResponse:
+        headers = {"content-type": "application/json", **(headers or {})}
+
+        http_response: HTTPResponse = HTTPResponse(self.client.patch(url, content=json.dumps(data), headers=headers, timeout=60))
+        if not http_response.is_successful:
+            SyncHTTPSession.raise_http_exception(http_response)
+
+        return http_response
+
     @application_performance_monitoring.transaction(Operation.HTTP_REQUEST, "DELETE")
     def delete(self, url: str, headers: Dict[str, Any] | None = None) -> HTTPResponse:
         http_response: HTTPResponse = HTTPResponse(self.client.delete(url, headers=headers, timeout=60))
@@ -1,27 +1,43 @@
+import asyncio
+import bisect
 import datetime
+import itertools
+import json
 import uuid
 from _decimal import Decimal, ROUND_HALF_UP
+from collections import deque
 from enum import Enum, auto
-from typing import List, Dict, Any, Union, cast
+from logging import Logger
+from typing import List, Dict, Any, Union, Tuple, ClassVar, AsyncIterator, Iterator, Deque, Set, Callable, Awaitable, TypeVar, Type, cast, \
+    TYPE_CHECKING
 
+from httpx import Response
 from pydantic import PrivateAttr, Field
 
-from sirius import common
+from sirius import application_performance_monitoring, common
 from sirius.common import DataClass, Currency
-from sirius.communication.discord import AortaTextChannels, get_timestamp_string, \
-    DiscordDefaults
+from sirius.communication.discord import AortaTextChannels, get_timestamp_string, DiscordOutbox
 from sirius.constants import EnvironmentSecret
+from sirius.database import DatabaseDocument
 from sirius.exceptions import OperationNotSupportedException, SDKClientException
-from sirius.http_requests import SyncHTTPSession, HTTPResponse
+from sirius.http_requests import AsyncHTTPSession, HTTPResponse
 from sirius.http_requests.exceptions import HTTPException
+from sirius.scheduler import AsynchronousScheduler
 from sirius.wise import constants
 from sirius.wise.exceptions import CashAccountNotFoundException, ReserveAccountNotFoundException, \
-    RecipientNotFoundException
+    RecipientNotFoundException, WiseAccountNotFoundException
+
+if TYPE_CHECKING:
+    from sirius.wise.analytics import PortfolioValuation
+
+logger: Logger = application_performance_monitoring.get_logger()
+T = TypeVar("T")
 
 
 class WiseAccountType(Enum):
     PRIMARY = auto()
     SECONDARY = auto()
+    REGISTERED = auto()
 
 
 class TransactionType(Enum):
@@ -41,44 +57,203 @@ class WebhookAccountUpdateType(Enum):
 
 class WiseAccount(DataClass):
     type: WiseAccountType
+    name: str | None = None
     personal_profile: "PersonalProfile"
     business_profile: "BusinessProfile"
-    _http_session: SyncHTTPSession = PrivateAttr()
+    _http_session: AsyncHTTPSession = PrivateAttr()
+    _background_refresh_task: asyncio.Task | None = PrivateAttr(None)
 
     @property
-    def http_session(self) -> SyncHTTPSession:
+    def http_session(self) -> AsyncHTTPSession:
         return self._http_session
 
     def _initialize(self) -> None:
+        common.run_coroutine_synchronously(self._initialize_async())
+
+    async def _initialize_async(self) -> None:
         if (self.personal_profile is None and self.business_profile is not None) or (
                 self.personal_profile is not None and self.business_profile is None):
             raise SDKClientException(
                 "One profile has been de-initialized; profile attributes should never be de-initialized in the code")
 
         if self.personal_profile is None or self.business_profile is None:
-            profile_list: List[Profile] = Profile.get_all(self)
-            self.personal_profile = cast(PersonalProfile,
-                                         next(filter(lambda p: p.type.lower() == "personal", profile_list)))
-            self.business_profile = cast(BusinessProfile,
-                                         next(filter(lambda p: p.type.lower() == "business", profile_list)))
+            self._set_profile_list(await Profile.get_all_async(self))
+        else:
+            await asyncio.gather(self.personal_profile._initialize_async(), self.business_profile._initialize_async())
+
+    def _set_profile_list(self, profile_list: List["Profile"]) -> None:
+        self.personal_profile = cast(PersonalProfile, next(filter(lambda p: p.type.lower() == "personal", profile_list)))
+        self.business_profile = cast(BusinessProfile, next(filter(lambda p: p.type.lower() == "business", profile_list)))
+
+    def get_valuation(self, base_currency: Currency) -> "PortfolioValuation":
+        return common.run_coroutine_synchronously(self.get_valuation_async(base_currency))
+
+    async def get_valuation_async(self, base_currency: Currency) -> "PortfolioValuation":
+        from sirius.wise.analytics import PortfolioValuation
+        return await PortfolioValuation.get_async(self, base_currency)
+
+    def reconcile_balances(self) -> List["Account"]:
+        return common.run_coroutine_synchronously(self.reconcile_balances_async())
+
+    async def reconcile_balances_async(self) -> List["Account"]:
+        drifted_account_list_list: Tuple[List[Account], List[Account]] = await asyncio.gather(self.personal_profile.reconcile_balances_async(),
+                                                                            self.business_profile.reconcile_balances_async())
+        return list(itertools.chain.from_iterable(drifted_account_list_list))
+
+    async def schedule_balance_reconciliation(self, **kwargs: Any) -> None:
+        if len(kwargs) == 0:
+            kwargs["minute"] = constants.BALANCE_RECONCILIATION_CRON_MINUTE
+
+        await AsynchronousScheduler.add_job(self.reconcile_balances_async, **kwargs)
+
+    @staticmethod
+    def get(wise_account_type: WiseAccountType, is_lazy: bool = False) -> "WiseAccount":
+        return common.run_coroutine_synchronously(WiseAccount.get_async(wise_account_type, is_lazy))
+
+    @staticmethod
+    async def get_async(wise_account_type: WiseAccountType, is_lazy: bool = False) -> "WiseAccount":
+        wise_account: WiseAccount = WiseAccount._construct(wise_account_type)
+        if is_lazy:
+            wise_account._set_profile_list(await Profile.get_all_async(wise_account, True))
         else:
-            self.personal_profile._initialize()
-            self.business_profile._initialize()
+            await wise_account._initialize_async()
+
+        WiseAccount.model_validate(wise_account)
+        return wise_account
 
     @staticmethod
-    def get(wise_account_type: WiseAccountType) -> "WiseAccount":
-        environmental_variable: EnvironmentSecret = EnvironmentSecret.WISE_PRIMARY_ACCOUNT_API_KEY if wise_account_type == WiseAccountType.PRIMARY else EnvironmentSecret.WISE_SECONDARY_ACCOUNT_API_KEY
-        http_session: SyncHTTPSession = SyncHTTPSession(constants.URL, {
-            "Authorization": f"Bearer {common.get_environmental_secret(environmental_variable)}"})
+    def _construct(wise_account_type: WiseAccountType, api_key: str | None = None) -> "WiseAccount":
+        if api_key is None:
+            if wise_account_type == WiseAccountType.PRIMARY:
+                api_key = common.get_environmental_secret(EnvironmentSecret.WISE_PRIMARY_ACCOUNT_API_KEY)
+            elif wise_account_type == WiseAccountType.SECONDARY:
+                api_key = common.get_environmental_secret(EnvironmentSecret.WISE_SECONDARY_ACCOUNT_API_KEY)
+            else:
+                raise SDKClientException(f"An API key is required to construct a Wise account of type: {wise_account_type.name}")
+
+        http_session: AsyncHTTPSession = AsyncHTTPSession(constants.URL, {"Authorization": f"Bearer {api_key}"})
 
         wise_account: WiseAccount = WiseAccount.model_construct(type=wise_account_type, personal_profile=None,
                                                                 business_profile=None)
         wise_account._http_session = http_session
-        wise_account._initialize()
+        return wise_account
 
-        WiseAccount.model_validate(wise_account)
+    def get_snapshot_data(self) -> Dict[str, Any]:
+        return {"profile_list": [self.personal_profile._get_snapshot_data(), self.business_profile._get_snapshot_data()]}
+
+    @staticmethod
+    def from_snapshot_data(wise_account_type: WiseAccountType, snapshot_data: Dict[str, Any], api_key: str | None = None) -> "WiseAccount":
+        wise_account: WiseAccount = WiseAccount._construct(wise_account_type, api_key)
+        wise_account._set_profile_list([Profile._from_snapshot_data(wise_account, profile_data) for profile_data in snapshot_data["profile_list"]])
+        return wise_account
+
+    def save_snapshot(self) -> None:
+        common.run_coroutine_synchronously(self.save_snapshot_async())
+
+    async def save_snapshot_async(self) -> None:
+        wise_account_snapshot_list: List[DatabaseDocument] = await WiseAccountSnapshot.find_by_query(WiseAccountSnapshot(wise_account_type=self.type.name))
+        wise_account_snapshot: WiseAccountSnapshot = cast(WiseAccountSnapshot, wise_account_snapshot_list[0]) if len(wise_account_snapshot_list) > 0 else WiseAccountSnapshot(wise_account_type=self.type.name)
+        wise_account_snapshot.data = self.get_snapshot_data()
+        await wise_account_snapshot.save()
+
+    @staticmethod
+    def get_from_snapshot(wise_account_type: WiseAccountType, api_key: str | None = None) -> "WiseAccount":
+        return common.run_coroutine_synchronously(WiseAccount.get_from_snapshot_async(wise_account_type, api_key))
+
+    @staticmethod
+    async def get_from_snapshot_async(wise_account_type: WiseAccountType, api_key: str | None = None) -> "WiseAccount":
+        wise_account_snapshot_list: List[DatabaseDocument] = await WiseAccountSnapshot.find_by_query(WiseAccountSnapshot(wise_account_type=wise_account_type.name))
+        if len(wise_account_snapshot_list) == 0:
+            wise_account: WiseAccount = WiseAccount._construct(wise_account_type, api_key)
+            await wise_account._initialize_async()
+            WiseAccount.model_validate(wise_account)
+            await wise_account.save_snapshot_async()
+            return wise_account
+
+        wise_account = WiseAccount.from_snapshot_data(wise_account_type, cast(Dict[str, Any], cast(WiseAccountSnapshot, wise_account_snapshot_list[0]).data), api_key)
+        wise_account._background_refresh_task = asyncio.ensure_future(wise_account._refresh_from_snapshot_async())
+        return wise_account
+
+    def wait_for_background_refresh(self) -> None:
+        common.run_coroutine_synchronously(self.wait_for_background_refresh_async())
+
+    async def wait_for_background_refresh_async(self) -> None:
+        if self._background_refresh_task is not None:
+            await self._background_refresh_task
+
+    async def _refresh_from_snapshot_async(self) -> None:
+        await self._initialize_async()
+        await self.save_snapshot_async()
+
+
+class WiseAccountRegistry(DataClass):
+    wise_account_dict: Dict[str, WiseAccount] = {}
+
+    @property
+    def name_list(self) -> List[str]:
+        return list(self.wise_account_dict.keys())
+
+    def get(self, name: str) -> WiseAccount:
+        if name not in self.wise_account_dict:
+            raise WiseAccountNotFoundException(f"Wise account is not registered: {name}")
+
+        return self.wise_account_dict[name]
+
+    def register(self, name: str, api_key: str, is_lazy: bool = True,
+                 maximum_number_of_connections: int | None = constants.REGISTERED_ACCOUNT_MAXIMUM_NUMBER_OF_CONNECTIONS,
+                 maximum_requests_per_second: float | None = constants.REGISTERED_ACCOUNT_MAXIMUM_REQUESTS_PER_SECOND) -> WiseAccount:
+        return common.run_coroutine_synchronously(self.register_async(name, api_key, is_lazy, maximum_number_of_connections, maximum_requests_per_second))
+
+    async def register_async(self, name: str, api_key: str, is_lazy: bool = True,
+                             maximum_number_of_connections: int | None = constants.REGISTERED_ACCOUNT_MAXIMUM_NUMBER_OF_CONNECTIONS,
+                             maximum_requests_per_second: float | None = constants.REGISTERED_ACCOUNT_MAXIMUM_REQUESTS_PER_SECOND) -> WiseAccount:
+        wise_account: WiseAccount = WiseAccount._construct(WiseAccountType.REGISTERED, api_key)
+        wise_account.name = name
+        wise_account.http_session.set_limits(maximum_number_of_connections, maximum_requests_per_second)
+
+        wise_account._set_profile_list(await Profile.get_all_async(wise_account, is_lazy))
+        self.wise_account_dict[name] = wise_account
+        return wise_account
+
+    def register_all(self, api_key_dict: Dict[str, str], is_lazy: bool = True) -> List[WiseAccount]:
+        return common.run_coroutine_synchronously(self.register_all_async(api_key_dict, is_lazy))
+
+    async def register_all_async(self, api_key_dict: Dict[str, str], is_lazy: bool = True) -> List[WiseAccount]:
+        return list(await asyncio.gather(*[self.register_async(name, api_key, is_lazy) for name, api_key in api_key_dict.items()]))
+
+    def unregister(self, name: str) -> WiseAccount:
+        wise_account: WiseAccount = self.get(name)
+        self.wise_account_dict.pop(name)
         return wise_account
 
+    async def map_async(self, function: Callable[[WiseAccount], Awaitable[T]]) -> Dict[str, T]:
+        result_list: List[T] = await asyncio.gather(*[function(wise_account) for wise_account in self.wise_account_dict.values()])
+        return dict(zip(self.wise_account_dict.keys(), result_list))
+
+    def get_account_list_dict(self) -> Dict[str, List["Account"]]:
+        return common.run_coroutine_synchronously(self.get_account_list_dict_async())
+
+    async def get_account_list_dict_async(self) -> Dict[str, List["Account"]]:
+        return await self.map_async(WiseAccountRegistry._get_account_list_async)
+
+    def reconcile_balances(self) -> Dict[str, List["Account"]]:
+        return common.run_coroutine_synchronously(self.reconcile_balances_async())
+
+    async def reconcile_balances_async(self) -> Dict[str, List["Account"]]:
+        return await self.map_async(lambda wise_account: wise_account.reconcile_balances_async())
+
+    async def schedule_balance_reconciliation(self, **kwargs: Any) -> None:
+        for i, wise_account in enumerate(self.wise_account_dict.values()):
+            await wise_account.schedule_balance_reconciliation(**{"minute": constants.BALANCE_RECONCILIATION_CRON_MINUTE,
+                                                                   "second": (i * constants.REGISTERED_ACCOUNT_SCHEDULE_STAGGER_SECONDS) % 60,
+                                                                   **kwargs})
+
+    @staticmethod
+    async def _get_account_list_async(wise_account: WiseAccount) -> List["Account"]:
+        profile_list: List[Profile] = [wise_account.personal_profile, wise_account.business_profile]
+        await asyncio.gather(*[profile.load_async(["cash_account_list", "reserve_account_list"]) for profile in profile_list])
+        return list(itertools.chain.from_iterable(profile.cash_account_list + profile.reserve_account_list for profile in profile_list))  # type: ignore[operator]
+
 
 class Profile(DataClass):
     id: int
@@ -88,119 +263,351 @@ class Profile(DataClass):
     recipient_list: List["Recipient"] | None = None
     debit_card_list: List["DebitCard"] | None = None
     wise_account: WiseAccount = Field(exclude=True)
+    _cash_account_by_id_dict: Dict[int, "CashAccount"] = PrivateAttr(default_factory=dict)
+    _cash_account_by_currency_dict: Dict[Currency, "CashAccount"] = PrivateAttr(default_factory=dict)
+    _reserve_account_by_id_dict: Dict[int, "ReserveAccount"] = PrivateAttr(default_factory=dict)
+    _reserve_account_by_name_and_currency_dict: Dict[Tuple[str | None, Currency], "ReserveAccount"] = PrivateAttr(default_factory=dict)
+    _recipient_by_id_dict: Dict[int, "Recipient"] = PrivateAttr(default_factory=dict)
+    _recipient_by_account_number_dict: Dict[str, "Recipient"] = PrivateAttr(default_factory=dict)
+    _quote_cache: "QuoteCache" = PrivateAttr(default_factory=lambda: QuoteCache())
+    _unloaded_field_set: Set[str] = PrivateAttr(default_factory=set)
+    _load_task_dict: Dict[str, asyncio.Task] = PrivateAttr(default_factory=dict)
+    lazy_field_list: ClassVar[List[str]] = ["cash_account_list", "reserve_account_list", "recipient_list", "debit_card_list"]
+
+    def __getattr__(self, name: str) -> Any:
+        if name in Profile.lazy_field_list and name in self._unloaded_field_set:
+            self.load([name])
+            return self.__dict__[name]
+
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    @property
+    def is_partially_loaded(self) -> bool:
+        return len(self._unloaded_field_set) > 0
+
+    def load(self, field_name_list: List[str] | None = None) -> None:
+        unloaded_field_name_list: List[str] = [field_name for field_name in field_name_list or Profile.lazy_field_list if field_name in self._unloaded_field_set]
+        if len(unloaded_field_name_list) == 0:
+            return
+
+        if common.is_event_loop_running():
+            raise SDKClientException(f"Cannot lazily load a field from within a running event loop; call 'await load_async()' first\n"
+                                     f"Profile ID: {self.id}\n"
+                                     f"Fields: {', '.join(unloaded_field_name_list)}")
+
+        common.run_coroutine_synchronously(self.load_async(unloaded_field_name_list))
+
+    async def load_async(self, field_name_list: List[str] | None = None) -> None:
+        field_name_list = Profile.lazy_field_list if field_name_list is None else field_name_list
+        await asyncio.gather(*[self._load_field_async(field_name) for field_name in field_name_list if field_name in self._unloaded_field_set])
+
+    async def _load_field_async(self, field_name: str) -> None:
+        load_task: asyncio.Task | None = self._load_task_dict.get(field_name)
+        if load_task is None or load_task.get_loop() is not asyncio.get_running_loop():
+            load_task = asyncio.ensure_future(self._get_field_value_async(field_name))
+            self._load_task_dict[field_name] = load_task
+
+        try:
+            field_value: List[Any] = await load_task
+        finally:
+            self._load_task_dict.pop(field_name, None)
+
+        if field_name in self._unloaded_field_set:
+            self.__dict__[field_name] = field_value
+            self._unloaded_field_set.discard(field_name)
+            self._rebuild_indexes()
+
+    async def _get_field_value_async(self, field_name: str) -> List[Any]:
+        if field_name == "cash_account_list":
+            return await CashAccount.get_all_async(self)
+        elif field_name == "reserve_account_list":
+            return await ReserveAccount.get_all_async(self)
+        elif field_name == "recipient_list":
+            return await Recipient.get_all_async(self)
+
+        return await DebitCard.get_all_async(self)
+
+    def _unload(self) -> None:
+        for field_name in Profile.lazy_field_list:
+            self.__dict__.pop(field_name, None)
+            self._unloaded_field_set.add(field_name)
 
     @property
-    def http_session(self) -> SyncHTTPSession:
+    def http_session(self) -> AsyncHTTPSession:
         return self.wise_account.http_session
 
+    @property
+    def quote_cache(self) -> "QuoteCache":
+        return self._quote_cache
+
+    def get_exchange_rate(self, from_currency: Currency, to_currency: Currency) -> Decimal:
+        exchange_rate: Decimal | None = self.quote_cache.get_exchange_rate(from_currency, to_currency)
+        return common.run_coroutine_synchronously(self.get_exchange_rate_async(from_currency, to_currency)) if exchange_rate is None else exchange_rate
+
+    async def get_exchange_rate_async(self, from_currency: Currency, to_currency: Currency) -> Decimal:
+        exchange_rate: Decimal | None = self.quote_cache.get_exchange_rate(from_currency, to_currency)
+        if exchange_rate is not None:
+            return exchange_rate
+
+        response: HTTPResponse = await self.http_session.get(constants.ENDPOINT__RATE__GET, query_params={
+            "source": from_currency.value,
+            "target": to_currency.value
+        })
+        exchange_rate = Decimal(str(response.data[0]["rate"]))
+        self.quote_cache.put_exchange_rate(from_currency, to_currency, exchange_rate, Profile._get_exchange_rate_expiration_time())
+        return exchange_rate
+
+    def get_exchange_rate_dict(self, from_currency_list: List[Currency], to_currency: Currency) -> Dict[Currency, Decimal]:
+        return common.run_coroutine_synchronously(self.get_exchange_rate_dict_async(from_currency_list, to_currency))
+
+    async def get_exchange_rate_dict_async(self, from_currency_list: List[Currency], to_currency: Currency) -> Dict[Currency, Decimal]:
+        if any(self.quote_cache.get_exchange_rate(from_currency, to_currency) is None for from_currency in from_currency_list):
+            response: HTTPResponse = await self.http_session.get(constants.ENDPOINT__RATE__GET)
+            currency_value_set: Set[str] = {currency.value for currency in Currency}
+            expiration_time: datetime.datetime = Profile._get_exchange_rate_expiration_time()
+
+            for data in response.data:
+                if data["source"] in currency_value_set and data["target"] in currency_value_set:
+                    self.quote_cache.put_exchange_rate(Currency(data["source"]), Currency(data["target"]), Decimal(str(data["rate"])), expiration_time)
+
+        exchange_rate_list: List[Decimal] = await asyncio.gather(*[self.get_exchange_rate_async(from_currency, to_currency) for from_currency in from_currency_list])
+        return dict(zip(from_currency_list, exchange_rate_list))
+
+    @staticmethod
+    def _get_exchange_rate_expiration_time() -> datetime.datetime:
+        return datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=constants.EXCHANGE_RATE_CACHE_TTL_SECONDS + constants.QUOTE_EXPIRY_MARGIN_SECONDS)
+
     def _initialize(self) -> None:
-        cash_account_to_update_list: List["CashAccount"] = CashAccount.get_all(self)
-        reserve_account_to_update_list: List["ReserveAccount"] = ReserveAccount.get_all(self)
-        recipient_to_update_list: List["Recipient"] = Recipient.get_all(self)
+        common.run_coroutine_synchronously(self._initialize_async())
+
+    async def _initialize_async(self) -> None:
+        cash_account_to_update_list, reserve_account_to_update_list, recipient_to_update_list = await asyncio.gather(
+            CashAccount.get_all_async(self), ReserveAccount.get_all_async(self), Recipient.get_all_async(self))
+
+        self._set_or_reconcile_list("cash_account_list", cash_account_to_update_list)
+        self._set_or_reconcile_list("reserve_account_list", reserve_account_to_update_list)
+        self._set_or_reconcile_list("recipient_list", recipient_to_update_list)
+        self._rebuild_indexes()
+
+    async def reconcile_balances_async(self) -> List["Account"]:
+        cash_account_to_update_list, reserve_account_to_update_list = await asyncio.gather(
+            CashAccount.get_all_async(self), ReserveAccount.get_all_async(self))
+        drifted_account_list: List[Account] = []
+
+        account_pair_list: List[Tuple[List[Any] | None, List[Any]]] = [(self.__dict__.get("cash_account_list"), cash_account_to_update_list),
+                                                                       (self.__dict__.get("reserve_account_list"), reserve_account_to_update_list)]
+        for account_list, account_to_update_list in account_pair_list:
+            account_by_id_dict: Dict[int, Account] = {account.id: account for account in account_list or []}
+            for account_to_update in account_to_update_list:
+                account: Account | None = account_by_id_dict.get(account_to_update.id)
+                if account is None or account.balance == account_to_update.balance:
+                    continue
+
+                if account._balance_timestamp is None or account_to_update._balance_timestamp is None or account._balance_timestamp <= account_to_update._balance_timestamp:
+                    drifted_account_list.append(account)
+
+        self._set_or_reconcile_list("cash_account_list", cash_account_to_update_list)
+        self._set_or_reconcile_list("reserve_account_list", reserve_account_to_update_list)
+        self._rebuild_indexes()
+        return drifted_account_list
+
+    def _set_or_reconcile_list(self, field_name: str, new_list: List[Any]) -> None:
+        original_list: List[Any] | None = self.__dict__.get(field_name)
+        self.__dict__[field_name] = new_list if original_list is None else Profile._reconcile_list(original_list, new_list)
+        self._unloaded_field_set.discard(field_name)
 
-        if self.cash_account_list is None:
-            self.cash_account_list = cash_account_to_update_list
-        else:
-            for original_cash_account in self.cash_account_list:
-                try:
-                    new_cash_account: CashAccount = next(
-                        filter(lambda c: (c.id == original_cash_account.id), cash_account_to_update_list))
-                    original_cash_account.__dict__.update(new_cash_account.model_dump())
-                    cash_account_to_update_list.remove(new_cash_account)
-                except StopIteration:
-                    self.cash_account_list.remove(original_cash_account)
+    @staticmethod
+    def _reconcile_list(original_list: List[Any], new_list: List[Any]) -> List[Any]:
+        new_item_by_id_dict: Dict[int, Any] = {new_item.id: new_item for new_item in new_list}
+        reconciled_list: List[Any] = []
 
-            [self.cash_account_list.append(new_cash_account) for new_cash_account in cash_account_to_update_list]  # type: ignore[func-returns-value]
+        for original_item in original_list:
+            new_item: Any = new_item_by_id_dict.pop(original_item.id, None)
+            if new_item is None:
+                continue
 
-        if self.reserve_account_list is None:
-            self.reserve_account_list = reserve_account_to_update_list
-        else:
-            for original_reserve_account in self.reserve_account_list:
-                try:
-                    new_reserve_account: ReserveAccount = next(
-                        filter(lambda r: (r.id == original_reserve_account.id), reserve_account_to_update_list))
-                    original_reserve_account.__dict__.update(new_reserve_account.model_dump())
-                    reserve_account_to_update_list.remove(new_reserve_account)
-                except StopIteration:
-                    self.reserve_account_list.remove(original_reserve_account)
+            if isinstance(original_item, Account):
+                original_item._reconcile(new_item)
+            else:
+                original_item.__dict__.update(new_item.__dict__)
+            reconciled_list.append(original_item)
+
+        reconciled_list.extend(new_item_by_id_dict.values())
+        return reconciled_list
+
+    def _rebuild_indexes(self) -> None:
+        cash_account_by_id_dict: Dict[int, CashAccount] = {}
+        cash_account_by_currency_dict: Dict[Currency, CashAccount] = {}
+        reserve_account_by_id_dict: Dict[int, ReserveAccount] = {}
+        reserve_account_by_name_and_currency_dict: Dict[Tuple[str | None, Currency], ReserveAccount] = {}
+        recipient_by_id_dict: Dict[int, Recipient] = {}
+        recipient_by_account_number_dict: Dict[str, Recipient] = {}
+
+        for cash_account in self.__dict__.get("cash_account_list") or []:
+            cash_account_by_id_dict[cash_account.id] = cash_account
+            cash_account_by_currency_dict.setdefault(cash_account.currency, cash_account)
+
+        for reserve_account in self.__dict__.get("reserve_account_list") or []:
+            reserve_account_by_id_dict[reserve_account.id] = reserve_account
+            reserve_account_by_name_and_currency_dict.setdefault((reserve_account.name, reserve_account.currency), reserve_account)
+
+        for recipient in self.__dict__.get("recipient_list") or []:
+            recipient_by_id_dict[recipient.id] = recipient
+            recipient_by_account_number_dict.setdefault(recipient.account_number, recipient)
+
+        self._cash_account_by_id_dict = cash_account_by_id_dict
+        self._cash_account_by_currency_dict = cash_account_by_currency_dict
+        self._reserve_account_by_id_dict = reserve_account_by_id_dict
+        self._reserve_account_by_name_and_currency_dict = reserve_account_by_name_and_currency_dict
+        self._recipient_by_id_dict = recipient_by_id_dict
+        self._recipient_by_account_number_dict = recipient_by_account_number_dict
+
+    def _add_account(self, account: "Account") -> None:
+        field_name: str = "cash_account_list" if isinstance(account, CashAccount) else "reserve_account_list"
+        self.__dict__[field_name] = [*(self.__dict__.get(field_name) or []), account]
+        self._rebuild_indexes()
+
+    def _remove_account(self, account: "Account") -> None:
+        field_name: str = "cash_account_list" if isinstance(account, CashAccount) else "reserve_account_list"
+        account_list: List[Any] | None = self.__dict__.get(field_name)
+        if account_list is not None and account in account_list:
+            self.__dict__[field_name] = [item for item in account_list if item is not account]
+
+        self._rebuild_indexes()
 
-            [self.reserve_account_list.append(new_reserve_account) for new_reserve_account in reserve_account_to_update_list]  # type: ignore[func-returns-value]
+    def get_cash_account(self, currency: Currency, is_create_if_unavailable: bool = False) -> "CashAccount":
+        self.load(["cash_account_list"])
+        cash_account: CashAccount | None = self._cash_account_by_currency_dict.get(currency)
+        if cash_account is not None:
+            return cash_account
 
-        if self.recipient_list is None:
-            self.recipient_list = recipient_to_update_list
+        if is_create_if_unavailable:
+            return CashAccount.open(self, currency)
         else:
-            for original_recipient in self.recipient_list:
-                try:
-                    new_recipient: Recipient = next(
-                        filter(lambda r: (r.id == original_recipient.id), recipient_to_update_list))
-                    original_recipient.__dict__.update(new_recipient.model_dump())
-                    recipient_to_update_list.remove(new_recipient)
-                except StopIteration:
-                    self.recipient_list.remove(original_recipient)
+            raise CashAccountNotFoundException(f"Currency not found: \n"
+                                               f"Profile: {self.__class__.__name__}"
+                                               f"Currency: {currency.value}")
 
-            [self.recipient_list.append(new_recipient) for new_recipient in recipient_to_update_list]  # type: ignore[func-returns-value]
+    async def get_cash_account_async(self, currency: Currency, is_create_if_unavailable: bool = False) -> "CashAccount":
+        await self.load_async(["cash_account_list"])
+        if is_create_if_unavailable and currency not in self._cash_account_by_currency_dict:
+            return await CashAccount.open_async(self, currency)
 
-    def get_cash_account(self, currency: Currency, is_create_if_unavailable: bool = False) -> "CashAccount":
+        return self.get_cash_account(currency)
+
+    def get_cash_account_by_id(self, cash_account_id: int) -> "CashAccount":
+        self.load(["cash_account_list"])
         try:
-            return next(filter(lambda c: c.currency == currency, self.cash_account_list))
-        except StopIteration:
-            if is_create_if_unavailable:
-                return CashAccount.open(self, currency)
-            else:
-                raise CashAccountNotFoundException(f"Currency not found: \n"
-                                                   f"Profile: {self.__class__.__name__}"
-                                                   f"Currency: {currency.value}")
+            return self._cash_account_by_id_dict[cash_account_id]
+        except KeyError:
+            raise CashAccountNotFoundException(f"Cash account not found: \n"
+                                               f"Profile: {self.__class__.__name__}"
+                                               f"Cash Account ID: {cash_account_id}")
 
     def get_reserve_account(self, account_name: str, currency: Currency,
                             is_create_if_unavailable: bool = False) -> "ReserveAccount":
+        self.load(["reserve_account_list"])
+        reserve_account: ReserveAccount | None = self._reserve_account_by_name_and_currency_dict.get((account_name, currency))
+        if reserve_account is not None:
+            return reserve_account
 
+        if is_create_if_unavailable:
+            return ReserveAccount.open(self, account_name, currency)
+        else:
+            raise ReserveAccountNotFoundException(f"Currency not found: \n"
+                                                  f"Profile: {self.__class__.__name__}"
+                                                  f"Reserve Account Name: {account_name}")
+
+    async def get_reserve_account_async(self, account_name: str, currency: Currency,
+                                        is_create_if_unavailable: bool = False) -> "ReserveAccount":
+        await self.load_async(["reserve_account_list"])
+        if is_create_if_unavailable and (account_name, currency) not in self._reserve_account_by_name_and_currency_dict:
+            return await ReserveAccount.open_async(self, account_name, currency)
+
+        return self.get_reserve_account(account_name, currency)
+
+    def get_reserve_account_by_id(self, reserve_account_id: int) -> "ReserveAccount":
+        self.load(["reserve_account_list"])
         try:
-            return next(filter(lambda r: r.name == account_name and r.currency == currency, self.reserve_account_list))
-        except StopIteration:
-            if is_create_if_unavailable:
-                return ReserveAccount.open(self, account_name, currency)
-            else:
-                raise ReserveAccountNotFoundException(f"Currency not found: \n"
-                                                      f"Profile: {self.__class__.__name__}"
-                                                      f"Reserve Account Name: {account_name}")
+            return self._reserve_account_by_id_dict[reserve_account_id]
+        except KeyError:
+            raise ReserveAccountNotFoundException(f"Reserve account not found: \n"
+                                                  f"Profile: {self.__class__.__name__}"
+                                                  f"Reserve Account ID: {reserve_account_id}")
 
     def get_recipient(self, account_number: str) -> "Recipient":
-
+        self.load(["recipient_list"])
         try:
-            return next(filter(lambda r: r.account_number == account_number, self.recipient_list))
-        except StopIteration:
+            return self._recipient_by_account_number_dict[account_number]
+        except KeyError:
             raise RecipientNotFoundException(f"Recipient not found: \n"
                                              f"Profile: {self.__class__.__name__}"
                                              f"Account Number: {account_number}")
 
+    def get_recipient_by_id(self, recipient_id: int) -> "Recipient":
+        self.load(["recipient_list"])
+        try:
+            return self._recipient_by_id_dict[recipient_id]
+        except KeyError:
+            raise RecipientNotFoundException(f"Recipient not found: \n"
+                                             f"Profile: {self.__class__.__name__}"
+                                             f"Recipient ID: {recipient_id}")
+
     @common.only_in_dev
-    def _complete_all_transfers(self) -> None:
-        for cash_account in self.cash_account_list:
-            http_response: HTTPResponse = self.http_session.get(
-                f"{constants.ENDPOINT__TRANSFER__GET_ALL.replace('$profileId', str(self.id))}&status=processing&createdDateStart=2021-01-01&limit=200")
-            [cash_account._simulate_completed_transfer(data["id"]) for data in http_response.data]
+    async def _complete_all_transfers(self) -> None:
+        await TransferStatusTracker(profile=self).complete_all_async()
 
     @staticmethod
     def get_all(wise_account: WiseAccount) -> List["Profile"]:
-        http_response: HTTPResponse = wise_account.http_session.get(constants.ENDPOINT__PROFILE__GET_ALL)
-        profile_list: List["Profile"] = []
+        return common.run_coroutine_synchronously(Profile.get_all_async(wise_account))
 
-        for data in http_response.data:
-            profile: Profile = Profile(id=data["id"], type=data["type"], wise_account=wise_account)
-            profile._initialize()
-            profile_list.append(profile)
+    @staticmethod
+    async def get_all_async(wise_account: WiseAccount, is_lazy: bool = False) -> List["Profile"]:
+        http_response: HTTPResponse = await wise_account.http_session.get(constants.ENDPOINT__PROFILE__GET_ALL)
+        profile_list: List["Profile"] = [Profile(id=data["id"], type=data["type"], wise_account=wise_account) for data in http_response.data]
+        if is_lazy:
+            for profile in profile_list:
+                profile._unload()
+        else:
+            await asyncio.gather(*[profile._initialize_async() for profile in profile_list])
 
         return profile_list
 
+    def _get_snapshot_data(self) -> Dict[str, Any]:
+        snapshot_data: Dict[str, Any] = {"id": self.id, "type": self.type}
+        for field_name in Profile.lazy_field_list:
+            item_list: List[Any] | None = self.__dict__.get(field_name)
+            snapshot_data[field_name] = None if item_list is None else [item._get_snapshot_data() if isinstance(item, Account) else item.model_dump(mode="json", exclude={"profile"})
+                                                                        for item in item_list]
+
+        return snapshot_data
+
+    @staticmethod
+    def _from_snapshot_data(wise_account: WiseAccount, snapshot_data: Dict[str, Any]) -> "Profile":
+        profile: Profile = Profile(id=snapshot_data["id"], type=snapshot_data["type"], wise_account=wise_account)
+        profile._unload()
+
+        item_class_list: List[Tuple[str, Type[DataClass]]] = [("cash_account_list", CashAccount), ("reserve_account_list", ReserveAccount), ("recipient_list", Recipient), ("debit_card_list", DebitCard)]
+        for field_name, item_class in item_class_list:
+            if snapshot_data.get(field_name) is not None:
+                profile.__dict__[field_name] = [item_class._from_snapshot_data(profile, item_data) if issubclass(item_class, Account) else item_class.model_validate({**item_data, "profile": profile})
+                                                for item_data in snapshot_data[field_name]]
+                profile._unloaded_field_set.discard(field_name)
+
+        profile._rebuild_indexes()
+        return profile
+
     @common.only_in_dev
     async def _reset(self) -> None:
-        self._complete_all_transfers()
+        await self._complete_all_transfers()
+        await self.load_async(["cash_account_list", "reserve_account_list"])
 
-        for reserve_account in self.reserve_account_list:
+        for reserve_account in list(self.reserve_account_list):
             await reserve_account._set_balance(Decimal("0"))
-            reserve_account.close()
+            await reserve_account.close_async()
 
-        [await cash_account._set_balance(Decimal("0")) for cash_account in self.cash_account_list]
+        for cash_account in self.cash_account_list:
+            await cash_account._set_balance(Decimal("0"))
 
 
 class PersonalProfile(Profile):
@@ -213,6 +620,7 @@ class BusinessProfile(Profile):
 
 class Transaction(DataClass):
     id: int | None
+    reference_number: str | None = None
     account: "Account" = Field(exclude=True)
     timestamp: datetime.datetime
     type: TransactionType
@@ -227,33 +635,142 @@ class Account(DataClass):
     currency: Currency
     balance: Decimal
     profile: Profile = Field(exclude=True)
+    _transaction_store: "TransactionStore | None" = PrivateAttr(None)
+    _balance_timestamp: datetime.datetime | None = PrivateAttr(None)
+
+    @property
+    def balance_timestamp(self) -> datetime.datetime | None:
+        return self._balance_timestamp
+
+    def apply_balance_update(self, balance: Decimal, timestamp: datetime.datetime | None) -> bool:
+        if timestamp is not None and self._balance_timestamp is not None and timestamp < self._balance_timestamp:
+            return False
+
+        self.balance = balance
+        self._balance_timestamp = self._balance_timestamp if timestamp is None else timestamp
+        return True
+
+    def _apply_balance_delta(self, amount: Decimal, timestamp: datetime.datetime | None) -> None:
+        self.balance = self.balance + amount
+        if timestamp is not None and (self._balance_timestamp is None or timestamp > self._balance_timestamp):
+            self._balance_timestamp = timestamp
+
+    def _reconcile(self, account: "Account") -> None:
+        balance: Decimal = self.balance
+        self.__dict__.update({key: value for key, value in account.__dict__.items() if key != "balance"})
+        self.balance = balance
+        self.apply_balance_update(account.balance, account._balance_timestamp)
+
+    @staticmethod
+    def _get_modification_timestamp(data: Dict[str, Any]) -> datetime.datetime | None:
+        return None if data.get("modificationTime") is None else datetime.datetime.fromisoformat(data["modificationTime"]).replace(microsecond=0)
+
+    def _get_snapshot_data(self) -> Dict[str, Any]:
+        return {**self.model_dump(mode="json"),
+                "balance_timestamp": None if self._balance_timestamp is None else self._balance_timestamp.isoformat()}
+
+    @classmethod
+    def _from_snapshot_data(cls, profile: Profile, snapshot_data: Dict[str, Any]) -> "Account":
+        account: Account = cls.model_validate({**snapshot_data, "profile": profile})
+        account._balance_timestamp = None if snapshot_data.get("balance_timestamp") is None else datetime.datetime.fromisoformat(snapshot_data["balance_timestamp"])
+        return account
 
     @property
-    def http_session(self) -> SyncHTTPSession:
+    def http_session(self) -> AsyncHTTPSession:
         return self.profile.http_session
 
-    def close(self) -> None:
+    @property
+    def transaction_store(self) -> "TransactionStore":
+        if self._transaction_store is None:
+            self._transaction_store = TransactionStore(account=self)
+
+        return self._transaction_store
+
+    def refresh(self) -> None:
+        common.run_coroutine_synchronously(self.refresh_async())
+
+    async def refresh_async(self) -> None:
+        response: HTTPResponse = await self.http_session.get(
+            constants.ENDPOINT__BALANCE__GET.replace("$profileId", str(self.profile.id)).replace("$balanceId",
+                                                                                                 str(self.id)))
+        self.apply_balance_update(Decimal(str(response.data["cashAmount"]["value"])), Account._get_modification_timestamp(response.data))
+
+    def close(self, is_full_refresh: bool = False) -> None:
+        common.run_coroutine_synchronously(self.close_async(is_full_refresh))
+
+    async def close_async(self, is_full_refresh: bool = False) -> None:
         if self.balance != Decimal("0"):
             raise OperationNotSupportedException(f"Cannot close account due to non-zero account balance:\n"
                                                  f"Account Name: {self.name}\n"
                                                  f"Currency: {self.currency.value}\n"
                                                  f"Balance: {'{:,}'.format(self.balance)}")
 
-        self.http_session.delete(
+        await self.http_session.delete(
             constants.ENDPOINT__BALANCE__CLOSE.replace("$profileId", str(self.profile.id)).replace("$balanceId",
                                                                                                    str(self.id)))
-        self.profile.wise_account._initialize()
+        if is_full_refresh:
+            await self.profile.wise_account._initialize_async()
+        else:
+            self.profile._remove_account(self)
 
     def get_transactions(self, from_time: datetime.datetime | None = None, to_time: datetime.datetime | None = None,
                          number_of_past_hours: int | None = None) -> List["Transaction"]:
+        return common.run_coroutine_synchronously(self.get_transactions_async(from_time, to_time, number_of_past_hours))
+
+    async def get_transactions_async(self, from_time: datetime.datetime | None = None,
+                                     to_time: datetime.datetime | None = None,
+                                     number_of_past_hours: int | None = None) -> List["Transaction"]:
         number_of_past_hours = 24 if number_of_past_hours is None else number_of_past_hours
         if from_time is None:
-            from_time = datetime.datetime.now() - datetime.timedelta(days=number_of_past_hours)
+            from_time = datetime.datetime.now() - datetime.timedelta(hours=number_of_past_hours)
 
         if to_time is None:
             to_time = datetime.datetime.now()
 
-        response: HTTPResponse = self.http_session.get(
+        return StatementDecoder(self).decode_list(await self._get_raw_transaction_list_async(from_time, to_time))
+
+    async def get_transaction_stream(self, from_time: datetime.datetime, to_time: datetime.datetime | None = None,
+                                     chunk_size: datetime.timedelta = datetime.timedelta(hours=constants.STATEMENT_CHUNK_SIZE_HOURS),
+                                     maximum_number_of_concurrent_requests: int = 4) -> AsyncIterator["Transaction"]:
+        to_time = datetime.datetime.now() if to_time is None else to_time
+        interval_iterator: Iterator[Tuple[datetime.datetime, datetime.datetime]] = Account._get_interval_iterator(from_time, to_time, chunk_size)
+        pending_task_deque: Deque[asyncio.Task] = deque(
+            asyncio.ensure_future(self._get_raw_transaction_list_async(*interval)) for interval in itertools.islice(interval_iterator, maximum_number_of_concurrent_requests))
+        previous_reference_number_set: Set[str] = set()
+
+        try:
+            while len(pending_task_deque) > 0:
+                raw_transaction_list: List[Dict[str, Any]] = await pending_task_deque.popleft()
+                next_interval: Tuple[datetime.datetime, datetime.datetime] | None = next(interval_iterator, None)
+                if next_interval is not None:
+                    pending_task_deque.append(asyncio.ensure_future(self._get_raw_transaction_list_async(*next_interval)))
+
+                reference_number_set: Set[str] = set()
+                for transaction in sorted(StatementDecoder(self).decode_list(raw_transaction_list), key=lambda t: t.timestamp):
+                    if transaction.reference_number is not None:
+                        if transaction.reference_number in previous_reference_number_set or transaction.reference_number in reference_number_set:
+                            continue
+                        reference_number_set.add(transaction.reference_number)
+
+                    yield transaction
+
+                previous_reference_number_set = reference_number_set
+        finally:
+            for task in pending_task_deque:
+                task.cancel()
+
+    @staticmethod
+    def _get_interval_iterator(from_time: datetime.datetime, to_time: datetime.datetime,
+                               chunk_size: datetime.timedelta) -> Iterator[Tuple[datetime.datetime, datetime.datetime]]:
+        chunk_start_time: datetime.datetime = from_time
+        while chunk_start_time < to_time:
+            chunk_end_time: datetime.datetime = min(chunk_start_time + chunk_size, to_time)
+            yield chunk_start_time, chunk_end_time
+            chunk_start_time = chunk_end_time
+
+    async def _get_raw_transaction_list_async(self, from_time: datetime.datetime, to_time: datetime.datetime) -> List[Dict[str, Any]]:
+        await self.profile.load_async(["reserve_account_list", "recipient_list"])
+        response: Response = await self.http_session.get_raw(
             constants.ENDPOINT__BALANCE__GET_TRANSACTIONS.replace("$profileId", str(self.profile.id)).replace(
                 "$balanceId", str(self.id)), query_params={
                 "currency": self.currency.value,
@@ -262,54 +779,20 @@ class Account(DataClass):
                 "type": "COMPACT"
             })
 
-        transaction_list: List[Transaction] = []
-        for data in response.data["transactions"]:
-            transaction_type: TransactionType = TransactionType(data["details"]["type"])
-            third_party: str | ReserveAccount | Recipient
-            id: int | None
-
-            try:
-                id = int(data["referenceNumber"].replace("TRANSFER-", ""))
-            except ValueError:
-                id = None
-
-            if transaction_type == TransactionType.DEPOSIT:
-                third_party = data["details"]["senderName"] + " | " + data["details"]["senderAccount"]
-
-            elif transaction_type == TransactionType.TRANSFER:
-                try:
-                    third_party = self.profile.get_recipient(data["details"]["recipient"]["bankAccount"])
-                except RecipientNotFoundException:
-                    third_party = data["details"]["recipient"]["name"] + " | " + data["details"]["recipient"][
-                        "bankAccount"]
-
-            elif transaction_type == TransactionType.CARD:
-                third_party = data["details"]["merchant"]["name"] + " | " + data["details"]["merchant"]["country"]
-
-            elif transaction_type == TransactionType.CONVERSION:
-                description: str = data["details"]["description"]
-                reserve_account_name: str = description.split(" to ")[1] if " to " in description else \
-                    description.split(" from ")[1]
-                try:
-                    third_party = self.profile.get_reserve_account(reserve_account_name, self.currency)
-                except ReserveAccountNotFoundException:
-                    third_party = reserve_account_name
-
-            transaction_list.append(Transaction(
-                id=id,
-                account=self,
-                timestamp=data["date"],
-                type=transaction_type,
-                description=data["details"]["description"],
-                amount=Decimal(str(data["amount"]["value"])),
-                third_party=third_party
-            ))
+        return StatementDecoder.load(response.content)
 
-        return transaction_list
+    def _get_transaction_from_data(self, data: Dict[str, Any]) -> "Transaction":
+        return StatementDecoder(self).decode(data)
 
     @staticmethod
     def abstract_open(profile: Profile, account_name: str | None, currency: Currency,
                       is_reserve_account: bool) -> "Account":
+        return common.run_coroutine_synchronously(
+            Account.abstract_open_async(profile, account_name, currency, is_reserve_account))
+
+    @staticmethod
+    async def abstract_open_async(profile: Profile, account_name: str | None, currency: Currency,
+                                  is_reserve_account: bool) -> "Account":
         data = {
             "currency": currency.value,
             "type": "SAVINGS" if is_reserve_account else "STANDARD"
@@ -318,7 +801,7 @@ class Account(DataClass):
         if is_reserve_account:
             data["name"] = account_name
 
-        response: HTTPResponse = profile.http_session.post(
+        response: HTTPResponse = await profile.http_session.post(
             constants.ENDPOINT__BALANCE__OPEN.replace("$profileId", str(profile.id)), data=data,
             headers={"X-idempotence-uuid": str(uuid.uuid4())})
         return Account(
@@ -330,20 +813,211 @@ class Account(DataClass):
         )
 
 
+class StatementDecoder:
+    transaction_type_dict: ClassVar[Dict[str, TransactionType]] = {transaction_type.value: transaction_type for transaction_type in TransactionType}
+    transaction_field_name_set: ClassVar[Set[str]] = set(Transaction.model_fields.keys())
+    account: Account
+    _third_party_dict: Dict[Tuple[str, ...], Union[str, "ReserveAccount", "Recipient"]]
+
+    def __init__(self, account: Account) -> None:
+        self.account = account
+        self._third_party_dict = {}
+
+    @staticmethod
+    def load(content: bytes | str) -> List[Dict[str, Any]]:
+        return cast(List[Dict[str, Any]], json.loads(content, parse_float=Decimal)["transactions"])
+
+    @staticmethod
+    def get_serializable_data(data: Dict[str, Any]) -> Dict[str, Any]:
+        return cast(Dict[str, Any], json.loads(json.dumps(data, default=str)))
+
+    @staticmethod
+    def _get_decimal(value: Decimal | int | float | str) -> Decimal:
+        return value if isinstance(value, Decimal) else Decimal(str(value))
+
+    def decode_list(self, data_list: List[Dict[str, Any]]) -> List[Transaction]:
+        return [self.decode(data) for data in data_list]
+
+    def decode(self, data: Dict[str, Any]) -> Transaction:
+        details: Dict[str, Any] = data["details"]
+        transaction_type: TransactionType | None = StatementDecoder.transaction_type_dict.get(details["type"])
+        transaction_type = TransactionType(details["type"]) if transaction_type is None else transaction_type
+        reference_number: str | None = data.get("referenceNumber")
+        id: int | None
+
+        try:
+            id = None if reference_number is None else int(reference_number.replace("TRANSFER-", ""))
+        except ValueError:
+            id = None
+
+        return StatementDecoder._construct_transaction({
+            "id": id,
+            "reference_number": reference_number,
+            "account": self.account,
+            "timestamp": datetime.datetime.fromisoformat(data["date"].replace("Z", "+00:00")),
+            "type": transaction_type,
+            "description": details["description"],
+            "amount": StatementDecoder._get_decimal(data["amount"]["value"]),
+            "third_party": self._get_third_party(transaction_type, details)
+        })
+
+    @staticmethod
+    def _construct_transaction(field_dict: Dict[str, Any]) -> Transaction:
+        transaction: Transaction = Transaction.__new__(Transaction)
+        object.__setattr__(transaction, "__dict__", field_dict)
+        object.__setattr__(transaction, "__pydantic_fields_set__", StatementDecoder.transaction_field_name_set)
+        object.__setattr__(transaction, "__pydantic_extra__", None)
+        object.__setattr__(transaction, "__pydantic_private__", None)
+        return transaction
+
+    def _get_third_party(self, transaction_type: TransactionType, details: Dict[str, Any]) -> Union[str, "ReserveAccount", "Recipient"]:
+        if transaction_type == TransactionType.DEPOSIT:
+            return details["senderName"] + " | " + details["senderAccount"]
+
+        elif transaction_type == TransactionType.CARD:
+            return details["merchant"]["name"] + " | " + details["merchant"]["country"]
+
+        elif transaction_type == TransactionType.TRANSFER:
+            key: Tuple[str, ...] = (transaction_type.value, details["recipient"]["name"], details["recipient"]["bankAccount"])
+            if key not in self._third_party_dict:
+                try:
+                    self._third_party_dict[key] = self.account.profile.get_recipient(details["recipient"]["bankAccount"])
+                except RecipientNotFoundException:
+                    self._third_party_dict[key] = details["recipient"]["name"] + " | " + details["recipient"]["bankAccount"]
+
+            return self._third_party_dict[key]
+
+        elif transaction_type == TransactionType.CONVERSION:
+            description: str = details["description"]
+            reserve_account_name: str = description.split(" to ")[1] if " to " in description else description.split(" from ")[1]
+            key = (transaction_type.value, reserve_account_name)
+            if key not in self._third_party_dict:
+                try:
+                    self._third_party_dict[key] = self.account.profile.get_reserve_account(reserve_account_name, self.account.currency)
+                except ReserveAccountNotFoundException:
+                    self._third_party_dict[key] = reserve_account_name
+
+            return self._third_party_dict[key]
+
+        return cast(str, details["description"])
+
+
+class WiseAccountSnapshot(DatabaseDocument):
+    wise_account_type: str
+    data: Dict[str, Any] | None = None
+    indexed_field_list: ClassVar[List[str]] = ["wise_account_type"]
+
+
+class TransactionRecord(DatabaseDocument):
+    balance_id: int
+    reference_number: str | None = None
+    timestamp: datetime.datetime | None = None
+    data: Dict[str, Any] | None = None
+    indexed_field_list: ClassVar[List[str]] = ["balance_id", "reference_number"]
+
+
+class TransactionStore(DataClass):
+    account: Account = Field(exclude=True)
+    is_persistent: bool = False
+    last_synced_timestamp: datetime.datetime | None = None
+    _transaction_list: List[Transaction] = PrivateAttr(default_factory=list)
+    _timestamp_list: List[datetime.datetime] = PrivateAttr(default_factory=list)
+    _transaction_by_reference_number_dict: Dict[str, Transaction] = PrivateAttr(default_factory=dict)
+    _transaction_by_id_dict: Dict[int, Transaction] = PrivateAttr(default_factory=dict)
+    _is_loaded_from_database: bool = PrivateAttr(False)
+
+    @property
+    def transaction_list(self) -> List[Transaction]:
+        return list(self._transaction_list)
+
+    def _add_transaction(self, transaction: Transaction) -> bool:
+        if transaction.reference_number is not None:
+            if transaction.reference_number in self._transaction_by_reference_number_dict:
+                return False
+            self._transaction_by_reference_number_dict[transaction.reference_number] = transaction
+
+        index: int = bisect.bisect_right(self._timestamp_list, transaction.timestamp)
+        self._timestamp_list.insert(index, transaction.timestamp)
+        self._transaction_list.insert(index, transaction)
+        if transaction.id is not None:
+            self._transaction_by_id_dict[transaction.id] = transaction
+
+        if self.last_synced_timestamp is None or transaction.timestamp > self.last_synced_timestamp:
+            self.last_synced_timestamp = transaction.timestamp
+
+        return True
+
+    async def _load_from_database(self) -> None:
+        await self.account.profile.load_async(["reserve_account_list", "recipient_list"])
+        statement_decoder: StatementDecoder = StatementDecoder(self.account)
+        async for transaction_record in TransactionRecord.find_stream_by_query(TransactionRecord(balance_id=self.account.id)):
+            self._add_transaction(statement_decoder.decode(cast(Dict[str, Any], cast(TransactionRecord, transaction_record).data)))
+
+        self._is_loaded_from_database = True
+
+    def sync(self, number_of_past_hours: int = 24) -> List[Transaction]:
+        return common.run_coroutine_synchronously(self.sync_async(number_of_past_hours))
+
+    async def sync_async(self, number_of_past_hours: int = 24) -> List[Transaction]:
+        if self.is_persistent and not self._is_loaded_from_database:
+            await self._load_from_database()
+
+        to_time: datetime.datetime = datetime.datetime.now(datetime.timezone.utc)
+        from_time: datetime.datetime = to_time - datetime.timedelta(hours=number_of_past_hours) if self.last_synced_timestamp is None else self.last_synced_timestamp
+        previous_synced_timestamp: datetime.datetime | None = self.last_synced_timestamp
+        new_transaction_list: List[Transaction] = []
+        new_data_list: List[Dict[str, Any]] = []
+
+        statement_decoder: StatementDecoder = StatementDecoder(self.account)
+        for data in await self.account._get_raw_transaction_list_async(from_time, to_time):
+            transaction: Transaction = statement_decoder.decode(data)
+            if transaction.reference_number is None and previous_synced_timestamp is not None and transaction.timestamp <= previous_synced_timestamp:
+                continue
+
+            if self._add_transaction(transaction):
+                new_transaction_list.append(transaction)
+                new_data_list.append(data)
+
+        if self.last_synced_timestamp is None:
+            self.last_synced_timestamp = from_time
+
+        if self.is_persistent and len(new_data_list) > 0:
+            await TransactionRecord.save_many([TransactionRecord(balance_id=self.account.id,
+                                                                 reference_number=data.get("referenceNumber"),
+                                                                 timestamp=transaction.timestamp,
+                                                                 data=StatementDecoder.get_serializable_data(data)) for data, transaction in zip(new_data_list, new_transaction_list)])
+
+        return new_transaction_list
+
+    def get_transaction_by_id(self, transaction_id: int) -> Transaction | None:
+        return self._transaction_by_id_dict.get(transaction_id)
+
+    def get_transaction_by_reference_number(self, reference_number: str) -> Transaction | None:
+        return self._transaction_by_reference_number_dict.get(reference_number)
+
+    def get_transaction_list_by_timestamp(self, timestamp: datetime.datetime) -> List[Transaction]:
+        timestamp = timestamp.replace(microsecond=0)
+        return self.get_transaction_list(timestamp, timestamp + datetime.timedelta(seconds=1))
+
+    def get_transaction_list(self, from_time: datetime.datetime, to_time: datetime.datetime) -> List[Transaction]:
+        return self._transaction_list[bisect.bisect_left(self._timestamp_list, from_time):bisect.bisect_left(self._timestamp_list, to_time)]
+
+
 class CashAccount(Account):
 
     @common.only_in_dev
-    def _simulate_completed_transfer(self, transfer_id: int) -> None:
+    async def _simulate_completed_transfer(self, transfer_id: int) -> None:
         url: str = constants.ENDPOINT__SIMULATION__COMPLETE_TRANSFER.replace("$transferId", str(transfer_id))
         try:
-            self.http_session.get(url.replace("$status", "processing"))
-            self.http_session.get(url.replace("$status", "funds_converted"))
-            self.http_session.get(url.replace("$status", "outgoing_payment_sent"))
+            await self.http_session.get(url.replace("$status", "processing"))
+            await self.http_session.get(url.replace("$status", "funds_converted"))
+            await self.http_session.get(url.replace("$status", "outgoing_payment_sent"))
         except HTTPException:
             pass
 
     async def transfer(self, to_account: Union["CashAccount", "ReserveAccount", "Recipient"], amount: Decimal,
-                       reference: str | None = None, is_amount_in_from_currency: bool = False) -> "Transfer":
+                       reference: str | None = None, is_amount_in_from_currency: bool = False,
+                       is_full_refresh: bool = False) -> "Transfer":
         amount = amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
         if isinstance(to_account, ReserveAccount) and self.currency != to_account.currency:
@@ -352,65 +1026,74 @@ class CashAccount(Account):
 
         transfer: Transfer = Transfer.model_construct()
         if isinstance(to_account, CashAccount):
-            transfer = Transfer.intra_cash_account_transfer(self.profile, self, to_account, amount,
-                                                            is_amount_in_from_currency)
-            await DiscordDefaults.send_message(AortaTextChannels.WISE.value, f"**Intra-Account Transfer**:\n"
-                                                                             f"Timestamp: {get_timestamp_string(datetime.datetime.now())}\n"
-                                                                             f"From: *{self.currency.value}*\n"
-                                                                             f"To: *{to_account.currency.value}*\n"
-                                                                             f"Amount: *{self.currency.value} {'{:,}'.format(amount)}*\n"
-                                               )
+            transfer = await Transfer.intra_cash_account_transfer_async(self.profile, self, to_account, amount,
+                                                                        is_amount_in_from_currency)
+            DiscordOutbox.put(AortaTextChannels.WISE.value, f"**Intra-Account Transfer**:\n"
+                                                            f"Timestamp: {get_timestamp_string(datetime.datetime.now())}\n"
+                                                            f"From: *{self.currency.value}*\n"
+                                                            f"To: *{to_account.currency.value}*\n"
+                                                            f"Amount: *{self.currency.value} {'{:,}'.format(amount)}*\n"
+                             )
 
         elif isinstance(to_account, ReserveAccount):
-            transfer = Transfer.cash_to_savings_account_transfer(self.profile, self, to_account, amount)
-            await DiscordDefaults.send_message(AortaTextChannels.WISE.value, f"**Intra-Account Transfer**:\n"
-                                                                             f"Timestamp: {get_timestamp_string(datetime.datetime.now())}\n"
-                                                                             f"From: *{self.currency.value}*\n"
-                                                                             f"To: *{to_account.name}*\n"
-                                                                             f"Amount: *{self.currency.value} {'{:,}'.format(amount)}*\n")
+            transfer = await Transfer.cash_to_savings_account_transfer_async(self.profile, self, to_account, amount)
+            DiscordOutbox.put(AortaTextChannels.WISE.value, f"**Intra-Account Transfer**:\n"
+                                                            f"Timestamp: {get_timestamp_string(datetime.datetime.now())}\n"
+                                                            f"From: *{self.currency.value}*\n"
+                                                            f"To: *{to_account.name}*\n"
+                                                            f"Amount: *{self.currency.value} {'{:,}'.format(amount)}*\n")
 
         elif isinstance(to_account, Recipient):
-            transfer = Transfer.cash_to_third_party_cash_account_transfer(self.profile, self, to_account, amount,
-                                                                          "" if reference is None else reference,
-                                                                          is_amount_in_from_currency)
-            await DiscordDefaults.send_message(AortaTextChannels.WISE.value, f"**Third-Party Transfer**:\n"
-                                                                             f"Timestamp: {get_timestamp_string(datetime.datetime.now())}\n"
-                                                                             f"From: *{self.currency.value}*\n"
-                                                                             f"To: *{to_account.account_holder_name}*\n"
-                                                                             f"Amount: *{self.currency.value} {'{:,}'.format(amount)}*\n")
+            transfer = await Transfer.cash_to_third_party_cash_account_transfer_async(self.profile, self, to_account,
+                                                                                      amount,
+                                                                                      "" if reference is None else reference,
+                                                                                      is_amount_in_from_currency)
+            DiscordOutbox.put(AortaTextChannels.WISE.value, f"**Third-Party Transfer**:\n"
+                                                            f"Timestamp: {get_timestamp_string(datetime.datetime.now())}\n"
+                                                            f"From: *{self.currency.value}*\n"
+                                                            f"To: *{to_account.account_holder_name}*\n"
+                                                            f"Amount: *{self.currency.value} {'{:,}'.format(amount)}*\n")
 
             if not common.is_production_environment():
-                self._simulate_completed_transfer(transfer.id)
+                await self._simulate_completed_transfer(transfer.id)
+
+        if is_full_refresh:
+            await self.profile.wise_account._initialize_async()
+        else:
+            await transfer._update_account_balances()
 
-        self.profile.wise_account._initialize()
         Transfer.model_validate(transfer)
         return transfer
 
     @common.only_in_dev
     def _simulate_top_up(self, amount: Decimal) -> None:
+        common.run_coroutine_synchronously(self._simulate_top_up_async(amount))
+
+    @common.only_in_dev
+    async def _simulate_top_up_async(self, amount: Decimal) -> None:
         amount = amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
         if not common.is_development_environment():
             raise OperationNotSupportedException("Simulations can only be done in a development environment")
 
-        self.profile.http_session.post(constants.ENDPOINT__SIMULATION__TOP_UP, {
+        await self.profile.http_session.post(constants.ENDPOINT__SIMULATION__TOP_UP, {
             "profileId": self.profile.id,
             "balanceId": self.id,
             "currency": self.currency.value,
             "amount": float(amount)
         })
-        self.profile.wise_account._initialize()
+        await self.refresh_async()
 
     @common.only_in_dev
     async def _set_balance(self, amount: Decimal) -> None:
         if self.balance > amount:
             await self._set_maximum_balance(amount)
         else:
-            self._set_minimum_balance(amount)
+            await self._set_minimum_balance(amount)
 
     @common.only_in_dev
-    def _set_minimum_balance(self, amount: Decimal) -> None:
+    async def _set_minimum_balance(self, amount: Decimal) -> None:
         if self.balance < amount:
-            self._simulate_top_up(amount - self.balance)
+            await self._simulate_top_up_async(amount - self.balance)
 
     @common.only_in_dev
     async def _set_maximum_balance(self, amount: Decimal) -> None:
@@ -419,11 +1102,12 @@ class CashAccount(Account):
 
         maximum_transfer_amount: Decimal = Decimal(500_000)
         amount_to_deduct: Decimal = min(self.balance - amount, maximum_transfer_amount)
+        await self.profile.load_async(["recipient_list"])
         recipient: Recipient = self.profile.get_recipient("12345678901234")
 
         if amount_to_deduct < Decimal("10"):
             amount_to_deduct = amount_to_deduct + Decimal("10")
-            self._set_minimum_balance(self.balance + Decimal("10"))
+            await self._set_minimum_balance(self.balance + Decimal("10"))
 
         await self.transfer(recipient, amount_to_deduct, is_amount_in_from_currency=True)
 
@@ -432,9 +1116,13 @@ class CashAccount(Account):
 
     @staticmethod
     def get_all(profile: Profile) -> List["CashAccount"]:
-        response: HTTPResponse = profile.http_session.get(
+        return common.run_coroutine_synchronously(CashAccount.get_all_async(profile))
+
+    @staticmethod
+    async def get_all_async(profile: Profile) -> List["CashAccount"]:
+        response: HTTPResponse = await profile.http_session.get(
             constants.ENDPOINT__ACCOUNT__GET_ALL__CASH_ACCOUNT.replace("$profileId", str(profile.id)))
-        return [CashAccount(
+        cash_account_list: List[CashAccount] = [CashAccount(
             id=data["id"],
             name=data["name"],
             currency=Currency(data["cashAmount"]["currency"]),
@@ -442,44 +1130,55 @@ class CashAccount(Account):
             profile=profile
         ) for data in response.data]
 
+        for cash_account, data in zip(cash_account_list, response.data):
+            cash_account._balance_timestamp = Account._get_modification_timestamp(data)
+
+        return cash_account_list
+
     @staticmethod
     def open(profile: Profile, currency: Currency) -> "CashAccount":
-        account: Account = Account.abstract_open(profile, None, currency, False)
+        return common.run_coroutine_synchronously(CashAccount.open_async(profile, currency))
+
+    @staticmethod
+    async def open_async(profile: Profile, currency: Currency) -> "CashAccount":
+        await profile.load_async(["cash_account_list"])
+        account: Account = await Account.abstract_open_async(profile, None, currency, False)
         cash_account: CashAccount = CashAccount.model_construct(**account.model_dump())
         cash_account.profile = profile
 
-        profile.cash_account_list.append(cash_account)
+        profile._add_account(cash_account)
         return cash_account
 
 
 class ReserveAccount(Account):
 
-    async def transfer(self, to_account: "CashAccount", amount: Decimal) -> "Transfer":
+    async def transfer(self, to_account: "CashAccount", amount: Decimal, is_full_refresh: bool = False) -> "Transfer":
         amount = amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
         if self.currency != to_account.currency:
             raise OperationNotSupportedException(
                 "Direct inter-currency transfers from a reserve account is not supported")
 
-        transfer: Transfer = Transfer.savings_to_cash_account_transfer(self.profile, self, to_account, amount)
-        await DiscordDefaults.send_message(AortaTextChannels.WISE.value, f"**Intra-Account Transfer**:\n"
-                                                                         f"*Timestamp*: {get_timestamp_string(datetime.datetime.now())}\n"
-                                                                         f"*From*: {self.name}\n"
-                                                                         f"*To*: {to_account.currency.value}\n"
-                                                                         f"*Amount*: {self.currency.value} {'{:,}'.format(amount)}\n")
+        transfer: Transfer = await Transfer.savings_to_cash_account_transfer_async(self.profile, self, to_account, amount)
+        DiscordOutbox.put(AortaTextChannels.WISE.value, f"**Intra-Account Transfer**:\n"
+                                                        f"*Timestamp*: {get_timestamp_string(datetime.datetime.now())}\n"
+                                                        f"*From*: {self.name}\n"
+                                                        f"*To*: {to_account.currency.value}\n"
+                                                        f"*Amount*: {self.currency.value} {'{:,}'.format(amount)}\n")
+
+        if is_full_refresh:
+            await self.profile.wise_account._initialize_async()
+        else:
+            await transfer._update_account_balances()
 
-        self.profile.wise_account._initialize()
         return transfer
 
     @common.only_in_dev
     async def _simulate_top_up(self, amount: Decimal) -> None:
         amount = amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        cash_account: CashAccount = self.profile.get_cash_account(self.currency, True)
-        cash_account._simulate_top_up(amount)
+        cash_account: CashAccount = await self.profile.get_cash_account_async(self.currency, True)
+        await cash_account._simulate_top_up_async(amount)
         await cash_account.transfer(self, amount)
-        self.profile.wise_account._initialize()
-        self.balance = (
-            self.profile.wise_account.personal_profile.get_reserve_account(self.name, self.currency)).balance
 
     @common.only_in_dev
     async def _set_balance(self, amount: Decimal) -> None:
@@ -496,8 +1195,8 @@ class ReserveAccount(Account):
             return
 
         amount_to_top_up: Decimal = amount - self.balance
-        cash_account: CashAccount = self.profile.get_cash_account(self.currency, True)
-        cash_account._simulate_top_up(amount_to_top_up)
+        cash_account: CashAccount = await self.profile.get_cash_account_async(self.currency, True)
+        await cash_account._simulate_top_up_async(amount_to_top_up)
         await cash_account.transfer(self, amount_to_top_up)
 
     @common.only_in_dev
@@ -507,22 +1206,26 @@ class ReserveAccount(Account):
 
         maximum_transfer_amount: Decimal = Decimal(7_000_000)
         amount_to_deduct: Decimal = self.balance - amount
-        cash_account: CashAccount = self.profile.get_cash_account(self.currency, True)
-        hkd_account: CashAccount = self.profile.get_cash_account(common.Currency.HKD, True)
+        cash_account: CashAccount = await self.profile.get_cash_account_async(self.currency, True)
+        hkd_account: CashAccount = await self.profile.get_cash_account_async(common.Currency.HKD, True)
         await self.transfer(cash_account, amount_to_deduct)
 
         if amount_to_deduct > maximum_transfer_amount:
             await cash_account.transfer(hkd_account, maximum_transfer_amount)
-            self._set_maximum_balance(amount)
+            await self._set_maximum_balance(amount)
         else:
-            quote: Quote = Quote.get_quote(self.profile, cash_account, hkd_account, amount_to_deduct, True)
+            quote: Quote = await Quote.get_quote_async(self.profile, cash_account, hkd_account, amount_to_deduct, True)
             await cash_account.transfer(hkd_account, quote.from_amount, is_amount_in_from_currency=True)
 
     @staticmethod
     def get_all(profile: Profile) -> List["ReserveAccount"]:
-        response: HTTPResponse = profile.http_session.get(
+        return common.run_coroutine_synchronously(ReserveAccount.get_all_async(profile))
+
+    @staticmethod
+    async def get_all_async(profile: Profile) -> List["ReserveAccount"]:
+        response: HTTPResponse = await profile.http_session.get(
             constants.ENDPOINT__ACCOUNT__GET_ALL__RESERVE_ACCOUNT.replace("$profileId", str(profile.id)))
-        return [ReserveAccount(
+        reserve_account_list: List[ReserveAccount] = [ReserveAccount(
             id=data["id"],
             name=data["name"],
             currency=Currency(data["cashAmount"]["currency"]),
@@ -530,13 +1233,23 @@ class ReserveAccount(Account):
             profile=profile,
         ) for data in response.data]
 
+        for reserve_account, data in zip(reserve_account_list, response.data):
+            reserve_account._balance_timestamp = Account._get_modification_timestamp(data)
+
+        return reserve_account_list
+
     @staticmethod
     def open(profile: Profile, account_name: str, currency: Currency) -> "ReserveAccount":
-        account: Account = Account.abstract_open(profile, account_name, currency, True)
+        return common.run_coroutine_synchronously(ReserveAccount.open_async(profile, account_name, currency))
+
+    @staticmethod
+    async def open_async(profile: Profile, account_name: str, currency: Currency) -> "ReserveAccount":
+        await profile.load_async(["reserve_account_list"])
+        account: Account = await Account.abstract_open_async(profile, account_name, currency, True)
         reserve_account: ReserveAccount = ReserveAccount.model_construct(**account.model_dump())
         reserve_account.profile = profile
 
-        profile.reserve_account_list.append(reserve_account)
+        profile._add_account(reserve_account)
         return reserve_account
 
 
@@ -547,11 +1260,15 @@ class Recipient(DataClass):
     is_self_owned: bool
     account_number: str
     profile: Profile
-    _http_session: SyncHTTPSession = PrivateAttr()
+    _http_session: AsyncHTTPSession = PrivateAttr()
 
     @staticmethod
     def get_all(profile: Profile) -> List["Recipient"]:
-        response: HTTPResponse = profile.http_session.get(
+        return common.run_coroutine_synchronously(Recipient.get_all_async(profile))
+
+    @staticmethod
+    async def get_all_async(profile: Profile) -> List["Recipient"]:
+        response: HTTPResponse = await profile.http_session.get(
             constants.ENDPOINT__RECIPIENT__GET_ALL.replace("$profileId", str(profile.id)))
         raw_recipient_list: List[Dict[str, Any]] = list(
             filter(lambda d: d["details"]["accountNumber"] is not None or d["details"]["iban"] is not None,
@@ -574,13 +1291,39 @@ class Quote(DataClass):
     from_amount: Decimal
     to_amount: Decimal
     exchange_rate: Decimal
+    expiration_time: datetime.datetime | None = None
     profile: Profile
 
     @staticmethod
     def get_quote(profile: Profile, from_account: CashAccount | ReserveAccount,
                   to_account: CashAccount | ReserveAccount | Recipient, amount: Decimal,
                   is_amount_in_from_currency: bool = False) -> "Quote":
-        response: HTTPResponse = profile.http_session.post(
+        return common.run_coroutine_synchronously(
+            Quote.get_quote_async(profile, from_account, to_account, amount, is_amount_in_from_currency))
+
+    @staticmethod
+    async def get_quote_async(profile: Profile, from_account: CashAccount | ReserveAccount,
+                              to_account: CashAccount | ReserveAccount | Recipient, amount: Decimal,
+                              is_amount_in_from_currency: bool = False) -> "Quote":
+        quote: Quote | None = profile.quote_cache.get_quote(from_account.currency, to_account.currency, amount, is_amount_in_from_currency)
+        if quote is None:
+            quote = await Quote._create_quote_async(profile, from_account, to_account, amount, is_amount_in_from_currency)
+            profile.quote_cache.put_quote(quote, amount, is_amount_in_from_currency)
+
+        return quote
+
+    @staticmethod
+    async def _take_quote_async(profile: Profile, from_account: CashAccount | ReserveAccount,
+                                to_account: CashAccount | ReserveAccount | Recipient, amount: Decimal,
+                                is_amount_in_from_currency: bool = False) -> "Quote":
+        quote: Quote | None = profile.quote_cache.take_quote(from_account.currency, to_account.currency, amount, is_amount_in_from_currency)
+        return await Quote._create_quote_async(profile, from_account, to_account, amount, is_amount_in_from_currency) if quote is None else quote
+
+    @staticmethod
+    async def _create_quote_async(profile: Profile, from_account: CashAccount | ReserveAccount,
+                                  to_account: CashAccount | ReserveAccount | Recipient, amount: Decimal,
+                                  is_amount_in_from_currency: bool = False) -> "Quote":
+        response: HTTPResponse = await profile.http_session.post(
             constants.ENDPOINT__QUOTE__GET.replace("$profileId", str(profile.id)), data={
                 "sourceCurrency": from_account.currency.value,
                 "targetCurrency": to_account.currency.value,
@@ -590,16 +1333,73 @@ class Quote(DataClass):
 
         payment_option: Dict[str, Any] = next(
             filter(lambda p: p["payIn"] == "BALANCE", response.data["paymentOptions"]))
-        return Quote(
+        quote: Quote = Quote(
             id=response.data["id"],
             from_currency=Currency(payment_option["sourceCurrency"]),
             to_currency=Currency(str(payment_option["targetCurrency"])),
             from_amount=Decimal(str(payment_option["sourceAmount"])),
             to_amount=Decimal(str(payment_option["targetAmount"])),
             exchange_rate=Decimal(str(response.data["rate"])),
+            expiration_time=response.data.get("expirationTime"),
             profile=profile
         )
 
+        if quote.expiration_time is not None:
+            profile.quote_cache.put_exchange_rate(quote.from_currency, quote.to_currency, quote.exchange_rate, quote.expiration_time)
+
+        return quote
+
+
+class QuoteCache(DataClass):
+    _quote_dict: Dict[Tuple[Currency, Currency, Decimal, bool], Quote] = PrivateAttr(default_factory=dict)
+    _exchange_rate_dict: Dict[Tuple[Currency, Currency], Tuple[Decimal, datetime.datetime]] = PrivateAttr(default_factory=dict)
+
+    @staticmethod
+    def _get_quote_key(from_currency: Currency, to_currency: Currency, amount: Decimal,
+                       is_amount_in_from_currency: bool) -> Tuple[Currency, Currency, Decimal, bool]:
+        return from_currency, to_currency, amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP), is_amount_in_from_currency
+
+    @staticmethod
+    def _is_unexpired(expiration_time: datetime.datetime | None) -> bool:
+        return expiration_time is not None and expiration_time - datetime.timedelta(seconds=constants.QUOTE_EXPIRY_MARGIN_SECONDS) > datetime.datetime.now(datetime.timezone.utc)
+
+    def put_quote(self, quote: Quote, amount: Decimal, is_amount_in_from_currency: bool) -> None:
+        if QuoteCache._is_unexpired(quote.expiration_time):
+            self._quote_dict[QuoteCache._get_quote_key(quote.from_currency, quote.to_currency, amount, is_amount_in_from_currency)] = quote
+
+    def get_quote(self, from_currency: Currency, to_currency: Currency, amount: Decimal,
+                  is_amount_in_from_currency: bool) -> Quote | None:
+        key: Tuple[Currency, Currency, Decimal, bool] = QuoteCache._get_quote_key(from_currency, to_currency, amount, is_amount_in_from_currency)
+        quote: Quote | None = self._quote_dict.get(key)
+
+        if quote is not None and not QuoteCache._is_unexpired(quote.expiration_time):
+            self._quote_dict.pop(key, None)
+            return None
+
+        return quote
+
+    def take_quote(self, from_currency: Currency, to_currency: Currency, amount: Decimal,
+                   is_amount_in_from_currency: bool) -> Quote | None:
+        quote: Quote | None = self.get_quote(from_currency, to_currency, amount, is_amount_in_from_currency)
+        if quote is not None:
+            self._quote_dict.pop(QuoteCache._get_quote_key(from_currency, to_currency, amount, is_amount_in_from_currency), None)
+
+        return quote
+
+    def put_exchange_rate(self, from_currency: Currency, to_currency: Currency, exchange_rate: Decimal,
+                          expiration_time: datetime.datetime) -> None:
+        self._exchange_rate_dict[(from_currency, to_currency)] = (exchange_rate, expiration_time)
+
+    def get_exchange_rate(self, from_currency: Currency, to_currency: Currency) -> Decimal | None:
+        if from_currency == to_currency:
+            return Decimal("1")
+
+        exchange_rate_and_expiration_time: Tuple[Decimal, datetime.datetime] | None = self._exchange_rate_dict.get((from_currency, to_currency))
+        if exchange_rate_and_expiration_time is None or not QuoteCache._is_unexpired(exchange_rate_and_expiration_time[1]):
+            return None
+
+        return exchange_rate_and_expiration_time[0]
+
 
 class TransferType(Enum):
     CASH_TO_SAVINGS: int = auto()
@@ -618,12 +1418,33 @@ class Transfer(DataClass):
     to_amount: Decimal
     reference: str | None
     transfer_type: TransferType | None
+    creation_timestamp: datetime.datetime | None = None
+
+    async def _update_account_balances(self) -> None:
+        if self.transfer_type == TransferType.CASH_TO_THIRD_PARTY:
+            await self.from_account.refresh_async()
+            return
+
+        self.from_account._apply_balance_delta(-self.from_amount, self.creation_timestamp)
+        if isinstance(self.to_account, Account):
+            self.to_account._apply_balance_delta(self.to_amount, self.creation_timestamp)
+
+    @staticmethod
+    def _get_creation_timestamp(data: Dict[str, Any]) -> datetime.datetime | None:
+        return None if data.get("creationTime") is None else datetime.datetime.fromisoformat(data["creationTime"]).replace(microsecond=0)
 
     @staticmethod
     def intra_cash_account_transfer(profile: Profile, from_account: CashAccount, to_account: CashAccount,
                                     amount: Decimal, is_amount_in_from_currency: bool = False) -> "Transfer":
-        quote: Quote = Quote.get_quote(profile, from_account, to_account, amount, is_amount_in_from_currency)
-        response: HTTPResponse = profile.http_session.post(
+        return common.run_coroutine_synchronously(
+            Transfer.intra_cash_account_transfer_async(profile, from_account, to_account, amount,
+                                                       is_amount_in_from_currency))
+
+    @staticmethod
+    async def intra_cash_account_transfer_async(profile: Profile, from_account: CashAccount, to_account: CashAccount,
+                                                amount: Decimal, is_amount_in_from_currency: bool = False) -> "Transfer":
+        quote: Quote = await Quote._take_quote_async(profile, from_account, to_account, amount, is_amount_in_from_currency)
+        response: HTTPResponse = await profile.http_session.post(
             constants.ENDPOINT__BALANCE__MOVE_MONEY_BETWEEN_BALANCES.replace("$profileId", str(profile.id)),
             data={"quoteId": quote.id},
             headers={"X-idempotence-uuid": str(uuid.uuid4())})
@@ -636,18 +1457,25 @@ class Transfer(DataClass):
             to_amount=Decimal(str(response.data["targetAmount"]["value"])),
             reference=None,
             transfer_type=TransferType.INTRA_CASH,
+            creation_timestamp=Transfer._get_creation_timestamp(response.data),
         )
 
     @staticmethod
     def cash_to_savings_account_transfer(profile: Profile, from_account: CashAccount, to_account: ReserveAccount,
                                          amount: Decimal) -> "Transfer":
+        return common.run_coroutine_synchronously(
+            Transfer.cash_to_savings_account_transfer_async(profile, from_account, to_account, amount))
+
+    @staticmethod
+    async def cash_to_savings_account_transfer_async(profile: Profile, from_account: CashAccount,
+                                                     to_account: ReserveAccount, amount: Decimal) -> "Transfer":
         data = {
             "sourceBalanceId": from_account.id,
             "targetBalanceId": to_account.id
         }
 
         if from_account.currency != to_account.currency:
-            quote: Quote = Quote.get_quote(profile, from_account, to_account, amount)
+            quote: Quote = await Quote._take_quote_async(profile, from_account, to_account, amount)
             data["quoteId"] = cast(int, quote.id)
         else:
             data["amount"] = {  # type: ignore[assignment]
@@ -655,7 +1483,7 @@ class Transfer(DataClass):
                 "currency": to_account.currency.value
             }
 
-        response: HTTPResponse = profile.http_session.post(
+        response: HTTPResponse = await profile.http_session.post(
             constants.ENDPOINT__BALANCE__MOVE_MONEY_BETWEEN_BALANCES.replace("$profileId", str(profile.id)), data=data,
             headers={"X-idempotence-uuid": str(uuid.uuid4())})
 
@@ -667,13 +1495,23 @@ class Transfer(DataClass):
             to_amount=Decimal(str(response.data["targetAmount"]["value"])),
             reference=None,
             transfer_type=TransferType.CASH_TO_SAVINGS,
+            creation_timestamp=Transfer._get_creation_timestamp(response.data),
         )
 
     @staticmethod
     def cash_to_third_party_cash_account_transfer(profile: Profile, from_account: CashAccount, to_account: Recipient,
                                                   amount: Decimal, reference: str | None = None,
                                                   is_amount_in_from_currency: bool = False) -> "Transfer":
-        quote: Quote = Quote.get_quote(profile, from_account, to_account, amount, is_amount_in_from_currency)
+        return common.run_coroutine_synchronously(
+            Transfer.cash_to_third_party_cash_account_transfer_async(profile, from_account, to_account, amount,
+                                                                     reference, is_amount_in_from_currency))
+
+    @staticmethod
+    async def cash_to_third_party_cash_account_transfer_async(profile: Profile, from_account: CashAccount,
+                                                              to_account: Recipient, amount: Decimal,
+                                                              reference: str | None = None,
+                                                              is_amount_in_from_currency: bool = False) -> "Transfer":
+        quote: Quote = await Quote._take_quote_async(profile, from_account, to_account, amount, is_amount_in_from_currency)
         data: Dict[str, Any] = {
             "targetAccount": to_account.id,
             "quoteUuid": quote.id,
@@ -683,9 +1521,9 @@ class Transfer(DataClass):
             }
         }
 
-        create_transfer_response: HTTPResponse = profile.http_session.post(
+        create_transfer_response: HTTPResponse = await profile.http_session.post(
             constants.ENDPOINT__TRANSFER__CREATE_THIRD_PARTY_TRANSFER, data=data)
-        profile.http_session.post(
+        await profile.http_session.post(
             constants.ENDPOINT__TRANSFER__FUND_THIRD_PARTY_TRANSFER.replace("$profileId", str(profile.id)).replace(
                 "$transferId", str(create_transfer_response.data["id"])),
             data={"type": "BALANCE"})
@@ -703,6 +1541,12 @@ class Transfer(DataClass):
     @staticmethod
     def savings_to_cash_account_transfer(profile: Profile, from_account: ReserveAccount, to_account: CashAccount,
                                          amount: Decimal) -> "Transfer":
+        return common.run_coroutine_synchronously(
+            Transfer.savings_to_cash_account_transfer_async(profile, from_account, to_account, amount))
+
+    @staticmethod
+    async def savings_to_cash_account_transfer_async(profile: Profile, from_account: ReserveAccount,
+                                                     to_account: CashAccount, amount: Decimal) -> "Transfer":
         data = {
             "amount": {
                 "value": float(amount),
@@ -712,7 +1556,7 @@ class Transfer(DataClass):
             "targetBalanceId": to_account.id,
         }
 
-        response: HTTPResponse = profile.http_session.post(
+        response: HTTPResponse = await profile.http_session.post(
             constants.ENDPOINT__BALANCE__MOVE_MONEY_BETWEEN_BALANCES.replace("$profileId", str(profile.id)), data=data,
             headers={"X-idempotence-uuid": str(uuid.uuid4())})
 
@@ -724,9 +1568,257 @@ class Transfer(DataClass):
             to_amount=Decimal(str(response.data["targetAmount"]["value"])),
             reference=None,
             transfer_type=TransferType.SAVINGS_TO_CASH,
+            creation_timestamp=Transfer._get_creation_timestamp(response.data),
         )
 
 
+class BatchTransferItemStatus(Enum):
+    PENDING: str = "PENDING"
+    QUOTED: str = "QUOTED"
+    CREATED: str = "CREATED"
+    FUNDED: str = "FUNDED"
+    FAILED: str = "FAILED"
+
+
+class BatchTransferItem(DataClass):
+    to_account: Recipient
+    amount: Decimal
+    reference: str | None = None
+    is_amount_in_from_currency: bool = False
+    status: BatchTransferItemStatus = BatchTransferItemStatus.PENDING
+    transfer: Transfer | None = None
+    error_message: str | None = None
+    _quote: Quote | None = PrivateAttr(None)
+
+
+class BatchTransfer(DataClass):
+    id: int | None = None
+    name: str
+    from_account: CashAccount
+    item_list: List[BatchTransferItem]
+
+    @property
+    def successful_item_list(self) -> List[BatchTransferItem]:
+        return [item for item in self.item_list if item.status == BatchTransferItemStatus.FUNDED]
+
+    @property
+    def failed_item_list(self) -> List[BatchTransferItem]:
+        return [item for item in self.item_list if item.status == BatchTransferItemStatus.FAILED]
+
+    @staticmethod
+    def execute(from_account: CashAccount, item_list: List[BatchTransferItem], name: str | None = None,
+                maximum_number_of_concurrent_requests: int = 10) -> "BatchTransfer":
+        return common.run_coroutine_synchronously(
+            BatchTransfer.execute_async(from_account, item_list, name, maximum_number_of_concurrent_requests))
+
+    @staticmethod
+    async def execute_async(from_account: CashAccount, item_list: List[BatchTransferItem], name: str | None = None,
+                            maximum_number_of_concurrent_requests: int = 10) -> "BatchTransfer":
+        if len(item_list) > constants.BATCH_TRANSFER_MAXIMUM_NUMBER_OF_TRANSFERS:
+            raise OperationNotSupportedException(f"Too many transfers in a single batch:\n"
+                                                 f"Number of Transfers: {len(item_list)}\n"
+                                                 f"Maximum Number of Transfers: {constants.BATCH_TRANSFER_MAXIMUM_NUMBER_OF_TRANSFERS}")
+
+        batch_transfer: BatchTransfer = BatchTransfer(name=f"Batch Transfer {uuid.uuid4()}" if name is None else name,
+                                                      from_account=from_account, item_list=item_list)
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(maximum_number_of_concurrent_requests)
+        for item in batch_transfer.item_list:
+            item.amount = item.amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+        await asyncio.gather(*[batch_transfer._quote_item(item, semaphore) for item in batch_transfer.item_list])
+        if len([item for item in batch_transfer.item_list if item.status == BatchTransferItemStatus.QUOTED]) == 0:
+            return batch_transfer
+
+        await batch_transfer._create_batch_group()
+        await asyncio.gather(*[batch_transfer._create_item_transfer(item, semaphore) for item in batch_transfer.item_list if item.status == BatchTransferItemStatus.QUOTED])
+        await batch_transfer._complete_and_fund_batch_group()
+
+        if not common.is_production_environment():
+            await TransferStatusTracker(profile=from_account.profile, maximum_number_of_concurrent_requests=maximum_number_of_concurrent_requests) \
+                .advance_async([cast(Transfer, item.transfer).id for item in batch_transfer.successful_item_list])
+
+        await from_account.refresh_async()
+        DiscordOutbox.put(AortaTextChannels.WISE.value, f"**Batch Third-Party Transfer**:\n"
+                                                        f"Timestamp: {get_timestamp_string(datetime.datetime.now())}\n"
+                                                        f"From: *{from_account.currency.value}*\n"
+                                                        f"Number of Transfers: *{len(batch_transfer.successful_item_list)}*\n"
+                                                        f"Number of Failed Transfers: *{len(batch_transfer.failed_item_list)}*\n"
+                                                        f"Amount: *{from_account.currency.value} {'{:,}'.format(sum([cast(Transfer, item.transfer).from_amount for item in batch_transfer.successful_item_list], Decimal('0')))}*\n")
+        return batch_transfer
+
+    async def _quote_item(self, item: BatchTransferItem, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            try:
+                item._quote = await Quote._take_quote_async(self.from_account.profile, self.from_account, item.to_account,
+                                                            item.amount, item.is_amount_in_from_currency)
+                item.status = BatchTransferItemStatus.QUOTED
+            except Exception as e:
+                item.status, item.error_message = BatchTransferItemStatus.FAILED, repr(e)
+
+    async def _create_batch_group(self) -> None:
+        response: HTTPResponse = await self.from_account.http_session.post(
+            constants.ENDPOINT__BATCH_GROUP__CREATE.replace("$profileId", str(self.from_account.profile.id)), data={
+                "name": self.name,
+                "sourceCurrency": self.from_account.currency.value
+            })
+        self.id = response.data["id"]
+
+    async def _create_item_transfer(self, item: BatchTransferItem, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            try:
+                response: HTTPResponse = await self.from_account.http_session.post(
+                    constants.ENDPOINT__BATCH_GROUP__CREATE_TRANSFER.replace("$profileId", str(self.from_account.profile.id)).replace("$batchGroupId", str(self.id)), data={
+                        "targetAccount": item.to_account.id,
+                        "quoteUuid": cast(Quote, item._quote).id,
+                        "customerTransactionId": str(uuid.uuid4()),
+                        "details": {
+                            "reference": "" if item.reference is None else item.reference,
+                        }
+                    })
+                item.transfer = Transfer(
+                    id=response.data["id"],
+                    from_account=self.from_account,
+                    from_amount=Decimal(str(response.data["sourceValue"])),
+                    to_account=item.to_account,
+                    to_amount=Decimal(str(response.data["targetValue"])),
+                    reference=item.reference,
+                    transfer_type=TransferType.CASH_TO_THIRD_PARTY,
+                )
+                item.status = BatchTransferItemStatus.CREATED
+            except Exception as e:
+                item.status, item.error_message = BatchTransferItemStatus.FAILED, repr(e)
+
+    async def _complete_and_fund_batch_group(self) -> None:
+        url: str = constants.ENDPOINT__BATCH_GROUP__GET.replace("$profileId", str(self.from_account.profile.id)).replace("$batchGroupId", str(self.id))
+        created_item_list: List[BatchTransferItem] = [item for item in self.item_list if item.status == BatchTransferItemStatus.CREATED]
+
+        try:
+            response: HTTPResponse = await self.from_account.http_session.get(url)
+            await self.from_account.http_session.patch(url, data={"status": "COMPLETED", "version": response.data["version"]})
+            await self.from_account.http_session.post(
+                constants.ENDPOINT__BATCH_GROUP__FUND.replace("$profileId", str(self.from_account.profile.id)).replace("$batchGroupId", str(self.id)),
+                data={"type": "BALANCE"})
+        except Exception as e:
+            for item in created_item_list:
+                item.status, item.error_message = BatchTransferItemStatus.FAILED, repr(e)
+            return
+
+        for item in created_item_list:
+            item.status = BatchTransferItemStatus.FUNDED
+
+
+class TransferStatus(Enum):
+    INCOMING_PAYMENT_WAITING: str = "incoming_payment_waiting"
+    PROCESSING: str = "processing"
+    FUNDS_CONVERTED: str = "funds_converted"
+    OUTGOING_PAYMENT_SENT: str = "outgoing_payment_sent"
+    CANCELLED: str = "cancelled"
+    FUNDS_REFUNDED: str = "funds_refunded"
+    BOUNCED_BACK: str = "bounced_back"
+    CHARGED_BACK: str = "charged_back"
+
+
+class TransferStatusTracker(DataClass):
+    profile: Profile
+    maximum_number_of_concurrent_requests: int = 10
+    status_dict: Dict[int, str] = {}
+    terminal_status_list: ClassVar[List[str]] = [TransferStatus.OUTGOING_PAYMENT_SENT.value, TransferStatus.CANCELLED.value,
+                                                 TransferStatus.FUNDS_REFUNDED.value, TransferStatus.BOUNCED_BACK.value,
+                                                 TransferStatus.CHARGED_BACK.value]
+    simulation_status_list: ClassVar[List[TransferStatus]] = [TransferStatus.PROCESSING, TransferStatus.FUNDS_CONVERTED,
+                                                              TransferStatus.OUTGOING_PAYMENT_SENT]
+    _future_dict: Dict[int, "asyncio.Future[str]"] = PrivateAttr(default_factory=dict)
+    _semaphore: asyncio.Semaphore | None = PrivateAttr(None)
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.maximum_number_of_concurrent_requests)
+
+        return self._semaphore
+
+    @property
+    def pending_transfer_id_list(self) -> List[int]:
+        return [transfer_id for transfer_id, status in self.status_dict.items() if status not in TransferStatusTracker.terminal_status_list]
+
+    def track(self, transfer_id: int, status: str = TransferStatus.INCOMING_PAYMENT_WAITING.value) -> "asyncio.Future[str]":
+        future: asyncio.Future[str] | None = self._future_dict.get(transfer_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._future_dict[transfer_id] = future
+            self._set_status(transfer_id, self.status_dict.get(transfer_id, status))
+
+        return future
+
+    def wait_for_completion(self, transfer_id: int, timeout_seconds: float | None = None, polling_interval_seconds: float = 5) -> str:
+        return common.run_coroutine_synchronously(self.wait_for_completion_async(transfer_id, timeout_seconds, polling_interval_seconds))
+
+    async def wait_for_completion_async(self, transfer_id: int, timeout_seconds: float | None = None,
+                                        polling_interval_seconds: float = 5) -> str:
+        return await asyncio.wait_for(self._poll_until_done_async(self.track(transfer_id), polling_interval_seconds), timeout_seconds)
+
+    async def get_transfer_id_list_async(self, status: TransferStatus | None = None) -> List[int]:
+        url: str = f"{constants.ENDPOINT__TRANSFER__GET_ALL.replace('$profileId', str(self.profile.id))}&createdDateStart=2021-01-01&limit={constants.TRANSFER_LIST_PAGE_SIZE}"
+        url = url if status is None else f"{url}&status={status.value}"
+        transfer_id_list: List[int] = []
+
+        while True:
+            http_response: HTTPResponse = await self.profile.http_session.get(f"{url}&offset={len(transfer_id_list)}")
+            for data in http_response.data:
+                transfer_id_list.append(data["id"])
+                if data.get("status") is not None:
+                    self._set_status(data["id"], data["status"])
+
+            if len(http_response.data) < constants.TRANSFER_LIST_PAGE_SIZE:
+                return transfer_id_list
+
+    async def poll_async(self) -> Dict[int, str]:
+        pending_transfer_id_list: List[int] = self.pending_transfer_id_list
+        await asyncio.gather(*[self._get_status_async(transfer_id) for transfer_id in pending_transfer_id_list])
+        return {transfer_id: self.status_dict[transfer_id] for transfer_id in pending_transfer_id_list}
+
+    @common.only_in_dev
+    async def advance_async(self, transfer_id_list: List[int], status_list: List[TransferStatus] | None = None) -> Dict[int, str]:
+        status_list = TransferStatusTracker.simulation_status_list if status_list is None else status_list
+        for status in status_list:
+            await asyncio.gather(*[self._simulate_status_async(transfer_id, status) for transfer_id in transfer_id_list])
+
+        return {transfer_id: self.status_dict[transfer_id] for transfer_id in transfer_id_list if transfer_id in self.status_dict}
+
+    @common.only_in_dev
+    async def complete_all_async(self) -> Dict[int, str]:
+        return await self.advance_async(await self.get_transfer_id_list_async(TransferStatus.PROCESSING))
+
+    async def _poll_until_done_async(self, future: "asyncio.Future[str]", polling_interval_seconds: float) -> str:
+        while not future.done():
+            await self.poll_async()
+            if not future.done():
+                await asyncio.wait([future], timeout=polling_interval_seconds)
+
+        return future.result()
+
+    def _set_status(self, transfer_id: int, status: str) -> None:
+        self.status_dict[transfer_id] = status
+        future: asyncio.Future[str] | None = self._future_dict.get(transfer_id)
+        if future is not None and not future.done() and status in TransferStatusTracker.terminal_status_list:
+            future.set_result(status)
+
+    async def _get_status_async(self, transfer_id: int) -> None:
+        async with self.semaphore:
+            http_response: HTTPResponse = await self.profile.http_session.get(constants.ENDPOINT__TRANSFER__GET.replace("$transferId", str(transfer_id)))
+            self._set_status(transfer_id, http_response.data["status"])
+
+    async def _simulate_status_async(self, transfer_id: int, status: TransferStatus) -> None:
+        async with self.semaphore:
+            try:
+                http_response: HTTPResponse = await self.profile.http_session.get(
+                    constants.ENDPOINT__SIMULATION__COMPLETE_TRANSFER.replace("$transferId", str(transfer_id)).replace("$status", status.value))
+            except HTTPException:
+                return
+
+        self._set_status(transfer_id, http_response.data.get("status", status.value) if isinstance(http_response.data, dict) else status.value)
+
+
 class DebitCard(DataClass):
     profile: Profile
     token: str
@@ -736,7 +1828,11 @@ class DebitCard(DataClass):
     # TODO: Find out why this endpoint returns a 403 (Unauthorized)
     @staticmethod
     def get_all(profile: Profile) -> List["DebitCard"]:
-        response: HTTPResponse = profile.http_session.get(constants.ENDPOINT__DEBIT_CARD__GET_ALL.replace("$profileId", str(profile.id)))
+        return common.run_coroutine_synchronously(DebitCard.get_all_async(profile))
+
+    @staticmethod
+    async def get_all_async(profile: Profile) -> List["DebitCard"]:
+        response: HTTPResponse = await profile.http_session.get(constants.ENDPOINT__DEBIT_CARD__GET_ALL.replace("$profileId", str(profile.id)))
         return [DebitCard(
             profile=profile,
             token=data["token"],
@@ -754,18 +1850,20 @@ class AccountDebit(DataClass):
 
     @staticmethod
     def get_from_request_data(request_data: Dict[str, Any], wise_account: WiseAccount) -> "AccountDebit":
+        return common.run_coroutine_synchronously(AccountDebit.get_from_request_data_async(request_data, wise_account))
+
+    @staticmethod
+    async def get_from_request_data_async(request_data: Dict[str, Any], wise_account: WiseAccount) -> "AccountDebit":
         personal_profile: PersonalProfile = wise_account.personal_profile
+        await personal_profile.load_async(["cash_account_list", "reserve_account_list", "recipient_list"])
         id: int = request_data["data"]["resource"]["id"]
-        cash_account: CashAccount
-        transaction: Transaction
+        transaction: Transaction | None = AccountDebit._get_transaction_by_id(personal_profile, id)
 
-        for ca in personal_profile.cash_account_list:
-            try:
-                transaction = next(filter(lambda t: id == t.id, ca.get_transactions()))
-                cash_account = cast(CashAccount, transaction.account)
-                break
-            except StopIteration:
-                continue
+        if transaction is None:
+            http_response: HTTPResponse = await personal_profile.http_session.get(constants.ENDPOINT__TRANSFER__GET.replace("$transferId", str(id)))
+            cash_account: CashAccount = await personal_profile.get_cash_account_async(Currency(http_response.data["sourceCurrency"]))
+            await cash_account.transaction_store.sync_async()
+            transaction = cash_account.transaction_store.get_transaction_by_id(id)
 
         return AccountDebit(wise_id=request_data["data"]["resource"]["id"],
                             is_attempted=request_data["data"]["current_state"] == "incoming_payment_waiting",
@@ -773,6 +1871,15 @@ class AccountDebit(DataClass):
                             timestamp=request_data["data"]["occurred_at"],
                             transaction=transaction)
 
+    @staticmethod
+    def _get_transaction_by_id(profile: Profile, transaction_id: int) -> Transaction | None:
+        for cash_account in profile.cash_account_list:
+            transaction: Transaction | None = cash_account.transaction_store.get_transaction_by_id(transaction_id)
+            if transaction is not None:
+                return transaction
+
+        return None
+
 
 class AccountCredit(DataClass):
     wise_id: int
@@ -783,34 +1890,77 @@ class AccountCredit(DataClass):
 
     @staticmethod
     def get_from_request_data(request_data: Dict[str, Any], wise_account: WiseAccount) -> "AccountCredit":
+        return common.run_coroutine_synchronously(AccountCredit.get_from_request_data_async(request_data, wise_account))
+
+    @staticmethod
+    async def get_from_request_data_async(request_data: Dict[str, Any], wise_account: WiseAccount) -> "AccountCredit":
         personal_profile: PersonalProfile = wise_account.personal_profile
-        cash_account: CashAccount = personal_profile.get_cash_account(Currency(request_data["data"]["currency"]))
+        await personal_profile.load_async(["reserve_account_list", "recipient_list"])
+        cash_account: CashAccount = await personal_profile.get_cash_account_async(Currency(request_data["data"]["currency"]))
         timestamp: datetime.datetime = common.get_timestamp_from_string(request_data["data"]["occurred_at"], "UTC")
+        account_balance: Decimal = Decimal(str(request_data["data"]["post_transaction_balance_amount"]))
+        cash_account.apply_balance_update(account_balance, timestamp)
 
-        try:
-            transaction: Transaction | None = next(filter(lambda t: int(t.timestamp.timestamp()) == int(timestamp.timestamp()), cash_account.get_transactions()))
-        except StopIteration:
-            transaction = None
+        transaction_list: List[Transaction] = cash_account.transaction_store.get_transaction_list_by_timestamp(timestamp)
+        if len(transaction_list) == 0:
+            await cash_account.transaction_store.sync_async()
+            transaction_list = cash_account.transaction_store.get_transaction_list_by_timestamp(timestamp)
+
+        transaction: Transaction | None = transaction_list[0] if len(transaction_list) > 0 else None
 
         return AccountCredit(wise_id=request_data["data"]["resource"]["id"],
                              account=cash_account,
                              transaction=transaction,
-                             account_balance=Decimal(request_data["data"]["post_transaction_balance_amount"]),
+                             account_balance=account_balance,
                              timestamp=request_data["data"]["occurred_at"])
 
 
 class WiseWebhook:
+    number_of_dropped_balance_updates: int = 0
 
     @classmethod
     def get_balance_update_object(cls, request_data: Dict[str, Any],
                                   wise_account: WiseAccount) -> AccountDebit | AccountCredit | None:
         if request_data["event_type"] == "transfers#state-change":
             return AccountDebit.get_from_request_data(request_data, wise_account)
-        elif request_data["event_type"] == "balances#credit":
+        elif request_data["event_type"] == WebhookAccountUpdateType.CREDIT.value:
             return AccountCredit.get_from_request_data(request_data, wise_account)
+        elif request_data["event_type"] == WebhookAccountUpdateType.UPDATE.value:
+            cls.apply_balance_update(request_data, wise_account)
+
+        return None
+
+    @classmethod
+    async def get_balance_update_object_async(cls, request_data: Dict[str, Any],
+                                              wise_account: WiseAccount) -> AccountDebit | AccountCredit | None:
+        if request_data["event_type"] == "transfers#state-change":
+            return await AccountDebit.get_from_request_data_async(request_data, wise_account)
+        elif request_data["event_type"] == WebhookAccountUpdateType.CREDIT.value:
+            return await AccountCredit.get_from_request_data_async(request_data, wise_account)
+        elif request_data["event_type"] == WebhookAccountUpdateType.UPDATE.value:
+            cls.apply_balance_update(request_data, wise_account)
 
         return None
 
+    @classmethod
+    def apply_balance_update(cls, request_data: Dict[str, Any], wise_account: WiseAccount) -> bool:
+        data: Dict[str, Any] = request_data["data"]
+        profile: Profile = next((profile for profile in [wise_account.personal_profile, wise_account.business_profile]
+                                 if profile.id == data["resource"].get("profile_id")), wise_account.personal_profile)
+        balance_id: int = data.get("balance_id", data["resource"]["id"])
+        account: Account | None = profile._cash_account_by_id_dict.get(balance_id, profile._reserve_account_by_id_dict.get(balance_id))
+
+        if account is None:
+            cls.number_of_dropped_balance_updates = cls.number_of_dropped_balance_updates + 1
+            logger.warning(f"Wise balance update dropped because the account is not loaded\n"
+                           f"Profile ID: {profile.id}\n"
+                           f"Balance ID: {balance_id}\n"
+                           f"Occurred At: {data.get('occurred_at')}")
+            return False
+
+        return account.apply_balance_update(Decimal(str(data["post_transaction_balance_amount"])),
+                                            common.get_timestamp_from_string(data["occurred_at"], "UTC"))
+
 
 WiseAccount.model_rebuild()
 Profile.model_rebuild()
@@ -819,5 +1969,10 @@ BusinessProfile.model_rebuild()
 Account.model_rebuild()
 DebitCard.model_rebuild()
 Transaction.model_rebuild()
+TransactionStore.model_rebuild()
 AccountDebit.model_rebuild()
 AccountCredit.model_rebuild()
+WiseAccountRegistry.model_rebuild()
+TransferStatusTracker.model_rebuild()
+BatchTransferItem.model_rebuild()
+BatchTransfer.model_rebuild()
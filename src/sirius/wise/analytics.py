@@ -0,0 +1,281 @@
+import datetime
+import asyncio
+import itertools
+from _decimal import Decimal, ROUND_HALF_UP
+from typing import List, Dict, AsyncIterator, Union
+
+import numpy
+from numpy import ndarray
+from pydantic import PrivateAttr
+
+from sirius import common
+from sirius.common import DataClass, Currency
+from sirius.wise import Account, Transaction, TransactionType, ReserveAccount, Recipient, WiseAccount, Profile
+
+EPOCH: datetime.datetime = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+TRANSACTION_TYPE_LIST: List[TransactionType] = list(TransactionType)
+
+
+class DailyTransactionAggregate(DataClass):
+    date_array: ndarray
+    credit_amount_array: ndarray
+    debit_amount_array: ndarray
+    net_amount_array: ndarray
+    number_of_transactions_array: ndarray
+
+
+class CounterpartyTransactionTotal(DataClass):
+    third_party_list: List[str]
+    total_amount_array: ndarray
+    number_of_transactions_array: ndarray
+
+
+class TransactionFrame(DataClass):
+    account: Account
+    id_array: ndarray
+    timestamp_array: ndarray
+    amount_array: ndarray
+    amount_scale: int
+    type_code_array: ndarray
+    third_party_code_array: ndarray
+    third_party_list: List[str]
+
+    @property
+    def number_of_transactions(self) -> int:
+        return len(self.amount_array)
+
+    @property
+    def type_list(self) -> List[TransactionType]:
+        return TRANSACTION_TYPE_LIST
+
+    def get_decimal(self, amount: int) -> Decimal:
+        return Decimal(int(amount)).scaleb(-self.amount_scale)
+
+    def get_decimal_list(self, amount_array: ndarray) -> List[Decimal]:
+        return [self.get_decimal(amount) for amount in amount_array.tolist()]
+
+    def get_total_amount(self) -> Decimal:
+        return self.get_decimal(int(self.amount_array.sum()))
+
+    def get_running_balance_array(self, closing_balance: Decimal | None = None) -> ndarray:
+        running_balance_array: ndarray = numpy.cumsum(self.amount_array)
+        if closing_balance is None or self.number_of_transactions == 0:
+            return running_balance_array
+
+        return running_balance_array + (TransactionFrame._get_scaled_amount(closing_balance, self.amount_scale) - running_balance_array[-1])
+
+    def get_daily_aggregate(self) -> DailyTransactionAggregate:
+        date_array, date_index_array = numpy.unique(self.timestamp_array.astype("datetime64[D]"), return_inverse=True)
+        credit_amount_array: ndarray = numpy.zeros(len(date_array), dtype=numpy.int64)
+        debit_amount_array: ndarray = numpy.zeros(len(date_array), dtype=numpy.int64)
+        is_credit_array: ndarray = self.amount_array > 0
+
+        numpy.add.at(credit_amount_array, date_index_array[is_credit_array], self.amount_array[is_credit_array])
+        numpy.add.at(debit_amount_array, date_index_array[~is_credit_array], self.amount_array[~is_credit_array])
+
+        return DailyTransactionAggregate(date_array=date_array,
+                                         credit_amount_array=credit_amount_array,
+                                         debit_amount_array=debit_amount_array,
+                                         net_amount_array=credit_amount_array + debit_amount_array,
+                                         number_of_transactions_array=numpy.bincount(date_index_array, minlength=len(date_array)))
+
+    def get_counterparty_total(self) -> CounterpartyTransactionTotal:
+        total_amount_array: ndarray = numpy.zeros(len(self.third_party_list), dtype=numpy.int64)
+        numpy.add.at(total_amount_array, self.third_party_code_array, self.amount_array)
+
+        return CounterpartyTransactionTotal(third_party_list=self.third_party_list,
+                                            total_amount_array=total_amount_array,
+                                            number_of_transactions_array=numpy.bincount(self.third_party_code_array, minlength=len(self.third_party_list)))
+
+    def filter_by_type(self, transaction_type: TransactionType) -> "TransactionFrame":
+        return self.filter(self.type_code_array == TRANSACTION_TYPE_LIST.index(transaction_type))
+
+    def filter_by_time(self, from_time: datetime.datetime, to_time: datetime.datetime) -> "TransactionFrame":
+        return self.filter((self.timestamp_array >= TransactionFrame._get_datetime64(from_time)) & (self.timestamp_array < TransactionFrame._get_datetime64(to_time)))
+
+    def filter(self, mask_array: ndarray) -> "TransactionFrame":
+        return TransactionFrame(account=self.account,
+                                id_array=self.id_array[mask_array],
+                                timestamp_array=self.timestamp_array[mask_array],
+                                amount_array=self.amount_array[mask_array],
+                                amount_scale=self.amount_scale,
+                                type_code_array=self.type_code_array[mask_array],
+                                third_party_code_array=self.third_party_code_array[mask_array],
+                                third_party_list=self.third_party_list)
+
+    @staticmethod
+    def from_transaction_list(account: Account, transaction_list: List[Transaction], amount_scale: int = 2) -> "TransactionFrame":
+        transaction_list = sorted(transaction_list, key=lambda t: t.timestamp)
+        type_code_dict: Dict[TransactionType, int] = {transaction_type: i for i, transaction_type in enumerate(TRANSACTION_TYPE_LIST)}
+        third_party_code_dict: Dict[str, int] = {}
+        third_party_code_list: List[int] = [third_party_code_dict.setdefault(TransactionFrame._get_third_party_name(t.third_party), len(third_party_code_dict))
+                                            for t in transaction_list]
+
+        return TransactionFrame(
+            account=account,
+            id_array=numpy.array([-1 if t.id is None else t.id for t in transaction_list], dtype=numpy.int64),
+            timestamp_array=numpy.fromiter((TransactionFrame._get_epoch_microseconds(t.timestamp) for t in transaction_list), dtype=numpy.int64, count=len(transaction_list)).astype("datetime64[us]"),
+            amount_array=numpy.fromiter((TransactionFrame._get_scaled_amount(t.amount, amount_scale) for t in transaction_list), dtype=numpy.int64, count=len(transaction_list)),
+            amount_scale=amount_scale,
+            type_code_array=numpy.array([type_code_dict[t.type] for t in transaction_list], dtype=numpy.int8),
+            third_party_code_array=numpy.array(third_party_code_list, dtype=numpy.int32),
+            third_party_list=list(third_party_code_dict.keys())
+        )
+
+    @staticmethod
+    async def from_transaction_stream(account: Account, transaction_stream: AsyncIterator[Transaction]) -> "TransactionFrame":
+        return TransactionFrame.from_transaction_list(account, [transaction async for transaction in transaction_stream])
+
+    @staticmethod
+    def get(account: Account, from_time: datetime.datetime, to_time: datetime.datetime | None = None) -> "TransactionFrame":
+        return common.run_coroutine_synchronously(TransactionFrame.get_async(account, from_time, to_time))
+
+    @staticmethod
+    async def get_async(account: Account, from_time: datetime.datetime, to_time: datetime.datetime | None = None) -> "TransactionFrame":
+        return await TransactionFrame.from_transaction_stream(account, account.get_transaction_stream(from_time, to_time))
+
+    @staticmethod
+    def _get_third_party_name(third_party: Union[str, ReserveAccount, Recipient]) -> str:
+        if isinstance(third_party, ReserveAccount):
+            return f"{third_party.name} ({third_party.currency.value})"
+        elif isinstance(third_party, Recipient):
+            return f"{third_party.account_holder_name} ({third_party.account_number})"
+
+        return third_party
+
+    @staticmethod
+    def _get_scaled_amount(amount: Decimal, amount_scale: int) -> int:
+        return int(amount.scaleb(amount_scale).to_integral_value(rounding=ROUND_HALF_UP))
+
+    @staticmethod
+    def _get_epoch_microseconds(timestamp: datetime.datetime) -> int:
+        timestamp = timestamp if timestamp.tzinfo is not None else timestamp.replace(tzinfo=datetime.timezone.utc)
+        return (timestamp - EPOCH) // datetime.timedelta(microseconds=1)
+
+    @staticmethod
+    def _get_datetime64(timestamp: datetime.datetime) -> numpy.datetime64:
+        return numpy.datetime64(TransactionFrame._get_epoch_microseconds(timestamp), "us")
+
+
+class PortfolioValuation(DataClass):
+    wise_account: WiseAccount
+    base_currency: Currency
+    account_list: List[Account]
+    currency_list: List[Currency]
+    currency_code_array: ndarray
+    balance_array: ndarray
+    exchange_rate_array: ndarray
+    value_array: ndarray
+    amount_scale: int = 2
+    exchange_rate_scale: int = 6
+    total_value: int
+    exchange_rate_timestamp: datetime.datetime
+    _account_index_dict: Dict[int, int] = PrivateAttr(default_factory=dict)
+
+    def get_decimal(self, amount: int) -> Decimal:
+        return Decimal(int(amount)).scaleb(-self.amount_scale)
+
+    def get_total_value(self) -> Decimal:
+        return self.get_decimal(self.total_value)
+
+    def get_value(self, account: Account) -> Decimal:
+        return self.get_decimal(self.value_array[self._account_index_dict[id(account)]])
+
+    def get_value_by_currency(self) -> Dict[Currency, Decimal]:
+        value_by_currency_array: ndarray = numpy.zeros(len(self.currency_list), dtype=numpy.int64)
+        numpy.add.at(value_by_currency_array, self.currency_code_array, self.value_array)
+        return {currency: self.get_decimal(value) for currency, value in zip(self.currency_list, value_by_currency_array.tolist())}
+
+    def is_above(self, threshold: Decimal) -> bool:
+        return self.get_total_value() > threshold
+
+    def is_below(self, threshold: Decimal) -> bool:
+        return self.get_total_value() < threshold
+
+    def update(self, account: Account) -> Decimal:
+        return common.run_coroutine_synchronously(self.update_async(account))
+
+    async def update_async(self, account: Account) -> Decimal:
+        if id(account) not in self._account_index_dict:
+            await self._add_account_async(account)
+            return self.get_total_value()
+
+        index: int = self._account_index_dict[id(account)]
+        balance: int = TransactionFrame._get_scaled_amount(account.balance, self.amount_scale)
+        value: int = int(self._get_scaled_value(numpy.int64(balance), self.exchange_rate_array[index]))
+
+        self.total_value = self.total_value + value - int(self.value_array[index])
+        self.balance_array[index] = balance
+        self.value_array[index] = value
+        return self.get_total_value()
+
+    def update_all(self) -> Decimal:
+        self.balance_array = numpy.fromiter((TransactionFrame._get_scaled_amount(account.balance, self.amount_scale) for account in self.account_list), dtype=numpy.int64, count=len(self.account_list))
+        self._compute()
+        return self.get_total_value()
+
+    def refresh_exchange_rates(self) -> Decimal:
+        return common.run_coroutine_synchronously(self.refresh_exchange_rates_async())
+
+    async def refresh_exchange_rates_async(self) -> Decimal:
+        exchange_rate_dict: Dict[Currency, Decimal] = await self.wise_account.personal_profile.get_exchange_rate_dict_async(self.currency_list, self.base_currency)
+        self.exchange_rate_array = numpy.fromiter((TransactionFrame._get_scaled_amount(exchange_rate_dict[currency], self.exchange_rate_scale) for currency in self.currency_list),
+                                                  dtype=numpy.int64, count=len(self.currency_list))[self.currency_code_array]
+        self.exchange_rate_timestamp = datetime.datetime.now(datetime.timezone.utc)
+        return self.update_all()
+
+    def _compute(self) -> None:
+        self.value_array = self._get_scaled_value(self.balance_array, self.exchange_rate_array)
+        self.total_value = int(self.value_array.sum())
+
+    async def _add_account_async(self, account: Account) -> None:
+        if account.currency in self.currency_list:
+            exchange_rate: int = int(self.exchange_rate_array[self.currency_code_array.tolist().index(self.currency_list.index(account.currency))])
+        else:
+            exchange_rate = TransactionFrame._get_scaled_amount(await self.wise_account.personal_profile.get_exchange_rate_async(account.currency, self.base_currency), self.exchange_rate_scale)
+            self.currency_list.append(account.currency)
+
+        balance: int = TransactionFrame._get_scaled_amount(account.balance, self.amount_scale)
+        value: int = int(self._get_scaled_value(numpy.int64(balance), numpy.int64(exchange_rate)))
+
+        self._account_index_dict[id(account)] = len(self.account_list)
+        self.account_list.append(account)
+        self.currency_code_array = numpy.append(self.currency_code_array, numpy.int32(self.currency_list.index(account.currency)))
+        self.balance_array = numpy.append(self.balance_array, numpy.int64(balance))
+        self.exchange_rate_array = numpy.append(self.exchange_rate_array, numpy.int64(exchange_rate))
+        self.value_array = numpy.append(self.value_array, numpy.int64(value))
+        self.total_value = self.total_value + value
+
+    def _get_scaled_value(self, balance_array: ndarray | numpy.int64, exchange_rate_array: ndarray | numpy.int64) -> ndarray:
+        divisor: int = 10 ** self.exchange_rate_scale
+        product_array: ndarray = numpy.multiply(balance_array, exchange_rate_array, dtype=numpy.int64)
+        return numpy.sign(product_array) * ((numpy.abs(product_array) + divisor // 2) // divisor)
+
+    @staticmethod
+    def get(wise_account: WiseAccount, base_currency: Currency) -> "PortfolioValuation":
+        return common.run_coroutine_synchronously(PortfolioValuation.get_async(wise_account, base_currency))
+
+    @staticmethod
+    async def get_async(wise_account: WiseAccount, base_currency: Currency) -> "PortfolioValuation":
+        profile_list: List[Profile] = [wise_account.personal_profile, wise_account.business_profile]
+        await asyncio.gather(*[profile.load_async(["cash_account_list", "reserve_account_list"]) for profile in profile_list])
+
+        account_list: List[Account] = list(itertools.chain.from_iterable(profile.cash_account_list + profile.reserve_account_list for profile in profile_list))  # type: ignore[operator]
+        currency_list: List[Currency] = list(dict.fromkeys(account.currency for account in account_list))
+        currency_code_dict: Dict[Currency, int] = {currency: i for i, currency in enumerate(currency_list)}
+
+        portfolio_valuation: PortfolioValuation = PortfolioValuation(
+            wise_account=wise_account,
+            base_currency=base_currency,
+            account_list=account_list,
+            currency_list=currency_list,
+            currency_code_array=numpy.array([currency_code_dict[account.currency] for account in account_list], dtype=numpy.int32),
+            balance_array=numpy.zeros(len(account_list), dtype=numpy.int64),
+            exchange_rate_array=numpy.zeros(len(account_list), dtype=numpy.int64),
+            value_array=numpy.zeros(len(account_list), dtype=numpy.int64),
+            total_value=0,
+            exchange_rate_timestamp=datetime.datetime.now(datetime.timezone.utc)
+        )
+        portfolio_valuation._account_index_dict = {id(account): i for i, account in enumerate(account_list)}
+        await portfolio_valuation.refresh_exchange_rates_async()
+        return portfolio_valuation
@@ -6,17 +6,34 @@ ENDPOINT__ACCOUNT__GET_ALL__CASH_ACCOUNT: str = f"{URL}/v4/profiles/$profileId/b
 ENDPOINT__ACCOUNT__GET_ALL__RESERVE_ACCOUNT: str = f"{URL}/v4/profiles/$profileId/balances?types=SAVINGS"
 
 ENDPOINT__BALANCE__MOVE_MONEY_BETWEEN_BALANCES: str = f"{URL}/v2/profiles/$profileId/balance-movements"
+ENDPOINT__BALANCE__GET: str = f"{URL}/v4/profiles/$profileId/balances/$balanceId"
 ENDPOINT__BALANCE__OPEN: str = f"{URL}/v3/profiles/$profileId/balances"
 ENDPOINT__BALANCE__CLOSE: str = f"{URL}/v3/profiles/$profileId/balances/$balanceId"
 ENDPOINT__BALANCE__GET_TRANSACTIONS: str = f"{URL}/v1/profiles/$profileId/balance-statements/$balanceId/statement.json"
 ENDPOINT__TRANSFER__CREATE_THIRD_PARTY_TRANSFER: str = f"{URL}/v1/transfers"
 ENDPOINT__TRANSFER__FUND_THIRD_PARTY_TRANSFER: str = f"{URL}/v3/profiles/$profileId/transfers/$transferId/payments"
 ENDPOINT__TRANSFER__GET_ALL: str = f"{URL}/v1/transfers??profile=$profileId"
+ENDPOINT__TRANSFER__GET: str = f"{URL}/v1/transfers/$transferId"
+ENDPOINT__BATCH_GROUP__CREATE: str = f"{URL}/v3/profiles/$profileId/batch-groups"
+ENDPOINT__BATCH_GROUP__GET: str = f"{URL}/v3/profiles/$profileId/batch-groups/$batchGroupId"
+ENDPOINT__BATCH_GROUP__CREATE_TRANSFER: str = f"{URL}/v3/profiles/$profileId/batch-groups/$batchGroupId/transfers"
+ENDPOINT__BATCH_GROUP__FUND: str = f"{URL}/v3/profiles/$profileId/batch-payments/$batchGroupId/payments"
 ENDPOINT__DEBIT_CARD__GET_ALL: str = f"{URL}/v3/spend/profiles/$profileId/cards"
 
 ENDPOINT__QUOTE__GET: str = f"{URL}/v3/profiles/$profileId/quotes"
 ENDPOINT__INTRA_ACCOUNT_TRANSFER__CREATE: str = f"{URL}/v2/profiles/$profileId/balance-movements"
 ENDPOINT__RECIPIENT__GET_ALL: str = f"{URL}/v1/accounts?profile=$profileId"
+ENDPOINT__RATE__GET: str = f"{URL}/v1/rates"
 
 ENDPOINT__SIMULATION__TOP_UP: str = f"{URL}/v1/simulation/balance/topup"
 ENDPOINT__SIMULATION__COMPLETE_TRANSFER: str = f"{URL}/v1/simulation/transfers/$transferId/$status"
+
+QUOTE_EXPIRY_MARGIN_SECONDS: int = 60
+EXCHANGE_RATE_CACHE_TTL_SECONDS: int = 60
+BATCH_TRANSFER_MAXIMUM_NUMBER_OF_TRANSFERS: int = 1000
+TRANSFER_LIST_PAGE_SIZE: int = 200
+STATEMENT_CHUNK_SIZE_HOURS: int = 24 * 7
+BALANCE_RECONCILIATION_CRON_MINUTE: str = "*/15"
+REGISTERED_ACCOUNT_MAXIMUM_NUMBER_OF_CONNECTIONS: int = 20
+REGISTERED_ACCOUNT_MAXIMUM_REQUESTS_PER_SECOND: float = 10
+REGISTERED_ACCOUNT_SCHEDULE_STAGGER_SECONDS: int = 7
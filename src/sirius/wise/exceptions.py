@@ -5,6 +5,10 @@ class WiseException(SiriusException):
     pass
 
 
+class WiseAccountNotFoundException(WiseException, SDKClientException):
+    pass
+
+
 class CashAccountNotFoundException(WiseException, SDKClientException):
     pass
 
@@ -15,3 +19,7 @@ class ReserveAccountNotFoundException(WiseException, SDKClientException):
 
 class RecipientNotFoundException(WiseException, SDKClientException):
     pass
+
+
+class WebhookQueueFullException(WiseException):
+    pass
@@ -0,0 +1,548 @@
+import asyncio
+import datetime
+import inspect
+import json
+import re
+import threading
+import uuid
+from _decimal import Decimal, ROUND_HALF_UP
+from typing import List, Dict, Any, Callable, Tuple, Pattern
+
+import httpx
+from httpx import AsyncBaseTransport, Request, Response
+
+from sirius import common
+from sirius.common import DataClass, Currency
+from sirius.http_requests import AsyncHTTPSession
+from sirius.wise import constants, WiseAccount, WiseAccountType, Profile
+
+
+class WiseSandboxException(Exception):
+    status_code: int
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class WiseSandboxBalance(DataClass):
+    id: int
+    profile_id: int
+    currency: Currency
+    type: str
+    name: str | None
+    amount: Decimal
+    transaction_list: List[Dict[str, Any]] = []
+
+
+class WiseSandboxRecipient(DataClass):
+    id: int
+    profile_id: int
+    account_holder_name: str
+    currency: Currency
+    account_number: str
+    is_self_owned: bool
+
+
+class WiseSandboxQuote(DataClass):
+    id: str
+    profile_id: int
+    from_currency: Currency
+    to_currency: Currency
+    from_amount: Decimal
+    to_amount: Decimal
+    exchange_rate: Decimal
+
+
+class WiseSandboxTransfer(DataClass):
+    id: int
+    profile_id: int
+    quote: WiseSandboxQuote
+    recipient: WiseSandboxRecipient
+    reference: str
+    status: str
+    is_funded: bool = False
+
+
+class WiseSandboxBatchGroup(DataClass):
+    id: int
+    profile_id: int
+    name: str | None
+    currency: Currency
+    version: int = 0
+    status: str = "NEW"
+    transfer_list: List[WiseSandboxTransfer] = []
+
+
+class WiseSandbox(AsyncBaseTransport):
+    latency_seconds: float
+    profile_list: List[Dict[str, Any]]
+    balance_dict: Dict[int, WiseSandboxBalance]
+    recipient_dict: Dict[int, WiseSandboxRecipient]
+    quote_dict: Dict[str, WiseSandboxQuote]
+    transfer_dict: Dict[int, WiseSandboxTransfer]
+    batch_group_dict: Dict[int, WiseSandboxBatchGroup]
+    exchange_rate_dict: Dict[Tuple[Currency, Currency], Decimal]
+    webhook_handler_list: List[Callable[[Dict[str, Any]], Any]]
+    request_list: List[Tuple[str, str]]
+    _route_list: List[Tuple[str, Pattern, Callable[..., Any]]]
+    _lock: threading.Lock
+    _last_id: int
+
+    def __init__(self, latency_seconds: float = 0) -> None:
+        self.latency_seconds = latency_seconds
+        self.profile_list = [{"id": 1, "type": "PERSONAL"}, {"id": 2, "type": "BUSINESS"}]
+        self.balance_dict = {}
+        self.recipient_dict = {}
+        self.quote_dict = {}
+        self.transfer_dict = {}
+        self.batch_group_dict = {}
+        self.exchange_rate_dict = {}
+        self.webhook_handler_list = []
+        self.request_list = []
+        self._lock = threading.Lock()
+        self._last_id = 1000
+        route_list: List[Tuple[str, str, Callable[..., Any]]] = [
+            ("GET", r"/v2/profiles", self._get_profile_list),
+            ("GET", r"/v4/profiles/(\d+)/balances", self._get_balance_list),
+            ("GET", r"/v4/profiles/(\d+)/balances/(\d+)", self._get_balance),
+            ("POST", r"/v3/profiles/(\d+)/balances", self._open_balance),
+            ("DELETE", r"/v3/profiles/(\d+)/balances/(\d+)", self._close_balance),
+            ("POST", r"/v2/profiles/(\d+)/balance-movements", self._move_money_between_balances),
+            ("GET", r"/v1/profiles/(\d+)/balance-statements/(\d+)/statement.json", self._get_statement),
+            ("POST", r"/v3/profiles/(\d+)/quotes", self._create_quote),
+            ("GET", r"/v1/rates", self._get_exchange_rate_list),
+            ("GET", r"/v1/accounts", self._get_recipient_list),
+            ("GET", r"/v3/spend/profiles/(\d+)/cards", self._get_debit_card_list),
+            ("POST", r"/v1/transfers", self._create_transfer),
+            ("GET", r"/v1/transfers", self._get_transfer_list),
+            ("GET", r"/v1/transfers/(\d+)", self._get_transfer),
+            ("POST", r"/v3/profiles/(\d+)/transfers/(\d+)/payments", self._fund_transfer),
+            ("POST", r"/v3/profiles/(\d+)/batch-groups", self._create_batch_group),
+            ("GET", r"/v3/profiles/(\d+)/batch-groups/(\d+)", self._get_batch_group),
+            ("PATCH", r"/v3/profiles/(\d+)/batch-groups/(\d+)", self._update_batch_group),
+            ("POST", r"/v3/profiles/(\d+)/batch-groups/(\d+)/transfers", self._create_batch_group_transfer),
+            ("POST", r"/v3/profiles/(\d+)/batch-payments/(\d+)/payments", self._fund_batch_group),
+            ("POST", r"/v1/simulation/balance/topup", self._simulate_top_up),
+            ("GET", r"/v1/simulation/transfers/(\d+)/(\w+)", self._simulate_transfer_status),
+        ]
+        self._route_list = [(method, re.compile(f"^{path}$"), handler) for method, path, handler in route_list]
+
+    def __enter__(self) -> "WiseSandbox":
+        self.install()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.uninstall()
+
+    @property
+    def number_of_requests(self) -> int:
+        return len(self.request_list)
+
+    def install(self) -> None:
+        AsyncHTTPSession.set_transport(constants.URL, self)
+
+    def uninstall(self) -> None:
+        AsyncHTTPSession.set_transport(constants.URL, None)
+
+    def get_wise_account(self, wise_account_type: WiseAccountType = WiseAccountType.PRIMARY, is_lazy: bool = False) -> WiseAccount:
+        return common.run_coroutine_synchronously(self.get_wise_account_async(wise_account_type, is_lazy))
+
+    async def get_wise_account_async(self, wise_account_type: WiseAccountType = WiseAccountType.PRIMARY, is_lazy: bool = False) -> WiseAccount:
+        wise_account: WiseAccount = WiseAccount._construct(wise_account_type, "sandbox")
+        if is_lazy:
+            wise_account._set_profile_list(await Profile.get_all_async(wise_account, True))
+        else:
+            await wise_account._initialize_async()
+
+        return wise_account
+
+    def add_balance(self, profile_id: int, currency: Currency, amount: Decimal = Decimal("0"), name: str | None = None,
+                    is_reserve_account: bool = False) -> WiseSandboxBalance:
+        balance: WiseSandboxBalance = WiseSandboxBalance(id=self._get_new_id(), profile_id=profile_id, currency=currency,
+                                                         type="SAVINGS" if is_reserve_account else "STANDARD", name=name, amount=amount)
+        self.balance_dict[balance.id] = balance
+        return balance
+
+    def add_recipient(self, profile_id: int, account_holder_name: str, currency: Currency, account_number: str,
+                      is_self_owned: bool = False) -> WiseSandboxRecipient:
+        recipient: WiseSandboxRecipient = WiseSandboxRecipient(id=self._get_new_id(), profile_id=profile_id, account_holder_name=account_holder_name,
+                                                               currency=currency, account_number=account_number, is_self_owned=is_self_owned)
+        self.recipient_dict[recipient.id] = recipient
+        return recipient
+
+    def set_exchange_rate(self, from_currency: Currency, to_currency: Currency, exchange_rate: Decimal) -> None:
+        self.exchange_rate_dict[(from_currency, to_currency)] = exchange_rate
+
+    def get_exchange_rate(self, from_currency: Currency, to_currency: Currency) -> Decimal:
+        if from_currency == to_currency:
+            return Decimal("1")
+        elif (from_currency, to_currency) in self.exchange_rate_dict:
+            return self.exchange_rate_dict[(from_currency, to_currency)]
+        elif (to_currency, from_currency) in self.exchange_rate_dict:
+            return (Decimal("1") / self.exchange_rate_dict[(to_currency, from_currency)]).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
+
+        return Decimal("1")
+
+    def seed(self, currency_list: List[Currency] | None = None, amount: Decimal = Decimal("0")) -> "WiseSandbox":
+        currency_list = [Currency.NZD, Currency.USD, Currency.EUR, Currency.GBP] if currency_list is None else currency_list
+        for profile in self.profile_list:
+            for currency in currency_list:
+                self.add_balance(profile["id"], currency, amount)
+            self.add_recipient(profile["id"], "John Doe", Currency.NZD, "12345678901234")
+
+        return self
+
+    async def handle_async_request(self, request: Request) -> Response:
+        await request.aread()
+        if self.latency_seconds > 0:
+            await asyncio.sleep(self.latency_seconds)
+
+        self.request_list.append((request.method, request.url.path))
+        body: Dict[str, Any] = json.loads(request.content) if request.content else {}
+        query_params: Dict[str, str] = {key.lstrip("?"): value for key, value in request.url.params.items()}
+        webhook_list: List[Dict[str, Any]] = []
+
+        try:
+            with self._lock:
+                response: Response = self._route(request.method, request.url.path, body, query_params, webhook_list)
+        except WiseSandboxException as e:
+            return httpx.Response(e.status_code, json={"errors": [{"code": "error.sandbox", "message": str(e)}]})
+
+        for webhook in webhook_list:
+            for webhook_handler in self.webhook_handler_list:
+                result: Any = webhook_handler(webhook)
+                if inspect.isawaitable(result):
+                    await result
+
+        return response
+
+    def _route(self, method: str, path: str, body: Dict[str, Any], query_params: Dict[str, str], webhook_list: List[Dict[str, Any]]) -> Response:
+        for route_method, route_pattern, route_handler in self._route_list:
+            match: re.Match | None = route_pattern.match(path)
+            if route_method == method and match is not None:
+                return httpx.Response(200, json=route_handler(*[int(group) if group.isdigit() else group for group in match.groups()],
+                                                              body=body, query_params=query_params, webhook_list=webhook_list))
+
+        raise WiseSandboxException(404, f"Endpoint not found: {method} {path}")
+
+    def _get_new_id(self) -> int:
+        self._last_id = self._last_id + 1
+        return self._last_id
+
+    def _get_balance_by_id(self, balance_id: int) -> WiseSandboxBalance:
+        if balance_id not in self.balance_dict:
+            raise WiseSandboxException(404, f"Balance not found: {balance_id}")
+
+        return self.balance_dict[balance_id]
+
+    def _get_cash_balance(self, profile_id: int, currency: Currency) -> WiseSandboxBalance:
+        balance: WiseSandboxBalance | None = next((b for b in self.balance_dict.values() if b.profile_id == profile_id and b.type == "STANDARD" and b.currency == currency), None)
+        if balance is None:
+            raise WiseSandboxException(422, f"Cash balance not found: {currency.value}")
+
+        return balance
+
+    def _get_quote_by_id(self, quote_id: str) -> WiseSandboxQuote:
+        if quote_id not in self.quote_dict:
+            raise WiseSandboxException(422, f"Quote not found: {quote_id}")
+
+        return self.quote_dict.pop(quote_id)
+
+    def _get_recipient_by_id(self, recipient_id: int) -> WiseSandboxRecipient:
+        if recipient_id not in self.recipient_dict:
+            raise WiseSandboxException(422, f"Recipient not found: {recipient_id}")
+
+        return self.recipient_dict[recipient_id]
+
+    def _apply(self, balance: WiseSandboxBalance, amount: Decimal, transaction_type: str, description: str, reference_number: str,
+               webhook_list: List[Dict[str, Any]], details: Dict[str, Any] | None = None) -> None:
+        if balance.amount + amount < 0:
+            raise WiseSandboxException(422, f"Insufficient funds in balance {balance.id}: {balance.amount} {balance.currency.value}")
+
+        timestamp: datetime.datetime = datetime.datetime.now(datetime.timezone.utc)
+        balance.amount = balance.amount + amount
+        balance.transaction_list.append({
+            "type": "CREDIT" if amount > 0 else "DEBIT",
+            "date": f"{timestamp.replace(tzinfo=None).isoformat(timespec='milliseconds')}Z",
+            "amount": {"value": float(amount), "currency": balance.currency.value},
+            "totalFees": {"value": 0, "currency": balance.currency.value},
+            "details": {"type": transaction_type, "description": description, **(details or {})},
+            "runningBalance": {"value": float(balance.amount), "currency": balance.currency.value},
+            "referenceNumber": reference_number
+        })
+
+        occurred_at: str = timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+        resource: Dict[str, Any] = {"id": balance.id, "profile_id": balance.profile_id, "type": "balance-account"}
+        webhook_list.append({"data": {"resource": resource,
+                                      "amount": float(abs(amount)),
+                                      "balance_id": balance.id,
+                                      "channel_name": transaction_type,
+                                      "currency": balance.currency.value,
+                                      "transaction_type": "credit" if amount > 0 else "debit",
+                                      "occurred_at": occurred_at,
+                                      "transfer_reference": reference_number,
+                                      "post_transaction_balance_amount": float(balance.amount)},
+                             "subscription_id": "sandbox",
+                             "event_type": "balances#update",
+                             "schema_version": "2.2.0",
+                             "sent_at": occurred_at})
+
+        if amount > 0:
+            webhook_list.append({"data": {"resource": resource,
+                                          "transaction_type": "credit",
+                                          "type": "credit",
+                                          "amount": float(amount),
+                                          "currency": balance.currency.value,
+                                          "post_transaction_balance_amount": float(balance.amount),
+                                          "occurred_at": occurred_at},
+                                 "subscription_id": "sandbox",
+                                 "event_type": "balances#credit",
+                                 "schema_version": "2.0.0",
+                                 "sent_at": occurred_at})
+
+    @staticmethod
+    def _get_balance_data(balance: WiseSandboxBalance) -> Dict[str, Any]:
+        return {"id": balance.id,
+                "currency": balance.currency.value,
+                "type": balance.type,
+                "name": balance.name,
+                "amount": {"value": float(balance.amount), "currency": balance.currency.value},
+                "cashAmount": {"value": float(balance.amount), "currency": balance.currency.value},
+                "modificationTime": balance.transaction_list[-1]["date"] if len(balance.transaction_list) > 0 else None}
+
+    @staticmethod
+    def _get_transfer_data(transfer: WiseSandboxTransfer) -> Dict[str, Any]:
+        return {"id": transfer.id,
+                "targetAccount": transfer.recipient.id,
+                "quoteUuid": transfer.quote.id,
+                "status": transfer.status,
+                "reference": transfer.reference,
+                "rate": float(transfer.quote.exchange_rate),
+                "sourceCurrency": transfer.quote.from_currency.value,
+                "sourceValue": float(transfer.quote.from_amount),
+                "targetCurrency": transfer.quote.to_currency.value,
+                "targetValue": float(transfer.quote.to_amount)}
+
+    @staticmethod
+    def _get_batch_group_data(batch_group: WiseSandboxBatchGroup) -> Dict[str, Any]:
+        return {"id": batch_group.id,
+                "version": batch_group.version,
+                "name": batch_group.name,
+                "sourceCurrency": batch_group.currency.value,
+                "status": batch_group.status,
+                "transferIds": [transfer.id for transfer in batch_group.transfer_list]}
+
+    def _get_profile_list(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        return self.profile_list
+
+    def _get_balance_list(self, profile_id: int, query_params: Dict[str, str], **kwargs: Any) -> List[Dict[str, Any]]:
+        return [WiseSandbox._get_balance_data(b) for b in self.balance_dict.values() if b.profile_id == profile_id and b.type in query_params.get("types", "STANDARD,SAVINGS").split(",")]
+
+    def _get_balance(self, profile_id: int, balance_id: int, **kwargs: Any) -> Dict[str, Any]:
+        return WiseSandbox._get_balance_data(self._get_balance_by_id(balance_id))
+
+    def _open_balance(self, profile_id: int, body: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        return WiseSandbox._get_balance_data(self.add_balance(profile_id, Currency(body["currency"]), name=body.get("name"), is_reserve_account=body["type"] == "SAVINGS"))
+
+    def _close_balance(self, profile_id: int, balance_id: int, **kwargs: Any) -> Dict[str, Any]:
+        balance: WiseSandboxBalance = self._get_balance_by_id(balance_id)
+        if balance.amount != Decimal("0"):
+            raise WiseSandboxException(422, f"Cannot close a balance with a non-zero amount: {balance.id}")
+
+        self.balance_dict.pop(balance_id)
+        return WiseSandbox._get_balance_data(balance)
+
+    def _move_money_between_balances(self, profile_id: int, body: Dict[str, Any], webhook_list: List[Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        from_amount: Decimal
+        to_amount: Decimal
+
+        if "quoteId" in body:
+            quote: WiseSandboxQuote = self._get_quote_by_id(body["quoteId"])
+            from_balance: WiseSandboxBalance = self._get_balance_by_id(body["sourceBalanceId"]) if "sourceBalanceId" in body else self._get_cash_balance(profile_id, quote.from_currency)
+            to_balance: WiseSandboxBalance = self._get_balance_by_id(body["targetBalanceId"]) if "targetBalanceId" in body else self._get_cash_balance(profile_id, quote.to_currency)
+            from_amount, to_amount = quote.from_amount, quote.to_amount
+        else:
+            from_balance = self._get_balance_by_id(body["sourceBalanceId"])
+            to_balance = self._get_balance_by_id(body["targetBalanceId"])
+            from_amount = to_amount = Decimal(str(body["amount"]["value"]))
+
+        movement_id: int = self._get_new_id()
+        is_conversion: bool = from_balance.type == to_balance.type == "STANDARD"
+        self._apply(from_balance, -from_amount, "CONVERSION",
+                    f"Converted {from_amount} {from_balance.currency.value} to {to_amount} {to_balance.currency.value}" if is_conversion else f"Moved {from_amount} {from_balance.currency.value} to {to_balance.name or to_balance.currency.value}",
+                    f"BALANCE-{movement_id}", webhook_list)
+        self._apply(to_balance, to_amount, "CONVERSION",
+                    f"Converted {from_amount} {from_balance.currency.value} to {to_amount} {to_balance.currency.value}" if is_conversion else f"Moved {to_amount} {to_balance.currency.value} from {from_balance.name or from_balance.currency.value}",
+                    f"BALANCE-{movement_id}", webhook_list)
+
+        return {"id": movement_id,
+                "type": "CONVERSION" if is_conversion else "DEPOSIT",
+                "state": "COMPLETED",
+                "creationTime": to_balance.transaction_list[-1]["date"],
+                "sourceAmount": {"value": float(from_amount), "currency": from_balance.currency.value},
+                "targetAmount": {"value": float(to_amount), "currency": to_balance.currency.value}}
+
+    def _get_statement(self, profile_id: int, balance_id: int, query_params: Dict[str, str], **kwargs: Any) -> Dict[str, Any]:
+        balance: WiseSandboxBalance = self._get_balance_by_id(balance_id)
+        interval_start: str = query_params.get("intervalStart", "0000")
+        interval_end: str = query_params.get("intervalEnd", "9999")
+        return {"accountHolder": {"type": "PERSONAL"},
+                "transactions": [t for t in reversed(balance.transaction_list) if f"{interval_start[:-1]}.000Z" <= t["date"] <= f"{interval_end[:-1]}.999Z"],
+                "query": {"intervalStart": interval_start, "intervalEnd": interval_end, "currency": balance.currency.value}}
+
+    def _create_quote(self, profile_id: int, body: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        from_currency: Currency = Currency(body["sourceCurrency"])
+        to_currency: Currency = Currency(body["targetCurrency"])
+        exchange_rate: Decimal = self.get_exchange_rate(from_currency, to_currency)
+
+        if body.get("sourceAmount") is not None:
+            from_amount: Decimal = Decimal(str(body["sourceAmount"]))
+            to_amount: Decimal = (from_amount * exchange_rate).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        else:
+            to_amount = Decimal(str(body["targetAmount"]))
+            from_amount = (to_amount / exchange_rate).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+        quote: WiseSandboxQuote = WiseSandboxQuote(id=str(uuid.uuid4()), profile_id=profile_id, from_currency=from_currency, to_currency=to_currency,
+                                                   from_amount=from_amount, to_amount=to_amount, exchange_rate=exchange_rate)
+        self.quote_dict[quote.id] = quote
+        return {"id": quote.id,
+                "rate": float(exchange_rate),
+                "sourceCurrency": from_currency.value,
+                "targetCurrency": to_currency.value,
+                "expirationTime": (datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=30)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "paymentOptions": [{"payIn": pay_in, "payOut": "BALANCE", "sourceCurrency": from_currency.value, "targetCurrency": to_currency.value,
+                                    "sourceAmount": float(from_amount), "targetAmount": float(to_amount)} for pay_in in ["BALANCE", "BANK_TRANSFER"]]}
+
+    def _get_exchange_rate_list(self, query_params: Dict[str, str], **kwargs: Any) -> List[Dict[str, Any]]:
+        time: str = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+0000")
+        if "source" in query_params and "target" in query_params:
+            return [{"rate": float(self.get_exchange_rate(Currency(query_params["source"]), Currency(query_params["target"]))),
+                     "source": query_params["source"], "target": query_params["target"], "time": time}]
+
+        return [{"rate": float(exchange_rate), "source": from_currency.value, "target": to_currency.value, "time": time}
+                for (from_currency, to_currency), exchange_rate in self.exchange_rate_dict.items()]
+
+    def _get_recipient_list(self, query_params: Dict[str, str], **kwargs: Any) -> List[Dict[str, Any]]:
+        return [{"id": r.id,
+                 "profile": r.profile_id,
+                 "accountHolderName": r.account_holder_name,
+                 "currency": r.currency.value,
+                 "ownedByCustomer": r.is_self_owned,
+                 "details": {"accountNumber": r.account_number, "iban": None}}
+                for r in self.recipient_dict.values() if r.profile_id == int(query_params["profile"])]
+
+    def _get_debit_card_list(self, profile_id: int, **kwargs: Any) -> Dict[str, Any]:
+        return {"cards": []}
+
+    def _create_transfer(self, body: Dict[str, Any], batch_group: WiseSandboxBatchGroup | None = None, **kwargs: Any) -> Dict[str, Any]:
+        quote: WiseSandboxQuote = self._get_quote_by_id(body["quoteUuid"])
+        transfer: WiseSandboxTransfer = WiseSandboxTransfer(id=self._get_new_id(), profile_id=quote.profile_id, quote=quote,
+                                                            recipient=self._get_recipient_by_id(body["targetAccount"]),
+                                                            reference=body.get("details", {}).get("reference", ""),
+                                                            status="incoming_payment_waiting")
+        self.transfer_dict[transfer.id] = transfer
+        return WiseSandbox._get_transfer_data(transfer)
+
+    def _get_transfer_list(self, query_params: Dict[str, str], **kwargs: Any) -> List[Dict[str, Any]]:
+        offset: int = int(query_params.get("offset", "0"))
+        transfer_list: List[WiseSandboxTransfer] = [t for t in self.transfer_dict.values()
+                                                    if t.profile_id == int(query_params["profile"]) and ("status" not in query_params or t.status == query_params["status"])]
+        return [WiseSandbox._get_transfer_data(t) for t in transfer_list[offset:offset + int(query_params.get("limit", "100"))]]
+
+    def _get_transfer(self, transfer_id: int, **kwargs: Any) -> Dict[str, Any]:
+        if transfer_id not in self.transfer_dict:
+            raise WiseSandboxException(404, f"Transfer not found: {transfer_id}")
+
+        return WiseSandbox._get_transfer_data(self.transfer_dict[transfer_id])
+
+    def _fund_transfer_from_balance(self, transfer: WiseSandboxTransfer, webhook_list: List[Dict[str, Any]]) -> None:
+        if transfer.is_funded:
+            raise WiseSandboxException(422, f"Transfer has already been funded: {transfer.id}")
+
+        self._apply(self._get_cash_balance(transfer.profile_id, transfer.quote.from_currency), -transfer.quote.from_amount, "TRANSFER",
+                    f"Sent money to {transfer.recipient.account_holder_name}", f"TRANSFER-{transfer.id}", webhook_list,
+                    {"recipient": {"name": transfer.recipient.account_holder_name, "bankAccount": transfer.recipient.account_number},
+                     "paymentReference": transfer.reference})
+        transfer.is_funded = True
+        self._set_transfer_status(transfer, "processing", webhook_list)
+
+    def _fund_transfer(self, profile_id: int, transfer_id: int, webhook_list: List[Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        if transfer_id not in self.transfer_dict:
+            raise WiseSandboxException(404, f"Transfer not found: {transfer_id}")
+
+        self._fund_transfer_from_balance(self.transfer_dict[transfer_id], webhook_list)
+        return {"type": "BALANCE", "status": "COMPLETED", "errorCode": None}
+
+    def _set_transfer_status(self, transfer: WiseSandboxTransfer, status: str, webhook_list: List[Dict[str, Any]]) -> None:
+        occurred_at: str = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        webhook_list.append({"data": {"resource": {"id": transfer.id, "profile_id": transfer.profile_id, "account_id": transfer.recipient.id, "type": "transfer"},
+                                      "current_state": status,
+                                      "previous_state": transfer.status,
+                                      "occurred_at": occurred_at},
+                             "subscription_id": "sandbox",
+                             "event_type": "transfers#state-change",
+                             "schema_version": "2.0.0",
+                             "sent_at": occurred_at})
+        transfer.status = status
+
+    def _create_batch_group(self, profile_id: int, body: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        batch_group: WiseSandboxBatchGroup = WiseSandboxBatchGroup(id=self._get_new_id(), profile_id=profile_id, name=body.get("name"),
+                                                                   currency=Currency(body["sourceCurrency"]))
+        self.batch_group_dict[batch_group.id] = batch_group
+        return WiseSandbox._get_batch_group_data(batch_group)
+
+    def _get_batch_group_by_id(self, batch_group_id: int) -> WiseSandboxBatchGroup:
+        if batch_group_id not in self.batch_group_dict:
+            raise WiseSandboxException(404, f"Batch group not found: {batch_group_id}")
+
+        return self.batch_group_dict[batch_group_id]
+
+    def _get_batch_group(self, profile_id: int, batch_group_id: int, **kwargs: Any) -> Dict[str, Any]:
+        return WiseSandbox._get_batch_group_data(self._get_batch_group_by_id(batch_group_id))
+
+    def _update_batch_group(self, profile_id: int, batch_group_id: int, body: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        batch_group: WiseSandboxBatchGroup = self._get_batch_group_by_id(batch_group_id)
+        if body["version"] != batch_group.version:
+            raise WiseSandboxException(409, f"Batch group version mismatch: {body['version']} != {batch_group.version}")
+
+        batch_group.status = body["status"]
+        batch_group.version = batch_group.version + 1
+        return WiseSandbox._get_batch_group_data(batch_group)
+
+    def _create_batch_group_transfer(self, profile_id: int, batch_group_id: int, body: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        batch_group: WiseSandboxBatchGroup = self._get_batch_group_by_id(batch_group_id)
+        if batch_group.status != "NEW":
+            raise WiseSandboxException(422, f"Batch group is not open for new transfers: {batch_group.status}")
+
+        transfer_data: Dict[str, Any] = self._create_transfer(body)
+        batch_group.transfer_list.append(self.transfer_dict[transfer_data["id"]])
+        batch_group.version = batch_group.version + 1
+        return transfer_data
+
+    def _fund_batch_group(self, profile_id: int, batch_group_id: int, webhook_list: List[Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        batch_group: WiseSandboxBatchGroup = self._get_batch_group_by_id(batch_group_id)
+        if batch_group.status != "COMPLETED":
+            raise WiseSandboxException(422, f"Batch group has not been completed: {batch_group.status}")
+
+        if sum(t.quote.from_amount for t in batch_group.transfer_list) > self._get_cash_balance(profile_id, batch_group.currency).amount:
+            raise WiseSandboxException(422, f"Insufficient funds for batch group: {batch_group.id}")
+
+        for transfer in batch_group.transfer_list:
+            self._fund_transfer_from_balance(transfer, webhook_list)
+
+        return {"id": batch_group.id, "status": "COMPLETED", "type": "BALANCE"}
+
+    def _simulate_top_up(self, body: Dict[str, Any], webhook_list: List[Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        balance: WiseSandboxBalance = self._get_balance_by_id(body["balanceId"])
+        transaction_id: int = self._get_new_id()
+        self._apply(balance, Decimal(str(body["amount"])), "DEPOSIT", "Received money from Wise Sandbox", f"DEPOSIT-{transaction_id}", webhook_list,
+                    {"senderName": "Wise Sandbox", "senderAccount": "00000000"})
+        return {"transactionId": transaction_id, "state": "COMPLETED", "balanceId": balance.id}
+
+    def _simulate_transfer_status(self, transfer_id: int, status: str, webhook_list: List[Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        if transfer_id not in self.transfer_dict:
+            raise WiseSandboxException(404, f"Transfer not found: {transfer_id}")
+
+        self._set_transfer_status(self.transfer_dict[transfer_id], status, webhook_list)
+        return WiseSandbox._get_transfer_data(self.transfer_dict[transfer_id])
@@ -0,0 +1,161 @@
+import asyncio
+import datetime
+import time
+from collections import OrderedDict
+from logging import Logger
+from typing import Dict, Any, List, Callable, Awaitable
+
+from sirius import application_performance_monitoring, common
+from sirius.common import DataClass
+from sirius.exceptions import SDKClientException
+from sirius.wise import WiseAccount, WiseWebhook, AccountDebit, AccountCredit
+from sirius.wise.exceptions import WebhookQueueFullException
+
+logger: Logger = application_performance_monitoring.get_logger()
+
+
+class WiseWebhookConfiguration(DataClass):
+    number_of_workers: int = 8
+    maximum_queue_size: int = 10_000
+    deduplication_window_size: int = 10_000
+
+
+class WiseWebhookMetrics(DataClass):
+    number_of_events_received: int = 0
+    number_of_duplicate_events: int = 0
+    number_of_events_processed: int = 0
+    number_of_events_failed: int = 0
+    queue_depth: int = 0
+    maximum_queue_depth: int = 0
+    last_processing_latency_seconds: float | None = None
+    maximum_processing_latency_seconds: float | None = None
+
+
+class WiseWebhookEvent(DataClass):
+    deduplication_key: str
+    balance_key: str
+    request_data: Dict[str, Any]
+    received_timestamp: datetime.datetime
+
+
+class WiseWebhookProcessor:
+    wise_account: WiseAccount
+    handler: Callable[[AccountDebit | AccountCredit | None, WiseWebhookEvent], Awaitable[None]] | None
+    configuration: WiseWebhookConfiguration
+    metrics: WiseWebhookMetrics
+    _queue_list: List[asyncio.Queue]
+    _worker_list: List[asyncio.Task | None]
+    _deduplication_key_dict: "OrderedDict[str, None]"
+
+    def __init__(self, wise_account: WiseAccount,
+                 handler: Callable[[AccountDebit | AccountCredit | None, WiseWebhookEvent], Awaitable[None]] | None = None,
+                 configuration: WiseWebhookConfiguration | None = None) -> None:
+        self.wise_account = wise_account
+        self.handler = handler
+        self.configuration = WiseWebhookConfiguration() if configuration is None else configuration
+        self.metrics = WiseWebhookMetrics()
+        self._queue_list = [asyncio.Queue(maxsize=max(1, self.configuration.maximum_queue_size // self.configuration.number_of_workers))
+                            for _ in range(self.configuration.number_of_workers)]
+        self._worker_list = [None] * len(self._queue_list)
+        self._deduplication_key_dict = OrderedDict()
+
+    @staticmethod
+    def get_deduplication_key(request_data: Dict[str, Any], delivery_id: str | None = None) -> str:
+        if delivery_id is not None:
+            return delivery_id
+
+        event_type: str = str(request_data.get("event_type"))
+        data: Dict[str, Any] = request_data.get("data", {})
+        key_list: List[Any] = [event_type, data.get("resource", {}).get("id"), data.get("current_state"), data.get("occurred_at")]
+        if event_type.startswith("balances#"):
+            key_list = key_list + [data.get("amount"), data.get("currency"), data.get("post_transaction_balance_amount"), data.get("transfer_reference")]
+
+        return "|".join([str(key) for key in key_list])
+
+    @staticmethod
+    def get_balance_key(request_data: Dict[str, Any]) -> str:
+        resource: Dict[str, Any] = request_data.get("data", {}).get("resource", {})
+        if str(request_data.get("event_type")).startswith("balances#"):
+            return f"balance:{resource.get('id')}"
+
+        return f"profile:{resource.get('profile_id')}"
+
+    def ingest(self, request_data: Dict[str, Any], delivery_id: str | None = None) -> bool:
+        if not common.is_event_loop_running():
+            raise SDKClientException("Wise webhooks can only be ingested from within a running event loop")
+
+        self.metrics.number_of_events_received = self.metrics.number_of_events_received + 1
+        deduplication_key: str = WiseWebhookProcessor.get_deduplication_key(request_data, delivery_id)
+
+        if deduplication_key in self._deduplication_key_dict:
+            self.metrics.number_of_duplicate_events = self.metrics.number_of_duplicate_events + 1
+            return False
+
+        balance_key: str = WiseWebhookProcessor.get_balance_key(request_data)
+        queue_index: int = hash(balance_key) % len(self._queue_list)
+        queue: asyncio.Queue = self._queue_list[queue_index]
+        event: WiseWebhookEvent = WiseWebhookEvent(deduplication_key=deduplication_key,
+                                                   balance_key=balance_key,
+                                                   request_data=request_data,
+                                                   received_timestamp=datetime.datetime.now())
+
+        self._start(queue_index)
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            raise WebhookQueueFullException(f"Webhook queue is full\n"
+                                            f"Balance Key: {balance_key}\n"
+                                            f"Queue Size: {queue.qsize()}")
+
+        self._remember_deduplication_key(deduplication_key)
+        self.metrics.queue_depth = sum(q.qsize() for q in self._queue_list)
+        self.metrics.maximum_queue_depth = max(self.metrics.maximum_queue_depth, self.metrics.queue_depth)
+        return True
+
+    async def flush(self) -> None:
+        await asyncio.gather(*[queue.join() for queue in self._queue_list])
+
+    async def close(self) -> None:
+        await self.flush()
+        for worker in self._worker_list:
+            if worker is not None:
+                worker.cancel()
+        self._worker_list = [None] * len(self._queue_list)
+
+    def _start(self, queue_index: int) -> None:
+        worker: asyncio.Task | None = self._worker_list[queue_index]
+        if worker is None or worker.done():
+            self._worker_list[queue_index] = asyncio.ensure_future(self._run(self._queue_list[queue_index]))
+
+    def _remember_deduplication_key(self, deduplication_key: str) -> None:
+        self._deduplication_key_dict[deduplication_key] = None
+        while len(self._deduplication_key_dict) > self.configuration.deduplication_window_size:
+            self._deduplication_key_dict.popitem(last=False)
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            event: WiseWebhookEvent = await queue.get()
+            await self._process(event)
+            queue.task_done()
+            self.metrics.queue_depth = sum(q.qsize() for q in self._queue_list)
+
+    async def _process(self, event: WiseWebhookEvent) -> None:
+        start_time: float = time.monotonic()
+
+        try:
+            balance_update_object: AccountDebit | AccountCredit | None = await WiseWebhook.get_balance_update_object_async(event.request_data, self.wise_account)
+            if self.handler is not None:
+                await self.handler(balance_update_object, event)
+
+            self.metrics.number_of_events_processed = self.metrics.number_of_events_processed + 1
+        except Exception as e:
+            self.metrics.number_of_events_failed = self.metrics.number_of_events_failed + 1
+            self._deduplication_key_dict.pop(event.deduplication_key, None)
+            logger.exception(f"Wise webhook processing failed\n"
+                             f"Balance Key: {event.balance_key}\n"
+                             f"Deduplication Key: {event.deduplication_key}\n"
+                             f"Exception: {repr(e)}")
+        finally:
+            processing_latency_seconds: float = time.monotonic() - start_time
+            self.metrics.last_processing_latency_seconds = processing_latency_seconds
+            self.metrics.maximum_processing_latency_seconds = max(processing_latency_seconds, self.metrics.maximum_processing_latency_seconds or 0)
@@ -1,6 +1,12 @@
+import asyncio
+from typing import List, Tuple, Dict, Any
+
+import httpx
 import pytest
 
-from sirius.communication.discord import Bot, Server, RoleType, TextChannel
+from sirius.communication.discord import Bot, Server, RoleType, TextChannel, DiscordOutbox, DiscordDefaults, MessageQueue, \
+    DiscordHTTPSession, constants
+from sirius.http_requests import HTTPResponse
 
 
 @pytest.mark.asyncio
@@ -33,3 +39,100 @@ async def test_create_private_text_channel() -> None:
     text_channel: TextChannel = await server.get_text_channel("test")
     assert text_channel is not None
     await text_channel.delete()
+
+
+@pytest.mark.asyncio
+async def test_discord_outbox_digest(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent_message_list: List[Tuple[str, str]] = []
+
+    async def send_message(text_channel_name: str, message: str) -> None:
+        sent_message_list.append((text_channel_name, message))
+
+    monkeypatch.setattr(DiscordDefaults, "send_message", send_message)
+    monkeypatch.setattr(DiscordOutbox, "digest_interval_seconds", 60)
+    for i in range(10):
+        DiscordOutbox.put("test", f"Message {i}")
+    await DiscordOutbox.flush_async()
+
+    assert len(sent_message_list) == 1
+    assert sent_message_list[0][1].startswith("**Digest**: *10 messages*")
+
+
+@pytest.mark.asyncio
+async def test_discord_outbox_resumes_digest_after_flush(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent_message_list: List[Tuple[str, str]] = []
+
+    async def send_message(text_channel_name: str, message: str) -> None:
+        if len(sent_message_list) == 0:
+            DiscordOutbox.put("test", "Late Message 0")
+            asyncio.get_running_loop().call_later(0.05, DiscordOutbox.put, "test", "Late Message 1")
+        sent_message_list.append((text_channel_name, message))
+
+    monkeypatch.setattr(DiscordDefaults, "send_message", send_message)
+    monkeypatch.setattr(DiscordOutbox, "digest_interval_seconds", 0.1)
+    DiscordOutbox.put("test", "Message")
+    await DiscordOutbox.flush_async()
+
+    assert [message for _, message in sent_message_list] == ["Message", "**Digest**: *2 messages*\n\nLate Message 0\nLate Message 1"]
+    assert DiscordOutbox._flush_event is None
+
+
+@pytest.mark.asyncio
+async def test_message_queue(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent_data_list: List[Dict[str, Any]] = []
+
+    async def post(self: DiscordHTTPSession, url: str, data: Dict[str, Any] | None = None, headers: Dict[str, Any] | None = None) -> HTTPResponse:
+        sent_data_list.append(data)
+        return HTTPResponse(httpx.Response(200, json={}, request=httpx.Request("POST", url)))
+
+    monkeypatch.setattr(DiscordHTTPSession, "post", post)
+    message_queue: MessageQueue = MessageQueue(1, DiscordHTTPSession(constants.URL), 2)
+    for i in range(10):
+        await message_queue.put({"content": f"Message {i}"})
+    await message_queue.drain()
+
+    assert sent_data_list == [{"content": f"Message {i}"} for i in range(10)]
+    assert message_queue.get_metrics().number_of_messages_sent == 10
+    assert message_queue.get_metrics().queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_message_queue_coalescing(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent_data_list: List[Dict[str, Any]] = []
+
+    async def post(self: DiscordHTTPSession, url: str, data: Dict[str, Any] | None = None, headers: Dict[str, Any] | None = None) -> HTTPResponse:
+        sent_data_list.append(data)
+        return HTTPResponse(httpx.Response(200, json={}, request=httpx.Request("POST", url)))
+
+    monkeypatch.setattr(DiscordHTTPSession, "post", post)
+    monkeypatch.setattr(constants, "MESSAGE_COALESCING_WINDOW_SECONDS", 0.1)
+    message_queue: MessageQueue = MessageQueue(2, DiscordHTTPSession(constants.URL))
+    for i in range(100):
+        await message_queue.put({"content": f"Message {i:02d}" + " " * 39}, True)
+    await message_queue.drain()
+
+    assert len(sent_data_list) == 3
+    assert all(len(data["content"]) <= constants.MESSAGE_MAXIMUM_LENGTH for data in sent_data_list)
+    assert "\n".join(data["content"] for data in sent_data_list) == "\n".join(f"Message {i:02d}" + " " * 39 for i in range(100))
+    assert message_queue.get_metrics().number_of_messages_sent == 100
+
+
+@pytest.mark.asyncio
+async def test_message_queue_recovers_from_failed_item(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent_data_list: List[Dict[str, Any]] = []
+
+    async def post(self: DiscordHTTPSession, url: str, data: Dict[str, Any] | None = None, headers: Dict[str, Any] | None = None) -> HTTPResponse:
+        sent_data_list.append(data)
+        return HTTPResponse(httpx.Response(200, json={}, request=httpx.Request("POST", url)))
+
+    monkeypatch.setattr(DiscordHTTPSession, "post", post)
+    monkeypatch.setattr(constants, "MESSAGE_COALESCING_WINDOW_SECONDS", 0)
+    message_queue: MessageQueue = MessageQueue(3, DiscordHTTPSession(constants.URL))
+    await message_queue.put({"embeds": []}, True)
+    await asyncio.wait_for(message_queue.drain(), 5)
+
+    await message_queue.put({"content": "Message"})
+    await asyncio.wait_for(message_queue.drain(), 5)
+    assert sent_data_list == [{"content": "Message"}]
+    assert message_queue.get_metrics().number_of_messages_failed == 1
+    assert message_queue.get_metrics().queue_depth == 0
@@ -12,6 +12,6 @@ def event_loop() -> AbstractEventLoop:
     return asyncio.get_event_loop()
 
 
-@pytest_asyncio.fixture(autouse=True)
+@pytest_asyncio.fixture
 async def initialize_database() -> None:
     await initialize()
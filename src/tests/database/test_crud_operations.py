@@ -1,15 +1,23 @@
-from typing import List, cast
+from typing import List, cast, ClassVar
 
 import pytest
 
 from sirius import database
-from sirius.database import DatabaseDocument, initialize
+from sirius.database import DatabaseDocument, initialize, WriteBehindConfiguration, WriteBehindMetrics
+
+
+pytestmark = pytest.mark.usefixtures("initialize_database")
 
 
 class Test(DatabaseDocument):
     name: str
 
 
+class BufferedTest(DatabaseDocument):
+    name: str
+    write_behind_configuration: ClassVar[WriteBehindConfiguration | None] = WriteBehindConfiguration(batch_size=10, flush_interval_seconds=0.1)
+
+
 @pytest.mark.asyncio
 async def test_crud_operations() -> None:
     # Create
@@ -41,3 +49,19 @@ async def test_find_by_query() -> None:
     assert len(query_results) != 0
 
     await database.drop_collection(Test.__name__)
+
+
+@pytest.mark.asyncio
+async def test_write_behind_save() -> None:
+    buffered_test_list: List[BufferedTest] = [BufferedTest(name=f"John Doe {i}") for i in range(25)]
+    for buffered_test in buffered_test_list:
+        await buffered_test.save()
+
+    await BufferedTest.flush()
+    metrics: WriteBehindMetrics = cast(WriteBehindMetrics, BufferedTest.get_write_behind_metrics())
+    assert all(buffered_test.id is not None for buffered_test in buffered_test_list)
+    assert metrics.number_of_documents_flushed == 25
+    assert metrics.number_of_flushes >= 3
+
+    await database.shutdown()
+    await database.drop_collection(BufferedTest.__name__)
@@ -0,0 +1,207 @@
+import asyncio
+import datetime
+import os
+from typing import List, cast, ClassVar, AsyncGenerator, Dict, Any
+
+import pytest
+import pytest_asyncio
+from bson import ObjectId
+
+from sirius import database
+from sirius.database import DatabaseDocument, StorageEngine, InMemoryStorageEngine, SQLiteStorageEngine, LargeBinary, WriteBehindConfiguration, WriteBehindMetrics
+from sirius.database.exceptions import DatabaseException
+
+
+class IndexedTest(DatabaseDocument):
+    name: str
+    age: int | None = None
+    indexed_field_list: ClassVar[List[str]] = ["name"]
+
+
+class LargeBinaryTest(DatabaseDocument):
+    name: str
+    content: LargeBinary | None = None
+
+
+class BufferedTest(DatabaseDocument):
+    name: str
+    write_behind_configuration: ClassVar[WriteBehindConfiguration | None] = WriteBehindConfiguration(batch_size=10, flush_interval_seconds=0.01, maximum_number_of_retries=2)
+
+
+class FailingStorageEngine(InMemoryStorageEngine):
+    number_of_failures: int
+
+    def __init__(self, number_of_failures: int) -> None:
+        super().__init__()
+        self.number_of_failures = number_of_failures
+
+    async def insert_many(self, collection_name: str, document_list: List[Dict[str, Any]]) -> List[ObjectId]:
+        if self.number_of_failures > 0:
+            self.number_of_failures = self.number_of_failures - 1
+            raise ConnectionError("Storage engine is unavailable")
+
+        return await super().insert_many(collection_name, document_list)
+
+
+@pytest_asyncio.fixture(params=[InMemoryStorageEngine, SQLiteStorageEngine])
+async def storage_engine(request: pytest.FixtureRequest) -> AsyncGenerator[StorageEngine, None]:
+    original_storage_engine: StorageEngine | None = database.storage_engine
+    engine: StorageEngine = request.param()
+    await database.set_storage_engine(engine)
+    yield engine
+    await database.set_storage_engine(cast(StorageEngine, original_storage_engine))
+
+
+@pytest.mark.asyncio
+async def test_crud_operations(storage_engine: StorageEngine) -> None:
+    indexed_test: IndexedTest = IndexedTest(name="John Doe")
+    await indexed_test.save()
+
+    indexed_test.name = "Jane Doe"
+    await indexed_test.save()
+    assert cast(IndexedTest, await IndexedTest.find_by_id(indexed_test.id)).name == "Jane Doe"
+
+    await indexed_test.delete()
+    assert await IndexedTest.find_by_id(indexed_test.id) is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_and_stream(storage_engine: StorageEngine) -> None:
+    await IndexedTest.save_many([IndexedTest(name="John Doe", age=age) for age in range(10)])
+
+    assert len(await IndexedTest.find_by_query(IndexedTest(name="John Doe"))) == 10
+    assert len(await IndexedTest.find_by_query(IndexedTest(name="John Doe", age=5))) == 1
+    assert [cast(IndexedTest, i).age async for i in IndexedTest.find_stream_by_query(IndexedTest(name="John Doe"), batch_size=3)] == list(range(10))
+
+    await database.drop_collection(IndexedTest.__name__)
+    assert len(await IndexedTest.find_by_query(IndexedTest(name="John Doe"))) == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_new_and_existing(storage_engine: StorageEngine) -> None:
+    indexed_test_list: List[DatabaseDocument] = [IndexedTest(name="John Doe", age=age) for age in range(5)]
+    await IndexedTest.save_many(indexed_test_list)
+
+    for indexed_test in indexed_test_list:
+        cast(IndexedTest, indexed_test).name = "Jane Doe"
+    await IndexedTest.save_many(indexed_test_list + [IndexedTest(name="Jane Doe", age=age) for age in range(5, 10)])
+
+    assert len(await IndexedTest.find_by_query(IndexedTest(name="John Doe"))) == 0
+    assert [cast(IndexedTest, i).age for i in await IndexedTest.find_by_query(IndexedTest(name="Jane Doe"))] == list(range(10))
+    assert all(i.updated_timestamp is not None for i in indexed_test_list)
+
+    await database.drop_collection(IndexedTest.__name__)
+
+
+@pytest.mark.asyncio
+async def test_datetime_round_trip(storage_engine: StorageEngine) -> None:
+    timestamp: datetime.datetime = datetime.datetime(2024, 1, 1, 12, 30, 15, 123000)
+    await IndexedTest(name="John Doe", updated_timestamp=timestamp).save()
+
+    indexed_test_list: List[IndexedTest] = cast(List[IndexedTest], await IndexedTest.find_by_query(IndexedTest(name="John Doe", updated_timestamp=timestamp)))
+    assert len(indexed_test_list) == 1
+    assert indexed_test_list[0].updated_timestamp == timestamp
+    assert cast(datetime.datetime, indexed_test_list[0].updated_timestamp).tzinfo is None
+
+    await database.drop_collection(IndexedTest.__name__)
+
+
+@pytest.mark.asyncio
+async def test_projection_and_lazy_loading(storage_engine: StorageEngine) -> None:
+    indexed_test: IndexedTest = IndexedTest(name="John Doe", age=30)
+    await indexed_test.save()
+
+    partial_indexed_test: IndexedTest = cast(IndexedTest, await IndexedTest.find_by_id(indexed_test.id, projection=["name"]))
+    assert partial_indexed_test.is_partially_loaded
+    assert "age" in partial_indexed_test.get_unloaded_field_list()
+
+    partial_indexed_test.name = "Jane Doe"
+    await partial_indexed_test.save()
+    indexed_test = cast(IndexedTest, await IndexedTest.find_by_id(indexed_test.id))
+    assert indexed_test.name == "Jane Doe" and indexed_test.age == 30
+
+    partial_indexed_test = cast(IndexedTest, (await IndexedTest.find_by_query(IndexedTest(name="Jane Doe"), projection=["name"]))[0])
+    with pytest.raises(DatabaseException):
+        _ = partial_indexed_test.age
+
+    await partial_indexed_test.load()
+    assert partial_indexed_test.age == 30
+    assert not partial_indexed_test.is_partially_loaded
+
+    partial_indexed_test = cast(IndexedTest, (await IndexedTest.find_by_query(IndexedTest(name="Jane Doe"), projection=["name"]))[0])
+    assert await asyncio.to_thread(lambda: partial_indexed_test.age) == 30
+    assert not partial_indexed_test.is_partially_loaded
+
+    await database.drop_collection(IndexedTest.__name__)
+
+
+@pytest.mark.asyncio
+async def test_large_binary(storage_engine: StorageEngine) -> None:
+    content: bytes = os.urandom(1_000_000)
+    large_binary_test: LargeBinaryTest = LargeBinaryTest(name="John Doe", content=LargeBinary.from_bytes(content, "content.bin"))
+    await large_binary_test.save()
+
+    large_binary_test = cast(LargeBinaryTest, await LargeBinaryTest.find_by_id(large_binary_test.id))
+    large_binary: LargeBinary = cast(LargeBinary, large_binary_test.content)
+    assert large_binary.length == len(content)
+    assert len([chunk async for chunk in large_binary.open_download_stream()]) > 1
+    assert await large_binary.read() == content
+
+    previous_file_id: ObjectId = cast(ObjectId, large_binary.file_id)
+    await large_binary.upload(b"replaced content")
+    await large_binary_test.save()
+    assert await cast(LargeBinary, cast(LargeBinaryTest, await LargeBinaryTest.find_by_id(large_binary_test.id)).content).read() == b"replaced content"
+    with pytest.raises(DatabaseException):
+        await LargeBinary(file_id=previous_file_id).read()
+
+    await large_binary_test.delete()
+    await database.drop_collection(LargeBinaryTest.__name__)
+
+
+@pytest.mark.asyncio
+async def test_large_binary_empty_and_missing_file(storage_engine: StorageEngine) -> None:
+    large_binary: LargeBinary = LargeBinary.from_bytes(b"", "empty.bin")
+    await large_binary.upload()
+    assert large_binary.is_uploaded
+    assert await LargeBinary(file_id=large_binary.file_id).read() == b""
+
+    await large_binary.delete()
+    with pytest.raises(DatabaseException):
+        await LargeBinary(file_id=ObjectId()).read()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_retry_and_dead_letter() -> None:
+    original_storage_engine: StorageEngine | None = database.storage_engine
+    await database.set_storage_engine(FailingStorageEngine(2))
+    buffered_test_list: List[BufferedTest] = [BufferedTest(name=f"John Doe {i}") for i in range(5)]
+    for buffered_test in buffered_test_list:
+        await buffered_test.save()
+
+    await BufferedTest.flush()
+    assert all(buffered_test.id is not None for buffered_test in buffered_test_list)
+    assert len(BufferedTest.get_write_behind_dead_letter_list()) == 0
+
+    await database.set_storage_engine(FailingStorageEngine(10))
+    buffered_test = BufferedTest(name="Jane Doe")
+    await buffered_test.save()
+    await BufferedTest.flush()
+    metrics: WriteBehindMetrics = cast(WriteBehindMetrics, BufferedTest.get_write_behind_metrics())
+    assert buffered_test.id is None
+    assert BufferedTest.get_write_behind_dead_letter_list() == [buffered_test]
+    assert metrics.number_of_documents_dead_lettered == 1
+
+    await database.set_storage_engine(cast(StorageEngine, original_storage_engine))
+
+
+@pytest.mark.asyncio
+async def test_set_storage_engine_flushes_write_behind_buffer() -> None:
+    original_storage_engine: StorageEngine | None = database.storage_engine
+    engine: InMemoryStorageEngine = InMemoryStorageEngine()
+    await database.set_storage_engine(engine)
+    await BufferedTest(name="John Doe").save()
+
+    await database.set_storage_engine(InMemoryStorageEngine())
+    assert len(engine.collection_dict[BufferedTest.__name__]) == 1
+
+    await database.set_storage_engine(cast(StorageEngine, original_storage_engine))
@@ -0,0 +1,56 @@
+from typing import Dict, Any, List
+
+import httpx
+import pytest
+
+from sirius.http_requests import AsyncHTTPSession, SyncHTTPSession, HTTPResponse, ClientSideException
+
+
+def test_async_http_session_is_shared_by_header_subset() -> None:
+    http_session: AsyncHTTPSession = AsyncHTTPSession("https://session-test.example.com", {"Authorization": "Bearer token", "Accept": "application/json"})
+
+    assert AsyncHTTPSession("https://session-test.example.com/v1") is http_session
+    assert AsyncHTTPSession("https://session-test.example.com", {"Authorization": "Bearer token"}) is http_session
+    assert AsyncHTTPSession("https://session-test.example.com", {"Authorization": "Bearer another-token"}) is not http_session
+
+
+@pytest.mark.asyncio
+async def test_patch_does_not_mutate_headers() -> None:
+    AsyncHTTPSession.set_transport("https://patch-test.example.com", httpx.MockTransport(lambda request: httpx.Response(200, json={"content-type": request.headers["content-type"]})))
+    headers: Dict[str, Any] = {"X-Request-Id": "1"}
+
+    http_response: HTTPResponse = await AsyncHTTPSession("https://patch-test.example.com").patch("https://patch-test.example.com/resource", {"name": "John Doe"}, headers)
+    assert http_response.data == {"content-type": "application/json"}
+    assert headers == {"X-Request-Id": "1"}
+    AsyncHTTPSession.set_transport("https://patch-test.example.com", None)
+
+
+@pytest.mark.asyncio
+async def test_patch_keeps_caller_content_type() -> None:
+    transport: httpx.MockTransport = httpx.MockTransport(lambda request: httpx.Response(200, json={"content-type": request.headers["content-type"]}))
+    headers: Dict[str, Any] = {"content-type": "application/merge-patch+json"}
+    AsyncHTTPSession.set_transport("https://patch-test.example.com", transport)
+    sync_http_session: SyncHTTPSession = SyncHTTPSession("https://patch-test.example.com")
+    sync_http_session.client = httpx.Client(transport=transport)
+
+    assert (await AsyncHTTPSession("https://patch-test.example.com").patch("https://patch-test.example.com/resource", {"name": "John Doe"}, headers)).data == headers
+    assert sync_http_session.patch("https://patch-test.example.com/resource", {"name": "John Doe"}, headers).data == headers
+    AsyncHTTPSession.set_transport("https://patch-test.example.com", None)
+
+
+@pytest.mark.asyncio
+async def test_get_raw_is_rate_limited(monkeypatch: pytest.MonkeyPatch) -> None:
+    AsyncHTTPSession.set_transport("https://raw-test.example.com", httpx.MockTransport(lambda request: httpx.Response(200 if request.url.path == "/resource" else 404, content=b"[]")))
+    http_session: AsyncHTTPSession = AsyncHTTPSession("https://raw-test.example.com")
+    acquire_list: List[None] = []
+
+    async def _acquire() -> None:
+        acquire_list.append(None)
+
+    monkeypatch.setattr(http_session, "_acquire", _acquire)
+    assert (await http_session.get_raw("https://raw-test.example.com/resource")).content == b"[]"
+    with pytest.raises(ClientSideException):
+        await http_session.get_raw("https://raw-test.example.com/missing")
+
+    assert len(acquire_list) == 2
+    AsyncHTTPSession.set_transport("https://raw-test.example.com", None)
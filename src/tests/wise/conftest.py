@@ -1,10 +1,12 @@
 import asyncio
+import datetime
+import json
 from asyncio import AbstractEventLoop
+from typing import Iterator, Callable, List, Dict, Any
 
 import pytest
-import pytest_asyncio
 
-from sirius.wise import WiseAccount, WiseAccountType
+from sirius.wise.sandbox import WiseSandbox
 
 
 @pytest.fixture(scope="session")
@@ -12,6 +14,28 @@ def event_loop() -> AbstractEventLoop:
     return asyncio.get_event_loop()
 
 
-@pytest_asyncio.fixture(autouse=True)
-async def reset_wise_account() -> None:
-    await WiseAccount.get(WiseAccountType.PRIMARY).personal_profile._reset()
+@pytest.fixture(autouse=True)
+def wise_sandbox() -> Iterator[WiseSandbox]:
+    with WiseSandbox().seed() as wise_sandbox:
+        yield wise_sandbox
+
+
+@pytest.fixture
+def get_statement_content() -> Callable[[int], bytes]:
+    def get_statement_content_from_number_of_rows(number_of_rows: int) -> bytes:
+        start_time: datetime.datetime = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        row_list: List[Dict[str, Any]] = []
+
+        for i in range(number_of_rows):
+            details: Dict[str, Any] = {"type": "CARD", "description": f"Card transaction {i}", "merchant": {"name": "Merchant", "country": "NZ"}}
+            if i % 2 == 0:
+                details = {"type": "TRANSFER", "description": f"Transfer {i}", "recipient": {"name": "John Doe", "bankAccount": "12345678901234"}}
+
+            row_list.append({"referenceNumber": f"TRANSFER-{i}" if i % 2 == 0 else f"CARD-{i}",
+                             "date": f"{(start_time + datetime.timedelta(seconds=i)).isoformat().split('+')[0]}.123Z",
+                             "details": details,
+                             "amount": {"value": -12.34, "currency": "NZD"}})
+
+        return json.dumps({"transactions": row_list}).encode()
+
+    return get_statement_content_from_number_of_rows
@@ -0,0 +1,83 @@
+import datetime
+from _decimal import Decimal
+from typing import List, Callable
+
+import numpy
+import pytest
+
+from sirius.common import Currency
+from sirius.wise import StatementDecoder, Transaction, TransactionType, CashAccount, Profile, WiseAccount, WiseAccountType
+from sirius.wise.analytics import TransactionFrame, DailyTransactionAggregate, CounterpartyTransactionTotal, PortfolioValuation
+from sirius.wise.sandbox import WiseSandbox
+
+
+def test_transaction_frame(get_statement_content: Callable[[int], bytes]) -> None:
+    profile: Profile = Profile.model_construct(id=1, type="personal", cash_account_list=[], reserve_account_list=[], recipient_list=[])
+    cash_account: CashAccount = CashAccount.model_construct(id=1, name=None, currency=Currency.NZD, balance=Decimal("1000"), profile=profile)
+    transaction_list: List[Transaction] = StatementDecoder(cash_account).decode_list(StatementDecoder.load(get_statement_content(100_000)))
+    transaction_frame: TransactionFrame = TransactionFrame.from_transaction_list(cash_account, transaction_list)
+
+    assert transaction_frame.number_of_transactions == 100_000
+    assert transaction_frame.get_total_amount() == sum(t.amount for t in transaction_list)
+    assert transaction_frame.get_decimal(transaction_frame.get_running_balance_array(cash_account.balance)[-1]) == cash_account.balance
+    assert transaction_frame.filter_by_type(TransactionType.CARD).number_of_transactions == 50_000
+
+    daily_transaction_aggregate: DailyTransactionAggregate = transaction_frame.get_daily_aggregate()
+    assert len(daily_transaction_aggregate.date_array) == 2
+    assert daily_transaction_aggregate.number_of_transactions_array.tolist() == [86_400, 13_600]
+    assert transaction_frame.get_decimal(daily_transaction_aggregate.debit_amount_array[0]) == Decimal("-12.34") * 86_400
+
+    counterparty_transaction_total: CounterpartyTransactionTotal = transaction_frame.get_counterparty_total()
+    assert counterparty_transaction_total.third_party_list == ["John Doe | 12345678901234", "Merchant | NZ"]
+    assert transaction_frame.get_decimal_list(counterparty_transaction_total.total_amount_array) == [Decimal("-12.34") * 50_000] * 2
+    assert int(numpy.sum(counterparty_transaction_total.number_of_transactions_array)) == 100_000
+    assert transaction_frame.filter_by_time(datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc), datetime.datetime(2024, 1, 3, tzinfo=datetime.timezone.utc)).number_of_transactions == 13_600
+
+
+@pytest.mark.asyncio
+async def test_portfolio_valuation(wise_sandbox: WiseSandbox) -> None:
+    wise_sandbox.set_exchange_rate(Currency.USD, Currency.NZD, Decimal("1.654321"))
+    wise_sandbox.set_exchange_rate(Currency.AUD, Currency.NZD, Decimal("1.087654"))
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    profile: Profile = wise_account.personal_profile
+    usd_account: CashAccount = await profile.get_cash_account_async(Currency.USD)
+    portfolio_valuation: PortfolioValuation = await PortfolioValuation.get_async(wise_account, Currency.NZD)
+
+    for i in range(10_000):
+        usd_account.balance = Decimal("0.01") * (i % 7 + 1)
+        await portfolio_valuation.update_async(usd_account)
+
+    assert portfolio_valuation.get_value(usd_account) == (usd_account.balance * Decimal("1.654321")).quantize(Decimal("0.01"))
+    assert portfolio_valuation.get_total_value() == portfolio_valuation.update_all()
+
+    aud_account: CashAccount = await profile.get_cash_account_async(Currency.AUD, is_create_if_unavailable=True)
+    aud_account.balance = Decimal("100.01")
+    assert await portfolio_valuation.update_async(aud_account) == portfolio_valuation.get_value(usd_account) + Decimal("108.78")
+    assert portfolio_valuation.get_value_by_currency()[Currency.AUD] == Decimal("108.78")
+
+    aud_account.balance = Decimal("-100.01")
+    portfolio_valuation.update_all()
+    assert portfolio_valuation.get_value(aud_account) == (aud_account.balance * Decimal("1.087654")).quantize(Decimal("0.01")) == Decimal("-108.78")
+
+
+def test_transaction_frame_amounts_are_exact() -> None:
+    profile: Profile = Profile.model_construct(id=1, type="personal", cash_account_list=[], reserve_account_list=[], recipient_list=[])
+    cash_account: CashAccount = CashAccount.model_construct(id=1, name=None, currency=Currency.NZD, balance=Decimal("0"), profile=profile)
+    amount_list: List[Decimal] = [Decimal("90071992547409.93"), Decimal("0.005"), Decimal("-0.015"), Decimal("1.2345")]
+    transaction_list: List[Transaction] = [Transaction.model_construct(id=None, reference_number=None, account=cash_account, timestamp=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+                                                                       type=TransactionType.CARD, description="Card", amount=amount, third_party="Merchant") for amount in amount_list]
+    transaction_frame: TransactionFrame = TransactionFrame.from_transaction_list(cash_account, transaction_list)
+
+    assert transaction_frame.get_decimal_list(transaction_frame.amount_array) == [Decimal("90071992547409.93"), Decimal("0.01"), Decimal("-0.02"), Decimal("1.23")]
+    assert transaction_frame.amount_array.tolist() == [TransactionFrame._get_scaled_amount(amount, transaction_frame.amount_scale) for amount in amount_list]
+
+
+def test_transaction_frame_timestamps_are_exact() -> None:
+    profile: Profile = Profile.model_construct(id=1, type="personal", cash_account_list=[], reserve_account_list=[], recipient_list=[])
+    cash_account: CashAccount = CashAccount.model_construct(id=1, name=None, currency=Currency.NZD, balance=Decimal("0"), profile=profile)
+    timestamp_list: List[datetime.datetime] = [datetime.datetime(2024, 1, 1, 12, 30, 0, 123_457), datetime.datetime(9000, 12, 31, 23, 59, 59, 999_999, tzinfo=datetime.timezone.utc)]
+    for timestamp in timestamp_list:
+        transaction: Transaction = Transaction.model_construct(id=None, reference_number=None, account=cash_account, timestamp=timestamp,
+                                                               type=TransactionType.CARD, description="Card", amount=Decimal("1"), third_party="Merchant")
+        transaction_frame: TransactionFrame = TransactionFrame.from_transaction_list(cash_account, [transaction])
+        assert transaction_frame.filter_by_time(timestamp, timestamp + datetime.timedelta(microseconds=1)).number_of_transactions == 1
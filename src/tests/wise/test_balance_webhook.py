@@ -0,0 +1,72 @@
+import copy
+import datetime
+from _decimal import Decimal
+from typing import List, Dict, Any
+
+import pytest
+
+from sirius.common import Currency
+from sirius.wise import WiseAccount, CashAccount, ReserveAccount, Transfer, WiseWebhook, WiseAccountType
+from sirius.wise.sandbox import WiseSandbox
+
+
+@pytest.mark.asyncio
+async def test_out_of_order_balance_webhooks(wise_sandbox: WiseSandbox) -> None:
+    webhook_list: List[Dict[str, Any]] = []
+    wise_sandbox.webhook_handler_list.append(webhook_list.append)
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    await (await wise_account.personal_profile.get_cash_account_async(Currency.NZD))._simulate_top_up_async(Decimal("100"))
+    update_webhook: Dict[str, Any] = [w for w in webhook_list if w["event_type"] == "balances#update"][0]
+
+    newer_update_webhook: Dict[str, Any] = copy.deepcopy(update_webhook)
+    newer_update_webhook["data"]["occurred_at"] = "2099-01-01T00:00:01Z"
+    newer_update_webhook["data"]["post_transaction_balance_amount"] = 300
+    older_update_webhook: Dict[str, Any] = copy.deepcopy(newer_update_webhook)
+    older_update_webhook["data"]["occurred_at"] = "2099-01-01T00:00:00Z"
+    older_update_webhook["data"]["post_transaction_balance_amount"] = 200
+
+    wise_account = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    nzd_account: CashAccount = await wise_account.personal_profile.get_cash_account_async(Currency.NZD)
+    assert nzd_account.balance == Decimal("100")
+    assert WiseWebhook.apply_balance_update(newer_update_webhook, wise_account)
+    assert not WiseWebhook.apply_balance_update(older_update_webhook, wise_account)
+    assert nzd_account.balance == Decimal("300")
+
+    await nzd_account.refresh_async()
+    assert nzd_account.balance == Decimal("300")
+
+
+@pytest.mark.asyncio
+async def test_balance_webhook_for_unloaded_account_is_counted(wise_sandbox: WiseSandbox) -> None:
+    webhook_list: List[Dict[str, Any]] = []
+    wise_sandbox.webhook_handler_list.append(webhook_list.append)
+    await (await (await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)).personal_profile.get_cash_account_async(Currency.NZD))._simulate_top_up_async(Decimal("100"))
+
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY, is_lazy=True)
+    number_of_dropped_balance_updates: int = WiseWebhook.number_of_dropped_balance_updates
+    assert not WiseWebhook.apply_balance_update([w for w in webhook_list if w["event_type"] == "balances#update"][0], wise_account)
+    assert WiseWebhook.number_of_dropped_balance_updates == number_of_dropped_balance_updates + 1
+
+
+@pytest.mark.asyncio
+async def test_delayed_balance_webhook_after_transfer(wise_sandbox: WiseSandbox) -> None:
+    webhook_list: List[Dict[str, Any]] = []
+    wise_sandbox.webhook_handler_list.append(webhook_list.append)
+    await (await (await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)).personal_profile.get_cash_account_async(Currency.NZD))._simulate_top_up_async(Decimal("100"))
+    now: datetime.datetime = datetime.datetime.now(datetime.timezone.utc)
+    delayed_update_webhook: Dict[str, Any] = copy.deepcopy([w for w in webhook_list if w["event_type"] == "balances#update"][0])
+    delayed_update_webhook["data"]["occurred_at"] = (now - datetime.timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    for balance in wise_sandbox.balance_dict.values():
+        for transaction_data in balance.transaction_list:
+            transaction_data["date"] = f"{(now - datetime.timedelta(minutes=10)).replace(tzinfo=None).isoformat(timespec='milliseconds')}Z"
+
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    nzd_account: CashAccount = await wise_account.personal_profile.get_cash_account_async(Currency.NZD)
+    reserve_account: ReserveAccount = await wise_account.personal_profile.get_reserve_account_async("Savings", Currency.NZD, True)
+
+    transfer: Transfer = await nzd_account.transfer(reserve_account, Decimal("25"))
+    assert nzd_account.balance == Decimal("75")
+    assert transfer.creation_timestamp is not None and nzd_account.balance_timestamp == transfer.creation_timestamp
+    assert not WiseWebhook.apply_balance_update(delayed_update_webhook, wise_account)
+    assert nzd_account.balance == Decimal("75")
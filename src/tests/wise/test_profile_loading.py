@@ -0,0 +1,49 @@
+import asyncio
+from _decimal import Decimal
+from typing import Any, Dict, List
+
+import pytest
+
+from sirius.common import Currency
+from sirius.exceptions import SDKClientException
+from sirius.wise import WiseAccount, CashAccount, Profile, WiseAccountType
+from sirius.wise.sandbox import WiseSandbox
+
+
+@pytest.mark.asyncio
+async def test_lazy_load(wise_sandbox: WiseSandbox) -> None:
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY, is_lazy=True)
+    profile: Profile = wise_account.personal_profile
+    assert profile.is_partially_loaded
+
+    with pytest.raises(SDKClientException):
+        _ = profile.cash_account_list
+
+    await profile.load_async(["cash_account_list"])
+    assert len(profile.cash_account_list) > 0
+    assert profile.is_partially_loaded
+
+    recipient_list: List[Any] = await asyncio.to_thread(lambda: profile.recipient_list)
+    assert recipient_list is profile.recipient_list
+
+
+@pytest.mark.asyncio
+async def test_snapshot_refresh(wise_sandbox: WiseSandbox) -> None:
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    snapshot_data: Dict[str, Any] = wise_account.get_snapshot_data()
+    restored_wise_account: WiseAccount = WiseAccount.from_snapshot_data(WiseAccountType.PRIMARY, snapshot_data, "sandbox")
+    assert restored_wise_account.get_snapshot_data() == snapshot_data
+
+    profile: Profile = restored_wise_account.personal_profile
+    nzd_account: CashAccount = profile.get_cash_account(Currency.NZD)
+    cash_account_list: List[CashAccount] = profile.cash_account_list
+    cash_account_by_currency_dict: Dict[Currency, CashAccount] = profile._cash_account_by_currency_dict
+
+    wise_sandbox.balance_dict[nzd_account.id].amount = nzd_account.balance + Decimal("100")
+    await restored_wise_account._initialize_async()
+
+    assert profile.cash_account_list is not cash_account_list
+    assert profile._cash_account_by_currency_dict is not cash_account_by_currency_dict
+    assert cash_account_list == profile.cash_account_list
+    assert profile.get_cash_account(Currency.NZD) is nzd_account
+    assert nzd_account.balance == wise_sandbox.balance_dict[nzd_account.id].amount
@@ -0,0 +1,48 @@
+import datetime
+from _decimal import Decimal
+
+import pytest
+
+from sirius.common import Currency
+from sirius.wise import WiseAccount, CashAccount, Quote, QuoteCache, Profile, WiseAccountType
+from sirius.wise.sandbox import WiseSandbox
+
+
+def get_number_of_requests(wise_sandbox: WiseSandbox, method: str, path_suffix: str) -> int:
+    return len([request for request in wise_sandbox.request_list if request[0] == method and request[1].endswith(path_suffix)])
+
+
+@pytest.mark.asyncio
+async def test_quote_cache_hits_and_expiry(wise_sandbox: WiseSandbox) -> None:
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    profile: Profile = wise_account.personal_profile
+    nzd_account: CashAccount = await profile.get_cash_account_async(Currency.NZD)
+    usd_account: CashAccount = await profile.get_cash_account_async(Currency.USD)
+
+    quote: Quote = await Quote.get_quote_async(profile, nzd_account, usd_account, Decimal("100"))
+    assert await Quote.get_quote_async(profile, nzd_account, usd_account, Decimal("100.001")) is quote
+    assert get_number_of_requests(wise_sandbox, "POST", "/quotes") == 1
+
+    assert profile.quote_cache.take_quote(Currency.NZD, Currency.USD, Decimal("100"), False) is quote
+    assert profile.quote_cache.get_quote(Currency.NZD, Currency.USD, Decimal("100"), False) is None
+
+    quote.expiration_time = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=1)
+    profile.quote_cache._quote_dict[QuoteCache._get_quote_key(Currency.NZD, Currency.USD, Decimal("100"), False)] = quote
+    assert await Quote.get_quote_async(profile, nzd_account, usd_account, Decimal("100")) is not quote
+    assert get_number_of_requests(wise_sandbox, "POST", "/quotes") == 2
+
+
+@pytest.mark.asyncio
+async def test_exchange_rate_cache_hits_and_expiry(wise_sandbox: WiseSandbox) -> None:
+    wise_sandbox.set_exchange_rate(Currency.NZD, Currency.USD, Decimal("0.6"))
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    profile: Profile = wise_account.personal_profile
+
+    assert await profile.get_exchange_rate_async(Currency.NZD, Currency.USD) == Decimal("0.6")
+    assert await profile.get_exchange_rate_async(Currency.NZD, Currency.USD) == Decimal("0.6")
+    assert get_number_of_requests(wise_sandbox, "GET", "/v1/rates") == 1
+
+    wise_sandbox.set_exchange_rate(Currency.NZD, Currency.USD, Decimal("0.7"))
+    profile.quote_cache.put_exchange_rate(Currency.NZD, Currency.USD, Decimal("0.6"), datetime.datetime.now(datetime.timezone.utc))
+    assert await profile.get_exchange_rate_async(Currency.NZD, Currency.USD) == Decimal("0.7")
+    assert get_number_of_requests(wise_sandbox, "GET", "/v1/rates") == 2
@@ -0,0 +1,81 @@
+import asyncio
+import datetime
+from _decimal import Decimal
+from typing import List, Dict, Any, cast
+
+import pytest
+
+from sirius.common import Currency
+from sirius.exceptions import SDKClientException
+from sirius.http_requests.exceptions import ClientSideException
+from sirius.wise import WiseAccount, CashAccount, ReserveAccount, Recipient, Transaction, TransactionType, WiseAccountType, BatchTransfer, \
+    BatchTransferItem, Transfer, TransferStatus, TransferStatusTracker, WiseAccountRegistry, Account
+from sirius.wise.exceptions import WiseAccountNotFoundException
+from sirius.wise.sandbox import WiseSandbox
+
+
+@pytest.mark.asyncio
+async def test_sandbox_transfers(wise_sandbox: WiseSandbox) -> None:
+    webhook_list: List[Dict[str, Any]] = []
+    wise_sandbox.webhook_handler_list.append(webhook_list.append)
+    wise_sandbox.set_exchange_rate(Currency.NZD, Currency.USD, Decimal("0.6"))
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    nzd_account: CashAccount = await wise_account.personal_profile.get_cash_account_async(Currency.NZD)
+    usd_account: CashAccount = await wise_account.personal_profile.get_cash_account_async(Currency.USD)
+    reserve_account: ReserveAccount = await wise_account.personal_profile.get_reserve_account_async("Savings", Currency.NZD, True)
+    recipient: Recipient = wise_account.personal_profile.get_recipient("12345678901234")
+
+    await nzd_account._simulate_top_up_async(Decimal("1000"))
+    await nzd_account.transfer(usd_account, Decimal("100"), is_amount_in_from_currency=True)
+    await nzd_account.transfer(reserve_account, Decimal("25"))
+    await nzd_account.transfer(recipient, Decimal("50"), "Rent", is_amount_in_from_currency=True)
+
+    assert nzd_account.balance == Decimal("825")
+    assert usd_account.balance == Decimal("60")
+    assert reserve_account.balance == Decimal("25")
+    assert {webhook["event_type"] for webhook in webhook_list} == {"balances#update", "balances#credit", "transfers#state-change"}
+
+    transaction_list: List[Transaction] = await nzd_account.get_transactions_async(datetime.datetime.now() - datetime.timedelta(days=1))
+    assert [t.type for t in transaction_list] == [TransactionType.TRANSFER, TransactionType.CONVERSION, TransactionType.CONVERSION, TransactionType.DEPOSIT]
+    assert transaction_list[0].third_party == recipient
+
+    with pytest.raises(ClientSideException):
+        await nzd_account.transfer(usd_account, Decimal("10000"), is_amount_in_from_currency=True)
+
+
+@pytest.mark.asyncio
+async def test_transfer_status_tracker(wise_sandbox: WiseSandbox) -> None:
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    nzd_account: CashAccount = await wise_account.personal_profile.get_cash_account_async(Currency.NZD)
+    recipient: Recipient = wise_account.personal_profile.get_recipient("12345678901234")
+    await nzd_account._simulate_top_up_async(Decimal("1000"))
+
+    batch_transfer: BatchTransfer = await BatchTransfer.execute_async(nzd_account, [BatchTransferItem(to_account=recipient, amount=Decimal("10")) for _ in range(20)])
+    transfer_id_list: List[int] = [cast(Transfer, item.transfer).id for item in batch_transfer.successful_item_list]
+    assert all(wise_sandbox.transfer_dict[transfer_id].status == TransferStatus.OUTGOING_PAYMENT_SENT.value for transfer_id in transfer_id_list)
+
+    for transfer_id in transfer_id_list:
+        wise_sandbox.transfer_dict[transfer_id].status = TransferStatus.PROCESSING.value
+
+    transfer_status_tracker: TransferStatusTracker = TransferStatusTracker(profile=wise_account.personal_profile)
+    future: asyncio.Future[str] = transfer_status_tracker.track(transfer_id_list[0])
+    assert await transfer_status_tracker.complete_all_async() == {transfer_id: TransferStatus.OUTGOING_PAYMENT_SENT.value for transfer_id in transfer_id_list}
+    assert await future == TransferStatus.OUTGOING_PAYMENT_SENT.value
+
+
+@pytest.mark.asyncio
+async def test_wise_account_registry(wise_sandbox: WiseSandbox) -> None:
+    wise_account_registry: WiseAccountRegistry = WiseAccountRegistry()
+    await wise_account_registry.register_all_async({f"Client {i}": f"sandbox-{i}" for i in range(5)})
+    account_list_dict: Dict[str, List[Account]] = await wise_account_registry.get_account_list_dict_async()
+
+    assert list(account_list_dict.keys()) == wise_account_registry.name_list
+    assert all(len(account_list) == 8 for account_list in account_list_dict.values())
+    assert wise_account_registry.get("Client 0").http_session is not wise_account_registry.get("Client 1").http_session
+
+    wise_account_registry.unregister("Client 0")
+    with pytest.raises(WiseAccountNotFoundException):
+        wise_account_registry.get("Client 0")
+
+    with pytest.raises(SDKClientException):
+        await WiseAccount.get_async(WiseAccountType.REGISTERED)
@@ -0,0 +1,61 @@
+import json
+import os
+import time
+from _decimal import Decimal
+from typing import List, Callable
+
+import pytest
+
+from sirius.common import Currency
+from sirius.wise import StatementDecoder, Transaction, TransactionType, CashAccount, Profile
+
+
+def get_cash_account() -> CashAccount:
+    profile: Profile = Profile.model_construct(id=1, type="personal", cash_account_list=[], reserve_account_list=[], recipient_list=[])
+    return CashAccount.model_construct(id=1, name=None, currency=Currency.NZD, balance=Decimal("0"), profile=profile)
+
+
+def get_validated_transaction_list(cash_account: CashAccount, content: bytes) -> List[Transaction]:
+    return [Transaction(
+        id=int(data["referenceNumber"].replace("TRANSFER-", "")) if data["referenceNumber"].startswith("TRANSFER-") else None,
+        reference_number=data["referenceNumber"],
+        account=cash_account,
+        timestamp=data["date"],
+        type=TransactionType(data["details"]["type"]),
+        description=data["details"]["description"],
+        amount=Decimal(str(data["amount"]["value"])),
+        third_party=data["details"]["description"]
+    ) for data in json.loads(content)["transactions"]]
+
+
+def test_statement_decoder(get_statement_content: Callable[[int], bytes]) -> None:
+    cash_account: CashAccount = get_cash_account()
+    content: bytes = get_statement_content(50_000)
+
+    transaction_list: List[Transaction] = StatementDecoder(cash_account).decode_list(StatementDecoder.load(content))
+    validated_transaction_list: List[Transaction] = get_validated_transaction_list(cash_account, content)
+
+    assert len(transaction_list) == len(validated_transaction_list) == 50_000
+    assert all(t.amount == Decimal("-12.34") for t in transaction_list)
+    assert [t.timestamp for t in transaction_list] == [t.timestamp for t in validated_transaction_list]
+    assert transaction_list[0].type == TransactionType.TRANSFER and transaction_list[0].id == 0
+    assert transaction_list[1].third_party == "Merchant | NZ"
+
+
+@pytest.mark.skipif(os.getenv("SIRIUS_BENCHMARK") is None, reason="Benchmarks only run when SIRIUS_BENCHMARK is set")
+def test_statement_decoder_benchmark(get_statement_content: Callable[[int], bytes]) -> None:
+    cash_account: CashAccount = get_cash_account()
+    content: bytes = get_statement_content(200_000)
+
+    start_time: float = time.perf_counter()
+    transaction_list: List[Transaction] = StatementDecoder(cash_account).decode_list(StatementDecoder.load(content))
+    decoder_seconds: float = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    validated_transaction_list: List[Transaction] = get_validated_transaction_list(cash_account, content)
+    validated_seconds: float = time.perf_counter() - start_time
+
+    print(f"\nStatement decoder: {len(transaction_list) / decoder_seconds:,.0f} rows/s\n"
+          f"Validated Transaction: {len(validated_transaction_list) / validated_seconds:,.0f} rows/s\n"
+          f"Speed-up: {validated_seconds / decoder_seconds:.1f}x")
+    assert len(transaction_list) == len(validated_transaction_list)
@@ -0,0 +1,67 @@
+from _decimal import Decimal
+from typing import List, Dict, Any, cast
+
+import pytest
+
+from sirius import database
+from sirius.common import Currency
+from sirius.database import StorageEngine, InMemoryStorageEngine
+from sirius.wise import WiseAccount, CashAccount, Recipient, Transaction, TransactionStore, AccountDebit, WiseAccountType
+from sirius.wise.sandbox import WiseSandbox
+
+
+@pytest.mark.asyncio
+async def test_transaction_store_incremental_sync(wise_sandbox: WiseSandbox) -> None:
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    nzd_account: CashAccount = await wise_account.personal_profile.get_cash_account_async(Currency.NZD)
+    transaction_store: TransactionStore = nzd_account.transaction_store
+    for _ in range(3):
+        await nzd_account._simulate_top_up_async(Decimal("100"))
+
+    transaction_list: List[Transaction] = await transaction_store.sync_async()
+    assert len(transaction_list) == 3
+    assert transaction_store.last_synced_timestamp == max(t.timestamp for t in transaction_list)
+    assert await transaction_store.sync_async() == []
+
+    await nzd_account._simulate_top_up_async(Decimal("50"))
+    transaction_list = await transaction_store.sync_async()
+    assert [t.amount for t in transaction_list] == [Decimal("50")]
+    assert transaction_store.last_synced_timestamp == transaction_list[0].timestamp
+    assert len(transaction_store.transaction_list) == 4
+
+
+@pytest.mark.asyncio
+async def test_account_debit_syncs_only_the_source_balance(wise_sandbox: WiseSandbox) -> None:
+    webhook_list: List[Dict[str, Any]] = []
+    wise_sandbox.webhook_handler_list.append(webhook_list.append)
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    nzd_account: CashAccount = await wise_account.personal_profile.get_cash_account_async(Currency.NZD)
+    recipient: Recipient = wise_account.personal_profile.get_recipient("12345678901234")
+    await nzd_account._simulate_top_up_async(Decimal("100"))
+    await nzd_account.transfer(recipient, Decimal("10"), "Rent", is_amount_in_from_currency=True)
+
+    wise_account = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    account_debit: AccountDebit = await AccountDebit.get_from_request_data_async([w for w in webhook_list if w["event_type"] == "transfers#state-change"][-1], wise_account)
+    assert account_debit.transaction is not None and account_debit.transaction.id == account_debit.wise_id
+    assert [c.currency for c in wise_account.personal_profile.cash_account_list if c.transaction_store.last_synced_timestamp is not None] == [Currency.NZD]
+
+
+@pytest.mark.asyncio
+async def test_transaction_store_keeps_transactions_without_reference_number(wise_sandbox: WiseSandbox) -> None:
+    original_storage_engine: StorageEngine | None = database.storage_engine
+    await database.set_storage_engine(InMemoryStorageEngine())
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    nzd_account: CashAccount = await wise_account.personal_profile.get_cash_account_async(Currency.NZD)
+    transaction_store: TransactionStore = TransactionStore(account=nzd_account, is_persistent=True)
+    for _ in range(2):
+        await nzd_account._simulate_top_up_async(Decimal("100"))
+    for transaction_data in wise_sandbox.balance_dict[nzd_account.id].transaction_list:
+        transaction_data.pop("referenceNumber")
+
+    try:
+        assert len(await transaction_store.sync_async()) == 2
+        assert await transaction_store.sync_async() == []
+        assert len(transaction_store.transaction_list) == 2
+        assert all(t.reference_number is None for t in transaction_store.transaction_list)
+    finally:
+        await database.set_storage_engine(cast(StorageEngine, original_storage_engine))
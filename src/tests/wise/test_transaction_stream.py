@@ -0,0 +1,64 @@
+import datetime
+from _decimal import Decimal
+from typing import List
+
+import pytest
+
+from sirius.common import Currency
+from sirius.wise import WiseAccount, CashAccount, Transaction, WiseAccountType
+from sirius.wise.sandbox import WiseSandbox, WiseSandboxBalance
+
+
+async def get_nzd_account_with_past_transactions(wise_sandbox: WiseSandbox, timestamp_list: List[datetime.datetime]) -> CashAccount:
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    nzd_account: CashAccount = await wise_account.personal_profile.get_cash_account_async(Currency.NZD)
+    for _ in timestamp_list:
+        await nzd_account._simulate_top_up_async(Decimal("10"))
+
+    balance: WiseSandboxBalance = wise_sandbox.balance_dict[nzd_account.id]
+    for transaction_data, timestamp in zip(balance.transaction_list, sorted(timestamp_list)):
+        transaction_data["date"] = f"{timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None).isoformat(timespec='milliseconds')}Z"
+
+    return nzd_account
+
+
+@pytest.mark.asyncio
+async def test_transaction_stream_across_chunks(wise_sandbox: WiseSandbox) -> None:
+    to_time: datetime.datetime = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+    from_time: datetime.datetime = to_time - datetime.timedelta(days=28)
+    timestamp_list: List[datetime.datetime] = [from_time + datetime.timedelta(days=days) for days in [1, 7, 10, 14, 27]]
+    nzd_account: CashAccount = await get_nzd_account_with_past_transactions(wise_sandbox, timestamp_list)
+
+    transaction_list: List[Transaction] = [t async for t in nzd_account.get_transaction_stream(from_time, to_time, datetime.timedelta(days=7), 2)]
+    assert [t.timestamp for t in transaction_list] == timestamp_list
+    assert len({t.reference_number for t in transaction_list}) == len(timestamp_list)
+
+    transaction_list = []
+    async for transaction in nzd_account.get_transaction_stream(from_time, to_time, datetime.timedelta(days=7), 2):
+        transaction_list.append(transaction)
+        break
+    assert len(transaction_list) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_transactions_defaults_to_past_24_hours(wise_sandbox: WiseSandbox) -> None:
+    now: datetime.datetime = datetime.datetime.now(datetime.timezone.utc)
+    nzd_account: CashAccount = await get_nzd_account_with_past_transactions(wise_sandbox, [now - datetime.timedelta(days=3), now - datetime.timedelta(hours=1)])
+
+    transaction_list: List[Transaction] = await nzd_account.get_transactions_async()
+    assert len(transaction_list) == 1
+    assert len(await nzd_account.get_transactions_async(number_of_past_hours=24 * 4)) == 2
+
+
+@pytest.mark.asyncio
+async def test_transaction_stream_keeps_transactions_without_reference_number(wise_sandbox: WiseSandbox) -> None:
+    to_time: datetime.datetime = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+    from_time: datetime.datetime = to_time - datetime.timedelta(days=14)
+    timestamp_list: List[datetime.datetime] = [from_time + datetime.timedelta(days=days) for days in [1, 2, 8, 9]]
+    nzd_account: CashAccount = await get_nzd_account_with_past_transactions(wise_sandbox, timestamp_list)
+    for transaction_data in wise_sandbox.balance_dict[nzd_account.id].transaction_list:
+        transaction_data["referenceNumber"] = None
+
+    transaction_list: List[Transaction] = [t async for t in nzd_account.get_transaction_stream(from_time, to_time, datetime.timedelta(days=7))]
+    assert [t.timestamp for t in transaction_list] == timestamp_list
+    assert all(t.reference_number is None for t in transaction_list)
@@ -0,0 +1,63 @@
+import asyncio
+from _decimal import Decimal
+from typing import List, Dict, Any
+
+import pytest
+
+from sirius.common import Currency
+from sirius.exceptions import SDKClientException
+from sirius.wise import WiseAccount, CashAccount, AccountDebit, AccountCredit, WiseAccountType
+from sirius.wise.sandbox import WiseSandbox
+from sirius.wise.webhook import WiseWebhookProcessor, WiseWebhookEvent
+
+
+@pytest.mark.asyncio
+async def test_webhook_processor_deduplication_and_ordering(wise_sandbox: WiseSandbox) -> None:
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    nzd_account: CashAccount = await wise_account.personal_profile.get_cash_account_async(Currency.NZD)
+    event_list: List[WiseWebhookEvent] = []
+
+    async def handler(balance_update_object: AccountDebit | AccountCredit | None, event: WiseWebhookEvent) -> None:
+        event_list.append(event)
+
+    webhook_processor: WiseWebhookProcessor = WiseWebhookProcessor(wise_account, handler)
+    webhook_list: List[Dict[str, Any]] = []
+    wise_sandbox.webhook_handler_list.extend([webhook_list.append, webhook_processor.ingest])
+    for _ in range(10):
+        await nzd_account._simulate_top_up_async(Decimal("10"))
+
+    await webhook_processor.flush()
+    update_event_list: List[WiseWebhookEvent] = [e for e in event_list if e.request_data["event_type"] == "balances#update"]
+    assert webhook_processor.metrics.number_of_events_processed == len(webhook_list) == 20
+    assert webhook_processor.metrics.number_of_duplicate_events == 0
+    assert [e.request_data["data"]["post_transaction_balance_amount"] for e in update_event_list] == [float(10 * i) for i in range(1, 11)]
+    assert nzd_account.balance == Decimal("100")
+
+    assert not any(webhook_processor.ingest(webhook) for webhook in webhook_list)
+    assert webhook_processor.ingest(webhook_list[0], "delivery-1")
+    assert not webhook_processor.ingest(webhook_list[1], "delivery-1")
+    await webhook_processor.close()
+
+
+@pytest.mark.asyncio
+async def test_webhook_processor_requires_running_event_loop(wise_sandbox: WiseSandbox) -> None:
+    wise_account: WiseAccount = await wise_sandbox.get_wise_account_async(WiseAccountType.PRIMARY)
+    webhook_processor: WiseWebhookProcessor = WiseWebhookProcessor(wise_account)
+    webhook_list: List[Dict[str, Any]] = []
+    wise_sandbox.webhook_handler_list.append(webhook_list.append)
+    await (await wise_account.personal_profile.get_cash_account_async(Currency.NZD))._simulate_top_up_async(Decimal("10"))
+
+    with pytest.raises(SDKClientException):
+        await asyncio.to_thread(webhook_processor.ingest, webhook_list[0])
+    assert webhook_processor.ingest(webhook_list[0])
+    await webhook_processor.flush()
+
+    for worker in webhook_processor._worker_list:
+        if worker is not None:
+            worker.cancel()
+    await asyncio.sleep(0)
+
+    assert webhook_processor.ingest(webhook_list[1])
+    await asyncio.wait_for(webhook_processor.flush(), 5)
+    assert webhook_processor.metrics.number_of_events_processed == 2
+    await webhook_processor.close()